@@ -0,0 +1,14 @@
+""" Benchmarks for `pydantic_partials`, these are not part of the unit tests.
+
+    Run a benchmark module from the root of the repository, ie:
+
+    ```shell
+    python -m benchmarks.bench_class_creation
+    ```
+
+    Or run the whole suite, saving the results to compare with later (see `benchmarks.suite`):
+
+    ```shell
+    python -m benchmarks.suite --output results.json
+    ```
+"""
@@ -0,0 +1,31 @@
+import timeit
+from typing import Any, Callable
+
+from pydantic import BaseModel, create_model
+
+
+def best_time(func: Callable[[], Any], *, number: int, repeat: int = 5) -> float:
+    """ Returns the best time (in seconds) out of `repeat` runs, for a single call of `func`. """
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def auto_time(func: Callable[[], Any], *, min_time: float = 0.05, repeat: int = 5) -> float:
+    """ Like `best_time`, but picks the number of calls per run so each run takes at least `min_time` seconds. """
+    func()  # Warm up, ie: lazily built validators.
+    once = timeit.timeit(func, number=1)
+    return best_time(func, number=max(1, int(min_time / max(once, 1e-9))), repeat=repeat)
+
+
+def make_model(name: str, base: type[BaseModel], field_count: int, **kwargs) -> type[BaseModel]:
+    """ Creates a model with `field_count` required fields (`f0`, `f1`, ...), alternating between `int` and `str`.
+        Any `kwargs` are passed as class arguments (ie: config options).
+    """
+    fields: dict[str, Any] = {f'f{i}': (int if i % 2 == 0 else str, ...) for i in range(field_count)}
+    return create_model(name, __base__=base, __cls_kwargs__=kwargs, **fields)
+
+
+def report(title: str, rows: list[tuple[str, float]], *, unit: str = 'us') -> None:
+    scale = {'s': 1, 'ms': 1_000, 'us': 1_000_000}[unit]
+    print(title)
+    for label, seconds in rows:
+        print(f'    {label:<40} {seconds * scale:>12.2f} {unit}')
@@ -0,0 +1,36 @@
+""" Applying a sparse patch onto a full model via `apply_to`, vs the
+    `target.model_copy(update=patch.model_dump(exclude_unset=True))` idiom.
+"""
+from pydantic import BaseModel
+
+from pydantic_partials import AutoPartialModel, partial_of
+
+from ._util import best_time, make_model, report
+
+
+def main():
+    for field_count in (50, 200):
+        model = make_model('Model', BaseModel, field_count)
+        patch_model = partial_of(model)
+        target = model(**{f'f{i}': (i if i % 2 == 0 else str(i)) for i in range(field_count)})
+        patch = patch_model(f0=100, f1='new', f4=200)
+        patches = [patch] * 1_000
+        targets = [target] * 1_000
+
+        report(f'Applying a 3 field patch, {field_count} fields:', [
+            ('model_copy(update=model_dump(...))', best_time(
+                lambda: target.model_copy(update=patch.model_dump(exclude_unset=True)), number=5_000
+            )),
+            ('apply_to(copy=True)', best_time(lambda: patch.apply_to(target, copy=True), number=5_000)),
+            ('apply_to (in-place)', best_time(lambda: patch.apply_to(target), number=5_000)),
+            ('apply_to(copy=True, validate=True)', best_time(
+                lambda: patch.apply_to(target, copy=True, validate=True), number=5_000
+            )),
+            ('apply_many(copy=True), per patch', best_time(
+                lambda: AutoPartialModel.apply_many(patches, targets, copy=True), number=20
+            ) / len(patches)),
+        ])
+
+
+if __name__ == '__main__':
+    main()
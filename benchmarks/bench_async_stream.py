@@ -0,0 +1,75 @@
+""" Validating a large JSON array request body on an event loop via `model_validate_json_stream`,
+    vs validating the whole body at once with a `TypeAdapter`; showing throughput and the longest time
+    the event loop was blocked for (measured by a task that wakes up every millisecond).
+"""
+import asyncio
+import json
+import time
+from typing import AsyncIterator, Awaitable, Callable
+
+from pydantic import TypeAdapter
+
+from pydantic_partials import AutoPartialModel
+
+from ._util import make_model
+
+ITEM_COUNT = 20_000
+CHUNK_SIZE = 64 * 1024
+
+
+async def body_chunks(body: bytes) -> AsyncIterator[bytes]:
+    """ Yields the body in chunks, like an ASGI server would (without waiting for the network). """
+    for i in range(0, len(body), CHUNK_SIZE):
+        yield body[i:i + CHUNK_SIZE]
+
+
+async def measure(validate: Callable[[], Awaitable[int]]) -> tuple[float, float, int]:
+    """ Returns the time taken by `validate`, the longest event loop delay seen meanwhile and its result. """
+    longest = 0.0
+    done = False
+
+    async def ticker():
+        nonlocal longest
+        while not done:
+            before = time.perf_counter()
+            await asyncio.sleep(0.001)
+            longest = max(longest, time.perf_counter() - before - 0.001)
+
+    task = asyncio.create_task(ticker())
+    await asyncio.sleep(0)
+    start = time.perf_counter()
+    count = await validate()
+    elapsed = time.perf_counter() - start
+    done = True
+    await task
+    return elapsed, longest, count
+
+
+def main():
+    model = make_model('Model', AutoPartialModel, 20)
+    items = [{'f0': n, 'f1': f'name-{n}', 'f6': n, 'f9': 'x' * 100} for n in range(ITEM_COUNT)]
+    body = json.dumps(items).encode()
+    adapter = TypeAdapter(list[model])  # type: ignore[valid-type]
+
+    async def whole_body() -> int:
+        chunks = [chunk async for chunk in body_chunks(body)]
+        return len(adapter.validate_json(b''.join(chunks)))
+
+    def streamed(**kwargs) -> Callable[[], Awaitable[int]]:
+        async def validate() -> int:
+            return len([obj async for obj in model.model_validate_json_stream(body_chunks(body), **kwargs)])
+        return validate
+
+    print(f'Validating a JSON array body of {ITEM_COUNT} items ({len(body) / 1024 / 1024:.1f} MiB), 20 fields:')
+    for label, validate in [
+        ('whole body, TypeAdapter.validate_json', whole_body),
+        ('model_validate_json_stream', streamed()),
+        ('model_validate_json_stream, all offloaded', streamed(offload_size=0)),
+    ]:
+        elapsed, longest, count = min(asyncio.run(measure(validate)) for _ in range(3))
+        assert count == ITEM_COUNT
+        print(f'    {label:<45} {elapsed * 1000:>8.1f} ms   longest loop delay {longest * 1000:>6.2f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,23 @@
+""" Compares the cost of creating `AutoPartialModel` subclasses with creating a plain `BaseModel` of the same shape.
+
+    Partial models used to build their core schema twice (once by Pydantic and once more after adding
+    the partial changes to the fields), they now only build it once; so their creation cost should be
+    close to the plain `BaseModel` one.
+"""
+from pydantic import BaseModel
+
+from pydantic_partials import AutoPartialModel
+
+from ._util import best_time, make_model, report
+
+
+def main():
+    for field_count in (10, 50, 200):
+        rows = []
+        for label, base in (('BaseModel', BaseModel), ('AutoPartialModel', AutoPartialModel)):
+            rows.append((label, best_time(lambda: make_model('Model', base, field_count), number=20)))
+        report(f'Class creation, {field_count} fields:', rows, unit='ms')
+
+
+if __name__ == '__main__':
+    main()
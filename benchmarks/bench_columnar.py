@@ -0,0 +1,58 @@
+""" Turning a batch of partial models into columns: walking each instance (via `model_dump`) vs `to_columns`
+    (reading a field of every instance at once, with a presence bitmap for `Missing`); and back again.
+"""
+import time
+
+from pydantic_partials import AutoPartialModel, Missing
+from pydantic_partials.columnar import from_columns, to_columns
+
+from ._util import make_model
+
+ITEM_COUNT = 20_000
+FIELD_COUNT = 20
+
+
+def columns_per_instance(cls: type, items: list) -> dict[str, tuple[list, list]]:
+    dumps = [item.model_dump() for item in items]
+    return {
+        name: ([values.get(name) for values in dumps], [name in values for values in dumps])
+        for name in cls.model_fields  # type: ignore[attr-defined]
+    }
+
+
+def instances_per_row(cls: type, columns: dict[str, tuple[list, list]]) -> list:
+    items = []
+    for i in range(ITEM_COUNT):
+        items.append(cls.model_construct(**{  # type: ignore[attr-defined]
+            name: values[i] for name, (values, present) in columns.items() if present[i]
+        }))
+    return items
+
+
+def timed(label: str, function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    print(f'    {label:<40} {(time.perf_counter() - start) * 1000:>8.1f} ms')
+    return result
+
+
+def main():
+    model = make_model('Model', AutoPartialModel, FIELD_COUNT)
+    # A third of the fields of each item are `Missing`.
+    items = [
+        model(**{f'f{i}': n if i % 2 == 0 else 'a' for i in range(FIELD_COUNT) if (n + i) % 3})
+        for n in range(ITEM_COUNT)
+    ]
+
+    print(f'Exporting {ITEM_COUNT} items with {FIELD_COUNT} fields to columns:')
+    timed('model_dump per instance', columns_per_instance, model, items)
+    columns = timed('to_columns', to_columns, model, items)
+
+    print(f'Importing {ITEM_COUNT} items with {FIELD_COUNT} fields from columns:')
+    timed('model_construct per row', instances_per_row, model, columns_per_instance(model, items))
+    restored = timed('from_columns', from_columns, model, columns)
+    assert restored[0].f0 is Missing and restored[0].model_dump() == items[0].model_dump()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,26 @@
+""" Rehydrating already validated patches via `model_construct_trusted`/`model_construct_many`,
+    vs `model_construct` and `model_validate`.
+"""
+from pydantic_partials import AutoPartialModel
+
+from ._util import best_time, make_model, report
+
+
+def main():
+    for field_count in (50, 200):
+        model = make_model('Model', AutoPartialModel, field_count)
+        values = {'f0': 1, 'f1': 'a', 'f4': 2, 'f5': 'b'}
+        items = [values] * 1_000
+
+        report(f'Construct a 4 field patch, {field_count} fields:', [
+            ('model_validate', best_time(lambda: model.model_validate(values), number=2_000)),
+            ('model_construct', best_time(lambda: model.model_construct(**values), number=2_000)),
+            ('model_construct_trusted', best_time(lambda: model.model_construct_trusted(values), number=2_000)),
+            ('model_construct_many, per item', best_time(
+                lambda: model.model_construct_many(items), number=5
+            ) / len(items)),
+        ])
+
+
+if __name__ == '__main__':
+    main()
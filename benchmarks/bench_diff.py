@@ -0,0 +1,31 @@
+""" Building a partial of the changed fields via `from_diff`, vs dumping both models and comparing the dicts. """
+from pydantic import BaseModel
+
+from pydantic_partials import partial_of
+
+from ._util import best_time, make_model, report
+
+
+def main():
+    for field_count in (50, 200):
+        model = make_model('Model', BaseModel, field_count)
+        partial_model = partial_of(model)
+        old = model(**{f'f{i}': (i if i % 2 == 0 else str(i)) for i in range(field_count)})
+        new = old.model_copy(update={'f0': 100, 'f1': 'new'})
+
+        def dump_and_compare():
+            old_values, new_values = old.model_dump(), new.model_dump()
+            return partial_model(**{k: v for k, v in new_values.items() if old_values[k] != v})
+
+        olds, news = [old] * 1_000, [new] * 1_000
+        report(f'Diff with 2 changed fields, {field_count} fields:', [
+            ('model_dump and compare dicts', best_time(dump_and_compare, number=2_000)),
+            ('from_diff', best_time(lambda: partial_model.from_diff(old, new), number=2_000)),
+            ('from_diff_many, per pair', best_time(
+                lambda: partial_model.from_diff_many(olds, news), number=5
+            ) / len(olds)),
+        ])
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,30 @@
+""" Cost of dirty tracking (`track_dirty`) on assignments, and writing back only the dirty fields of a wide model
+    via `model_dump_dirty` vs dumping the whole model.
+"""
+from pydantic_partials import AutoPartialModel
+
+from ._util import best_time, make_model, report
+
+
+def main():
+    field_count = 200
+    values = {f'f{i}': i if i % 2 == 0 else 'a' for i in range(field_count)}
+    untracked = make_model('Untracked', AutoPartialModel, field_count)(**values)
+    tracked = make_model('Tracked', AutoPartialModel, field_count, track_dirty=True)(**values)
+
+    report('Assign a field:', [
+        ('untracked', best_time(lambda: setattr(untracked, 'f0', 1), number=100_000)),
+        ('track_dirty, same value', best_time(lambda: setattr(tracked, 'f0', 0), number=100_000)),
+        ('track_dirty, changed value', best_time(lambda: setattr(tracked, 'f0', 1), number=100_000)),
+    ], unit='us')
+
+    for name in ('f2', 'f4'):
+        setattr(tracked, name, 1)
+    report(f'Write back 3 changed fields of {field_count}:', [
+        ('model_dump', best_time(lambda: tracked.model_dump(), number=2_000)),
+        ('model_dump_dirty', best_time(lambda: tracked.model_dump_dirty(), number=2_000)),
+    ])
+
+
+if __name__ == '__main__':
+    main()
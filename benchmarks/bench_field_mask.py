@@ -0,0 +1,37 @@
+""" Sparse responses with field masks: `model_dump_masked` (a serializer compiled once per mask),
+    vs passing the same projection as an `include` to `model_dump` on every call.
+"""
+from pydantic import create_model
+
+from pydantic_partials import AutoPartialModel
+from pydantic_partials.mask import parse_mask
+
+from ._util import best_time, make_model, report
+
+
+def main():
+    inner = make_model('Inner', AutoPartialModel, 20)
+    outer = create_model(
+        'Outer', __base__=AutoPartialModel, inner=(inner, ...), items=(list[inner], ...),  # type: ignore[valid-type]
+        **{f'f{i}': (int if i % 2 == 0 else str, ...) for i in range(50)},  # type: ignore[arg-type]
+    )
+    inner_values = {f'f{i}': i if i % 2 == 0 else 'a' for i in range(20)}
+    obj = outer(**{f'f{i}': i if i % 2 == 0 else 'a' for i in range(50)}, inner=inner_values, items=[inner_values] * 10)
+
+    mask = ','.join([
+        *(f'f{i}' for i in range(0, 50, 3)), *(f'inner.f{i}' for i in range(0, 20, 2)), 'items.f1', 'items.f2',
+    ])
+    include = {**parse_mask(mask), 'items': {'__all__': {'f1': True, 'f2': True}}}
+    assert obj.model_dump_masked(mask) == obj.model_dump(include=include)
+
+    report('Dump 17 of 52 fields, 10 of 20 nested fields and 2 fields of 10 list items:', [
+        ('model_dump (all fields)', best_time(lambda: obj.model_dump(), number=2_000)),
+        ('model_dump(include=...)', best_time(lambda: obj.model_dump(include=include), number=2_000)),
+        ('model_dump_masked', best_time(lambda: obj.model_dump_masked(mask), number=2_000)),
+        ('model_dump_json(include=...)', best_time(lambda: obj.model_dump_json(include=include), number=2_000)),
+        ('model_dump_json_masked', best_time(lambda: obj.model_dump_json_masked(mask), number=2_000)),
+    ])
+
+
+if __name__ == '__main__':
+    main()
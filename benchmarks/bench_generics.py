@@ -0,0 +1,52 @@
+""" Parametrizing generic models (ie: `Page[Item]`) for many item models: creating the parametrizations,
+    then using them again in passing after a garbage collection (Pydantic only caches them weakly, partial models
+    also keep the last ones in `parametrized_cache`); for a plain Pydantic generic model vs a partial one.
+"""
+import gc
+import time
+from typing import Generic, TypeVar
+
+from pydantic import BaseModel
+
+from pydantic_partials import AutoPartialModel
+from pydantic_partials.meta import parametrized_cache
+
+from ._util import make_model
+
+T = TypeVar('T')
+MODEL_COUNT = 300
+
+
+class Page(BaseModel, Generic[T]):
+    items: list[T]
+    total: int
+    cursor: str
+
+
+class PartialPage(AutoPartialModel, Generic[T]):
+    items: list[T]
+    total: int
+    cursor: str
+
+
+def parametrize(generic: type, models: list[type]) -> float:
+    start = time.perf_counter()
+    for model in models:
+        generic[model]  # type: ignore[index]
+    return time.perf_counter() - start
+
+
+def main():
+    models = [make_model(f'Item{i}', BaseModel, 5) for i in range(MODEL_COUNT)]
+
+    print(f'Parametrizing a generic model with {MODEL_COUNT} models:')
+    for label, generic in (('BaseModel', Page), ('AutoPartialModel', PartialPage)):
+        created = parametrize(generic, models)
+        gc.collect()
+        again = parametrize(generic, models)
+        print(f'    {label:<20} created {created * 1000:>8.1f} ms    again after gc {again * 1000:>8.1f} ms')
+    print(f'    {parametrized_cache.cache_info()}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+""" Import time of a module with many partial models, with and without `defer_build`.
+
+    Generates a module with 200 models of 20 fields each (in a temporary directory), then imports it
+    in a fresh interpreter; the time to use one of its models for the first time is measured too.
+    With `defer_build`, each model only builds its schema when first used.
+"""
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+MODEL_COUNT = 200
+FIELD_COUNT = 20
+
+TIMING_SCRIPT = '''
+import time
+import pydantic, pydantic_partials
+start = time.perf_counter()
+import {module} as models
+imported = time.perf_counter()
+models.Model0.model_validate({{'f0': 1}}).model_dump_json()
+used = time.perf_counter()
+print(imported - start, used - imported)
+'''
+
+
+def write_module(path: Path, base: str, defer_build: bool) -> None:
+    lines = [
+        'from pydantic import BaseModel, ConfigDict',
+        'from pydantic_partials import AutoPartialModel, Partial',
+        '',
+    ]
+    for m in range(MODEL_COUNT):
+        lines.append(f'class Model{m}({base}):')
+        lines.append(f'    model_config = ConfigDict(defer_build={defer_build})')
+        for i in range(FIELD_COUNT):
+            type_hint = 'int' if i % 2 == 0 else 'str'
+            if base == 'BaseModel':
+                type_hint = f'{type_hint} | None = None'
+            lines.append(f'    f{i}: {type_hint}')
+        lines.append('')
+    path.write_text('\n'.join(lines))
+
+
+def main():
+    repo_root = Path(__file__).parent.parent
+    print(f'Importing {MODEL_COUNT} models with {FIELD_COUNT} fields (best of 3):')
+    with tempfile.TemporaryDirectory() as directory:
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join([directory, str(repo_root)]))
+        for base in ('BaseModel', 'AutoPartialModel'):
+            for defer_build in (False, True):
+                module = f'models_{base.lower()}_{"deferred" if defer_build else "eager"}'
+                write_module(Path(directory) / f'{module}.py', base, defer_build)
+                results = []
+                for _ in range(3):
+                    output = subprocess.run(
+                        [sys.executable, '-c', TIMING_SCRIPT.format(module=module)],
+                        env=env, check=True, capture_output=True, text=True,
+                    ).stdout
+                    import_time, first_use = (float(v) for v in output.split())
+                    results.append((import_time, first_use))
+                import_time, first_use = min(results)
+                label = f'{base}, defer_build={defer_build}'
+                print(f'    {label:<40} import {import_time * 1000:>8.1f} ms   first use {first_use * 1000:>6.2f} ms')
+
+
+if __name__ == '__main__':
+    main()
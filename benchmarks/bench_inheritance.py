@@ -0,0 +1,41 @@
+""" Serialization cost of partial models with `exclude_if` checks of their own, by how deep they are subclassed.
+
+    Each partial field gets one `exclude_if` check combining the check for `Missing` with the field's own checks,
+    so it should cost the same no matter how many times the field was inherited.
+"""
+from typing import Annotated, Any
+
+from pydantic import Field
+
+from pydantic_partials import AutoPartialModel
+
+from ._util import best_time, report
+
+FIELD_COUNT = 20
+INSTANCE_COUNT = 10_000
+
+
+def exclude_negative(v: Any) -> bool:
+    return isinstance(v, int) and v < 0
+
+
+def main():
+    fields = {f'f{i}': Annotated[int, Field(exclude_if=exclude_negative)] for i in range(FIELD_COUNT)}
+    model: Any = type('Model0', (AutoPartialModel,), {'__annotations__': fields})
+    models = {0: model}
+    for depth in range(1, 11):
+        model = type(f'Model{depth}', (model,), {})
+        models[depth] = model
+
+    values = {f'f{i}': i for i in range(FIELD_COUNT // 2)}
+    rows = []
+    for depth in (0, 1, 5, 10):
+        objs = [models[depth](**values) for _ in range(INSTANCE_COUNT)]
+        rows.append((f'subclassed {depth} times: model_dump', best_time(
+            lambda: [o.model_dump() for o in objs], number=1
+        )))
+    report(f'{INSTANCE_COUNT:,} instances, {FIELD_COUNT} fields with `exclude_if` (half Missing):', rows, unit='ms')
+
+
+if __name__ == '__main__':
+    main()
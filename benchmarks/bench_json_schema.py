@@ -0,0 +1,28 @@
+""" JSON schema generation of partial models (ie: for OpenAPI docs), the first time and when it's cached. """
+import warnings
+
+from pydantic import BaseModel
+
+from pydantic_partials import AutoPartialModel
+
+from ._util import best_time, make_model, report
+
+
+def main():
+    for field_count in (50, 200):
+        model = make_model('Model', AutoPartialModel, field_count)
+
+        def generate():
+            # Generate it the way a plain `BaseModel` would, so nothing is cached.
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore')
+                return BaseModel.model_json_schema.__func__(model)  # type: ignore[attr-defined]
+
+        report(f'JSON schema, {field_count} fields:', [
+            ('generate', best_time(generate, number=20)),
+            ('model_json_schema (cached)', best_time(model.model_json_schema, number=200)),
+        ])
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+""" Memory used by wide, mostly-`Missing` instances (ie: PATCH payloads), measured via `tracemalloc`.
+
+    With `missing_omission='native'`, only the present fields are stored in each instance's `__dict__`;
+    the other variants store a value for every field (see `benchmarks.suite.make_variant`).
+
+    By default each variant is measured with a sample of instances and the result projected to 1M instances,
+    as 1M instances of the variants storing every field need several GiB; use `--instances 1000000`
+    to measure 1M instances for real.
+"""
+import argparse
+import gc
+import tracemalloc
+
+from .suite import VARIANTS, make_variant
+
+FIELD_COUNTS = (150, 300)
+PROJECTED_INSTANCES = 1_000_000
+
+
+def _patch_data(field_count: int) -> dict[str, int | str]:
+    """ A typical patch, setting a few of the fields. """
+    return {'f0': 1, 'f1': 'name', 'f4': 2, f'f{field_count - 1}': 'last'}
+
+
+def measure(variant: str, field_count: int, instances: int) -> float:
+    """ Returns the bytes used per instance, while `instances` of them are alive. """
+    model = make_variant(variant, field_count)
+    data = _patch_data(field_count)
+    model.model_validate(data)
+    gc.collect()
+    tracemalloc.start()
+    objs = [model.model_validate(data) for _ in range(instances)]
+    used, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(objs) == instances
+    return used / instances
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--instances', type=int, default=10_000, help='Number of instances to measure per variant.')
+    args = parser.parse_args(argv)
+
+    for field_count in FIELD_COUNTS:
+        print(f'Memory of instances with 4 of {field_count} fields set, {args.instances} instances measured:')
+        for variant in VARIANTS:
+            per_instance = measure(variant, field_count, args.instances)
+            projected = per_instance * PROJECTED_INSTANCES / 1024 / 1024
+            print(f'    {variant:<24} {per_instance:>10.0f} bytes/instance  {projected:>10.0f} MiB per 1M instances')
+
+
+if __name__ == '__main__':
+    main()
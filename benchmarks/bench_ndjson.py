@@ -0,0 +1,41 @@
+""" Streaming NDJSON validation via `model_validate_ndjson`, showing time and peak memory (via `tracemalloc`)
+    stay proportional to the batch size and not to the size of the input.
+"""
+import time
+import tracemalloc
+from typing import Iterator
+
+from pydantic_partials import AutoPartialModel
+
+from ._util import make_model
+
+
+def generate_ndjson(line_count: int, *, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+    """ Yields chunks of NDJSON, without ever having the whole input in memory. """
+    buffer = bytearray()
+    for n in range(line_count):
+        buffer += b'{"f0": %d, "f1": "name-%d", "f6": %d}\n' % (n, n, n)
+        if len(buffer) >= chunk_size:
+            yield bytes(buffer)
+            buffer.clear()
+    yield bytes(buffer)
+
+
+def main():
+    model = make_model('Model', AutoPartialModel, 20)
+    print('Streaming NDJSON, 20 fields (sparse):')
+    for line_count in (10_000, 100_000):
+        tracemalloc.start()
+        start = time.perf_counter()
+        count = 0
+        for batch in model.model_validate_ndjson(generate_ndjson(line_count), batch_size=1_000):
+            count += len(batch)
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        assert count == line_count
+        print(f'    {line_count:>9} lines  {elapsed:>8.2f} s  peak memory {peak / 1024 / 1024:>6.2f} MiB')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,28 @@
+""" Cost of getting a partial variant of a model via `partial_of` (cached) vs defining a new subclass each time. """
+from pydantic import BaseModel
+
+from pydantic_partials import AutoPartialModel, partial_of
+from pydantic_partials.factory import partial_of_cache
+
+from ._util import best_time, make_model, report
+
+
+def main():
+    model = make_model('Model', BaseModel, 50)
+
+    def define_subclass():
+        class PartialModel(AutoPartialModel, model):  # type: ignore
+            pass
+
+    partial_of(model, auto_partials_exclude={'f0'})
+    report('Partial variant of a 50 field model:', [
+        ('class PartialModel(AutoPartialModel, Model)', best_time(define_subclass, number=20)),
+        ('partial_of(Model, ...) (cached)', best_time(
+            lambda: partial_of(model, auto_partials_exclude={'f0'}), number=20_000
+        )),
+    ])
+    print(f'    {partial_of_cache.cache_info()}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,44 @@
+""" Finding which partial fields a patch carries, via `model_present_fields` vs checking every field for `Missing`;
+    and what keeping the cached `model_present_mask` up to date costs assignments.
+"""
+from pydantic import BaseModel
+
+from pydantic_partials import AutoPartialModel, Missing
+
+from ._util import best_time, make_model, report
+
+
+def main():
+    for field_count in (50, 200):
+        model = make_model('Model', AutoPartialModel, field_count)
+        obj = model(f0=1, f1='a', f4=2)
+
+        def scan_fields():
+            return {k for k in model.model_partial_fields if getattr(obj, k) is not Missing}
+
+        def first_access():
+            obj._model_reset_present_fields()
+            return obj.model_present_fields
+
+        report(f'Present fields of a 3 field patch, {field_count} fields:', [
+            ('scan model_partial_fields', best_time(scan_fields, number=2_000)),
+            ('model_present_fields (first access)', best_time(first_access, number=2_000)),
+            ('model_present_fields (cached)', best_time(lambda: obj.model_present_fields, number=200_000)),
+            ('model_present_mask (cached)', best_time(lambda: obj.model_present_mask, number=200_000)),
+        ])
+
+    plain = make_model('Plain', BaseModel, 50)(**{f'f{i}': i if i % 2 == 0 else 'a' for i in range(50)})
+    no_masks = make_model('NoMasks', AutoPartialModel, 50)(f0=1)
+    masks = make_model('Masks', AutoPartialModel, 50)
+    cached, uncached = masks(f0=1), masks(f0=1)
+    assert cached.model_present_mask
+    report('Assign a field, 50 fields:', [
+        ('BaseModel', best_time(lambda: setattr(plain, 'f0', 2), number=200_000)),
+        ('no mask cached for the class', best_time(lambda: setattr(no_masks, 'f0', 2), number=200_000)),
+        ('mask cached', best_time(lambda: setattr(cached, 'f0', 2), number=200_000)),
+        ('mask cached for another object', best_time(lambda: setattr(uncached, 'f0', 2), number=200_000)),
+    ])
+
+
+if __name__ == '__main__':
+    main()
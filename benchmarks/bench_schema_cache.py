@@ -0,0 +1,47 @@
+""" Cold start (import time) of a module with many partial models, with and without the on-disk schema cache
+    (see `pydantic_partials.schema_cache`).
+
+    Generates a module with 200 models of 20 fields each (in a temporary directory), then imports it
+    in a fresh interpreter: without the cache, with an empty cache (which also fills it), and with a full cache.
+    The time to use one of its models for the first time is measured too.
+"""
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from .bench_import import MODEL_COUNT, FIELD_COUNT, TIMING_SCRIPT, write_module
+
+
+def main():
+    repo_root = Path(__file__).parent.parent
+    print(f'Cold start of {MODEL_COUNT} partial models with {FIELD_COUNT} fields (best of 3):')
+    with tempfile.TemporaryDirectory() as directory:
+        module = 'models_cached'
+        write_module(Path(directory) / f'{module}.py', 'AutoPartialModel', False)
+        cache_directory = Path(directory) / 'schema-cache'
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join([directory, str(repo_root)]))
+        env.pop('PYDANTIC_PARTIALS_SCHEMA_CACHE', None)
+        cache_env = dict(env, PYDANTIC_PARTIALS_SCHEMA_CACHE=str(cache_directory))
+
+        def run(run_env: dict[str, str]) -> tuple[float, float]:
+            output = subprocess.run(
+                [sys.executable, '-c', TIMING_SCRIPT.format(module=module)],
+                env=run_env, check=True, capture_output=True, text=True,
+            ).stdout
+            import_time, first_use = (float(v) for v in output.split())
+            return import_time, first_use
+
+        results = [
+            ('no cache', min(run(env) for _ in range(3))),
+            ('empty cache (filling it)', run(cache_env)),
+            ('full cache', min(run(cache_env) for _ in range(3))),
+        ]
+        for label, (import_time, first_use) in results:
+            print(f'    {label:<40} import {import_time * 1000:>8.1f} ms   first use {first_use * 1000:>6.2f} ms')
+        print(f'    {len(list(cache_directory.glob("*.schema")))} cached schemas')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,31 @@
+""" Serialization cost of wide partial models, comparing the `missing_omission` modes.
+
+    With `'exclude_if'` pydantic-core calls a Python `exclude_if` function for every partial field of every instance,
+    with `'native'` the `Missing` fields are not in the `__dict__` and pydantic-core skips them on its own.
+"""
+from pydantic_partials import AutoPartialModel
+
+from ._util import best_time, make_model, report
+
+
+def main():
+    field_count = 100
+    instance_count = 10_000
+    for label, values in (
+        ('mostly Missing', {'f0': 0, 'f1': '1', 'f2': 2}),
+        ('mostly present', {f'f{i}': (i if i % 2 == 0 else str(i)) for i in range(field_count - 3)}),
+    ):
+        rows = []
+        for mode in ('exclude_if', 'native'):
+            model = make_model('Model', AutoPartialModel, field_count, missing_omission=mode)
+            objs = [model.model_validate(values) for _ in range(instance_count)]
+            rows.append((f'{mode}: model_dump', best_time(lambda: [o.model_dump() for o in objs], number=1)))
+            rows.append((f'{mode}: model_dump_json', best_time(lambda: [o.model_dump_json() for o in objs], number=1)))
+            rows.append((
+                f'{mode}: model_validate', best_time(lambda: [model.model_validate(values) for _ in objs], number=1)
+            ))
+        report(f'{instance_count:,} instances, {field_count} fields, {label}:', rows, unit='ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,48 @@
+""" Validating a large batch of JSON payloads in this process (`model_validate_many`), vs sharded across a pool of
+    worker processes (`model_validate_sharded`); returning instances, or dicts (`dump=True`).
+
+    The pool is started before timing (as it would be reused between calls), but the first call still pays for
+    building the model class in each worker. How much faster it is depends on the number of CPU cores.
+"""
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from pydantic_partials import AutoPartialModel
+
+PAYLOAD_COUNT = 100_000
+FIELD_COUNT = 20
+
+
+class Model(AutoPartialModel):
+    # Defined at module level, so worker processes can unpickle it.
+    __annotations__ = {f'f{i}': int if i % 2 == 0 else str for i in range(FIELD_COUNT)}
+
+
+def timed(label: str, function, *args, **kwargs):
+    start = time.perf_counter()
+    result = function(*args, **kwargs)
+    print(f'    {label:<50} {(time.perf_counter() - start) * 1000:>8.1f} ms')
+    return result
+
+
+def main():
+    payloads = [
+        json.dumps({f'f{i}': n if i % 2 == 0 else str(n) for i in range(FIELD_COUNT) if (n + i) % 3}).encode()
+        for n in range(PAYLOAD_COUNT)
+    ]
+    workers = os.cpu_count() or 1
+    print(f'Validating {PAYLOAD_COUNT:,} JSON payloads with {FIELD_COUNT} fields, {workers} CPU cores:')
+    expected = timed('model_validate_json_many (in this process)', Model.model_validate_json_many,
+                     b'[' + b','.join(payloads) + b']')
+
+    with ProcessPoolExecutor(max_workers=max(workers, 2)) as executor:
+        list(executor.map(abs, range(workers)))
+        for label, dump in (('model_validate_sharded', False), ('model_validate_sharded(dump=True)', True)):
+            results = timed(label, Model.model_validate_sharded, payloads, executor=executor, dump=dump)
+            assert results[-1] == (expected[-1].model_dump() if dump else expected[-1])
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+""" Applying PATCH payloads to a (local, in-memory) sqlite table: one `UPDATE` per patch (made from the fields
+    it has), vs `bulk_update_statements` grouping them into one statement per mix of fields (via `executemany`).
+"""
+import random
+import sqlite3
+import time
+
+from pydantic_partials import AutoPartialExclude, AutoPartialModel
+from pydantic_partials.sql import bulk_update_statements
+
+from ._util import make_model
+
+ROW_COUNT = 20_000
+FIELD_COUNT = 20
+
+
+def create_table() -> sqlite3.Connection:
+    connection = sqlite3.connect(':memory:')
+    columns = ', '.join(f'f{i} {"INTEGER" if i % 2 == 0 else "TEXT"}' for i in range(FIELD_COUNT))
+    connection.execute(f'CREATE TABLE items (id INTEGER PRIMARY KEY, {columns})')
+    row = [i if i % 2 == 0 else 'a' for i in range(FIELD_COUNT)]
+    placeholders = ', '.join('?' * (FIELD_COUNT + 1))
+    connection.executemany(f'INSERT INTO items VALUES ({placeholders})', ([n, *row] for n in range(ROW_COUNT)))
+    connection.commit()
+    return connection
+
+
+def update_per_row(connection: sqlite3.Connection, patches: list) -> None:
+    for patch in patches:
+        values = patch.model_dump()
+        key = values.pop('id')
+        assignments = ', '.join(f'"{name}" = ?' for name in values)
+        connection.execute(f'UPDATE items SET {assignments} WHERE "id" = ?', [*values.values(), key])
+
+
+def update_in_bulk(connection: sqlite3.Connection, patches: list) -> None:
+    for update in bulk_update_statements('items', patches):
+        connection.executemany(update.sql, update.params)
+
+
+def main():
+    base = make_model('Base', AutoPartialModel, FIELD_COUNT)
+    patch_model = type('ItemPatch', (base,), {'__annotations__': {'id': AutoPartialExclude[int]}})
+
+    random.seed(1)
+    for mix_count in (4, 64):
+        # Each patch sets one of `mix_count` mixes of 1-5 fields.
+        mixes = [random.sample(range(FIELD_COUNT), random.randint(1, 5)) for _ in range(mix_count)]
+        patches = [
+            patch_model(id=n, **{f'f{i}': n if i % 2 == 0 else f'v{n}' for i in random.choice(mixes)})
+            for n in range(ROW_COUNT)
+        ]
+
+        print(f'Applying {ROW_COUNT} patches with {mix_count} mixes of fields, {FIELD_COUNT} fields:')
+        results = []
+        for label, update in (('UPDATE per patch', update_per_row), ('bulk_update_statements', update_in_bulk)):
+            connection = create_table()
+            start = time.perf_counter()
+            update(connection, patches)
+            connection.commit()
+            print(f'    {label:<40} {(time.perf_counter() - start) * 1000:>8.1f} ms')
+            results.append(connection.execute('SELECT * FROM items ORDER BY id').fetchall())
+        assert results[0] == results[1]
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,34 @@
+""" Batch validation via `model_validate_many` / `model_validate_json_many`, vs calling `model_validate` in a loop.
+"""
+import json
+
+from pydantic_partials import AutoPartialModel
+
+from ._util import best_time, make_model, report
+
+
+def main():
+    model = make_model('Model', AutoPartialModel, 20)
+    for item_count in (1_000, 100_000):
+        items = [{f'f{i}': (n if i % 2 == 0 else str(n)) for i in range(0, 20, 3)} for n in range(item_count)]
+        json_items = [json.dumps(item) for item in items]
+        json_array = json.dumps(items)
+        with_errors = list(items)
+        with_errors[::100] = [{'f0': 'bad'}] * len(with_errors[::100])
+        number = 10 if item_count <= 1_000 else 1
+
+        report(f'Validating {item_count} items, 20 fields:', [
+            ('model_validate loop', best_time(lambda: [model.model_validate(i) for i in items], number=number)),
+            ('model_validate_many', best_time(lambda: model.model_validate_many(items), number=number)),
+            ('model_validate_many (1% errors)', best_time(
+                lambda: model.model_validate_many(with_errors, collect_errors=True), number=number
+            )),
+            ('model_validate_json loop', best_time(
+                lambda: [model.model_validate_json(i) for i in json_items], number=number
+            )),
+            ('model_validate_json_many', best_time(lambda: model.model_validate_json_many(json_array), number=number)),
+        ], unit='ms')
+
+
+if __name__ == '__main__':
+    main()
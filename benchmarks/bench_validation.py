@@ -0,0 +1,34 @@
+""" Validation cost of partial models, via `model_validate` and `validate_assignment`.
+
+    Covers payloads where every field is explicitly `Missing` (the `MissingType` branch of each field is used),
+    where half the fields have a value and where the payload is empty (all fields default to `Missing`).
+"""
+from pydantic_partials import AutoPartialModel, Missing
+
+from ._util import best_time, make_model, report
+
+
+def main():
+    for field_count in (50, 200):
+        model = make_model('Model', AutoPartialModel, field_count, validate_assignment=True)
+        all_missing = {f'f{i}': Missing for i in range(field_count)}
+        half_set = {f'f{i}': (i if i % 2 == 0 else str(i)) for i in range(0, field_count, 2)}
+        obj = model()
+
+        def assign_missing():
+            obj.f0 = Missing
+
+        def assign_value():
+            obj.f0 = 1
+
+        report(f'Validation, {field_count} fields:', [
+            ('model_validate (all Missing)', best_time(lambda: model.model_validate(all_missing), number=2_000)),
+            ('model_validate (half set)', best_time(lambda: model.model_validate(half_set), number=2_000)),
+            ('model_validate (empty)', best_time(lambda: model.model_validate({}), number=2_000)),
+            ('validate_assignment (Missing)', best_time(assign_missing, number=20_000)),
+            ('validate_assignment (value)', best_time(assign_value, number=20_000)),
+        ])
+
+
+if __name__ == '__main__':
+    main()
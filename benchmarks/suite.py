@@ -0,0 +1,207 @@
+""" Benchmark suite covering class creation, validation and serialization of partial models,
+    compared with a plain `BaseModel` and with Pydantic's `MISSING` sentinel.
+
+    Results are saved as JSON, so they can be compared between releases:
+
+    ```shell
+    python -m benchmarks.suite --output before.json
+    # ... make changes / upgrade ...
+    python -m benchmarks.suite --output after.json --compare before.json
+    ```
+
+    Use `--quick` for a fast run with fewer field counts and less repeats (ie: for a smoke test).
+"""
+import argparse
+import functools
+import json
+import platform
+import subprocess
+import sys
+from datetime import datetime, timezone
+from importlib.metadata import version
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+import pydantic
+from pydantic import BaseModel, create_model
+
+from pydantic_partials import AutoPartialModel
+
+from ._util import auto_time
+
+try:
+    from pydantic import MISSING
+except ImportError:  # Pydantic < 2.14
+    from pydantic.experimental.missing_sentinel import MISSING
+
+FIELD_COUNTS = (10, 100, 500)
+INHERITANCE_DEPTHS = (1, 5, 10)
+
+
+def _field_value(i: int) -> int | str:
+    return i if i % 2 == 0 else str(i)
+
+
+def make_variant(variant: str, field_count: int, *, defer_build: bool = False) -> type[BaseModel]:
+    """ Makes a model with `field_count` fields (`f0`, `f1`, ...) that can all be left out, for each variant:
+
+        - `'base_model'`: Plain `BaseModel`, fields default to `None`.
+        - `'pydantic_missing'`: Plain `BaseModel`, fields default to Pydantic's `MISSING` sentinel.
+        - `'partial_exclude_if'`: `AutoPartialModel` (with the default `missing_omission='exclude_if'`).
+        - `'partial_native'`: `AutoPartialModel` with `missing_omission='native'`.
+    """
+    fields: dict[str, Any] = {}
+    kwargs: dict[str, Any] = {'defer_build': defer_build}
+    base: type[BaseModel] = BaseModel
+    for i in range(field_count):
+        type_hint: Any = int if i % 2 == 0 else str
+        if variant == 'base_model':
+            fields[f'f{i}'] = (type_hint | None, None)
+        elif variant == 'pydantic_missing':
+            fields[f'f{i}'] = (type_hint | MISSING, MISSING)
+        else:
+            fields[f'f{i}'] = (type_hint, ...)
+
+    if variant.startswith('partial_'):
+        base = AutoPartialModel
+        kwargs['missing_omission'] = variant.removeprefix('partial_')
+    return create_model('Model', __base__=base, __cls_kwargs__=kwargs, **fields)
+
+
+VARIANTS = ('base_model', 'pydantic_missing', 'partial_exclude_if', 'partial_native')
+
+
+def make_inheritance_chain(depth: int) -> type[BaseModel]:
+    """ Makes `depth` levels of `AutoPartialModel` subclasses, each one adding 10 more fields. """
+    model: type[BaseModel] = AutoPartialModel
+    for level in range(depth):
+        fields: dict[str, Any] = {f'l{level}_f{i}': (int, ...) for i in range(10)}
+        model = create_model(f'Level{level}', __base__=model, **fields)
+    return model
+
+
+def benchmarks(field_counts: tuple[int, ...], depths: tuple[int, ...]) -> Iterator[tuple[str, Callable[[], Any]]]:
+    """ Yields the name and function of each benchmark. """
+    for field_count in field_counts:
+        present_count = max(1, field_count * 9 // 10)
+        payloads = {
+            'mostly_missing': {f'f{i}': _field_value(i) for i in range(3)},
+            'mostly_present': {f'f{i}': _field_value(i) for i in range(present_count)},
+        }
+        for variant in VARIANTS:
+            prefix = f'{variant}/fields={field_count}'
+            yield f'{prefix}/class_creation', functools.partial(make_variant, variant, field_count)
+
+            model = make_variant(variant, field_count)
+            for payload_name, payload in payloads.items():
+                payload_json = json.dumps(payload)
+                obj = model.model_validate(payload)
+                yield f'{prefix}/{payload_name}/model_validate', functools.partial(model.model_validate, payload)
+                yield (
+                    f'{prefix}/{payload_name}/model_validate_json',
+                    functools.partial(model.model_validate_json, payload_json),
+                )
+                yield f'{prefix}/{payload_name}/model_dump', obj.model_dump
+                yield f'{prefix}/{payload_name}/model_dump_json', obj.model_dump_json
+
+    for depth in depths:
+        chain = make_inheritance_chain(depth)
+        payload = {f'l{level}_f0': level for level in range(depth)}
+        obj = chain.model_validate(payload)
+        yield f'inheritance/depth={depth}/class_creation', functools.partial(make_inheritance_chain, depth)
+        yield f'inheritance/depth={depth}/model_validate', functools.partial(chain.model_validate, payload)
+        yield f'inheritance/depth={depth}/model_dump', obj.model_dump
+
+
+def metadata() -> dict[str, Any]:
+    return {
+        'timestamp': datetime.now(timezone.utc).isoformat(),
+        'python': sys.version.split()[0],
+        'platform': platform.platform(),
+        'pydantic': pydantic.VERSION,
+        'pydantic_core': version('pydantic-core'),
+        'pydantic_partials': version('pydantic-partials') if _is_installed('pydantic-partials') else None,
+        'git_commit': _git_commit(),
+    }
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', 'HEAD'], capture_output=True, text=True, check=True, cwd=Path(__file__).parent
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _is_installed(distribution: str) -> bool:
+    try:
+        version(distribution)
+    except Exception:
+        return False
+    return True
+
+
+def run(*, quick: bool = False, pattern: str | None = None) -> dict[str, Any]:
+    field_counts = (10, 100) if quick else FIELD_COUNTS
+    depths = (1, 5) if quick else INHERITANCE_DEPTHS
+    results: dict[str, float] = {}
+    for name, func in benchmarks(field_counts, depths):
+        if pattern and pattern not in name:
+            continue
+        seconds = auto_time(func, min_time=0.02 if quick else 0.1, repeat=3 if quick else 5)
+        results[name] = seconds
+        print(f'{name:<70} {seconds * 1_000_000:>12.2f} us', flush=True)
+    return {'metadata': metadata(), 'results': results}
+
+
+def compare(current: dict[str, Any], previous: dict[str, Any], *, threshold: float) -> list[str]:
+    """ Prints how each result changed against the `previous` run,
+        returns the names of results that got slower by more than `threshold` (ie: `0.1` for 10%).
+    """
+    print(f'\nCompared with run from {previous["metadata"].get("timestamp")}:')
+    regressions = []
+    for name, seconds in current['results'].items():
+        before = previous['results'].get(name)
+        if not before:
+            continue
+        ratio = seconds / before
+        flag = ''
+        if ratio > 1 + threshold:
+            flag = '  <-- slower'
+            regressions.append(name)
+        elif ratio < 1 - threshold:
+            flag = '  faster'
+        print(f'{name:<70} {before * 1e6:>10.2f} -> {seconds * 1e6:>10.2f} us  {ratio:>6.2f}x{flag}')
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--output', help='Save results as JSON to this file.')
+    parser.add_argument('--compare', help='JSON results of a previous run to compare with.')
+    parser.add_argument(
+        '--threshold', type=float, default=0.2,
+        help='With --compare, how much slower (0.2 = 20%%) a result can be before it counts as a regression.',
+    )
+    parser.add_argument('--quick', action='store_true', help='Fewer field counts and repeats.')
+    parser.add_argument('--filter', dest='pattern', help='Only run benchmarks with this in their name.')
+    args = parser.parse_args(argv)
+
+    current = run(quick=args.quick, pattern=args.pattern)
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(current, file, indent=2)
+
+    if args.compare:
+        with open(args.compare) as file:
+            previous = json.load(file)
+        regressions = compare(current, previous, threshold=args.threshold)
+        if regressions:
+            print(f'\n{len(regressions)} result(s) regressed by more than {args.threshold:.0%}.')
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
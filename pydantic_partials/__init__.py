@@ -2,3 +2,4 @@ from .partial import PartialModel, Partial, AutoPartialExclude, AutoPartialModel
 from .config import PartialConfigDict
 from .sentinels import Missing, MissingType
 from .make_missing_falsy import patch_missing_to_make_falsy
+from .factory import partial_of
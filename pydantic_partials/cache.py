@@ -0,0 +1,73 @@
+import threading
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, NamedTuple, TypeVar
+
+V = TypeVar('V')
+
+
+class CacheInfo(NamedTuple):
+    """ Statistics about a `LRUCache`, similar to what `functools.lru_cache` provides. """
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+class LRUCache(Generic[V]):
+    """ A bounded, thread-safe, least-recently-used cache.
+
+        Used to memoize generated classes (such as the ones made by `pydantic_partials.factory.partial_of`),
+        so asking for the same one again only costs a dict lookup.
+
+        Values are created while holding a (re-entrant) lock, so the same value is never created twice,
+        even when requested from several threads at once; creating a value is allowed to use the cache itself.
+    """
+
+    def __init__(self, maxsize: int = 512):
+        if maxsize < 1:
+            raise ValueError(f'The `maxsize` must be at least 1, got ({maxsize}).')
+
+        self._maxsize = maxsize
+        self._values: OrderedDict[Hashable, V] = OrderedDict()
+        self._lock = threading.RLock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get_or_create(self, key: Hashable, create: Callable[[], V]) -> V:
+        """ Returns the value cached for `key`, calling `create()` to make and cache it if there is none. """
+        with self._lock:
+            value = self._values.get(key, _NOT_FOUND)
+            if value is not _NOT_FOUND:
+                self._values.move_to_end(key)
+                self._hits += 1
+                return value  # type: ignore
+
+            self._misses += 1
+            value = create()
+
+            self._values[key] = value
+            while len(self._values) > self._maxsize:
+                self._values.popitem(last=False)
+                self._evictions += 1
+            return value
+
+    def cache_info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._evictions, self._maxsize, len(self._values))
+
+    def cache_clear(self) -> None:
+        """ Removes all the cached values and resets the statistics. """
+        with self._lock:
+            self._values.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._values
+
+
+_NOT_FOUND = object()
@@ -0,0 +1,148 @@
+""" Column-oriented export/import of batches of partial models (ie: for analytics).
+
+    `to_columns` turns a list of instances of one partial model class into a `Column` per field, where `Missing`
+    is not a value but a cleared bit in the column's presence bitmap; `from_columns` turns them back into instances.
+
+    A column can also be turned into a NumPy masked array (`Column.to_numpy`, if NumPy is installed),
+    or an `array.array` of a fixed type (`Column.to_array`).
+"""
+import array
+from itertools import compress
+from typing import Any, Iterable, Mapping, NamedTuple, Sequence, TypeVar
+
+from pydantic import BaseModel
+
+from .sentinels import Missing
+
+M = TypeVar('M', bound=BaseModel)
+
+
+class Column(NamedTuple):
+    """ The values of one field for a batch of models. """
+
+    values: list[Any]
+    """ The value of each model, with the fill value (`None` by default) where it's `Missing`. """
+
+    present: bytes | None
+    """ Presence bitmap, bit `i` is set if the value of the model at index `i` is not `Missing`; in little-endian
+        bit order (the same as Apache Arrow validity bitmaps, and `numpy.unpackbits(..., bitorder='little')`).
+        `None` if every value is present.
+    """
+
+    def presence(self) -> list[bool]:
+        """ Returns if each value is present (not `Missing`). """
+        count = len(self.values)
+        if self.present is None:
+            return [True] * count
+        bits = format(int.from_bytes(self.present, 'little'), f'0{count}b')[::-1]
+        return [bit == '1' for bit in bits[:count]]
+
+    def to_numpy(self, dtype: Any = None) -> Any:
+        """ Returns the values as a `numpy.ma.MaskedArray`, masking `Missing` values; needs NumPy installed. """
+        try:
+            import numpy  # type: ignore[import-not-found]
+        except ImportError as e:
+            raise ImportError('NumPy is needed to get columns as NumPy arrays (`pip install numpy`).') from e
+
+        mask: Any = False
+        if self.present is not None:
+            bits = numpy.unpackbits(numpy.frombuffer(self.present, dtype=numpy.uint8), bitorder='little')
+            mask = bits[:len(self.values)] == 0
+        return numpy.ma.MaskedArray(self.values, mask=mask, dtype=dtype)
+
+    @classmethod
+    def from_numpy(cls, values: Any) -> 'Column':
+        """ Makes a column from a NumPy array; masked values (if it's a masked array) are `Missing`. """
+        import numpy  # type: ignore[import-not-found]
+
+        mask = numpy.ma.getmaskarray(values)
+        present = None
+        if mask.any():
+            present = numpy.packbits(~mask, bitorder='little').tobytes()
+        return cls(numpy.ma.getdata(values).tolist(), present)
+
+    def to_array(self, typecode: str) -> array.array:
+        """ Returns the values as an `array.array` of `typecode` (ie: `'q'` for `int`, `'d'` for `float`);
+            so the column's fill value needs to be valid for it (ie: `to_columns(..., fill=0)`).
+        """
+        return array.array(typecode, self.values)
+
+
+def to_columns(
+        cls: type[BaseModel],
+        items: Sequence[BaseModel],
+        *,
+        fields: Iterable[str] | None = None,
+        fill: Any = None,
+) -> dict[str, Column]:
+    """ Returns a `Column` for each of the `fields` (all of them by default) of `items`, which need to be
+        instances of the partial model `cls` (not of subclasses, as they can have other fields).
+
+        The values are read column by column, straight from the `__dict__` of each instance.
+        `Missing` values are replaced with `fill`, and have their bit cleared in the column's presence bitmap.
+    """
+    names = tuple(cls.model_fields) if fields is None else tuple(fields)
+    for name in names:
+        if name not in cls.model_fields:
+            raise ValueError(f'({name}) is not a field of ({cls.__name__}).')
+    for item in items:
+        if type(item) is not cls:
+            raise ValueError(f'Expected instances of ({cls.__name__}), got a ({type(item).__name__}).')
+
+    partial_fields: set[str] = getattr(cls, 'model_partial_fields', set())
+    dicts = [item.__dict__ for item in items]
+    columns = {}
+    for name in names:
+        if name not in partial_fields:
+            columns[name] = Column([values[name] for values in dicts], None)
+            continue
+
+        values = [values.get(name, Missing) for values in dicts]
+        flags = bytes(value is not Missing for value in values)
+        if 0 not in flags:
+            columns[name] = Column(values, None)
+            continue
+        columns[name] = Column([fill if value is Missing else value for value in values], _pack_bits(flags))
+    return columns
+
+
+def from_columns(cls: type[M], columns: Mapping[str, Column], *, validate: bool = False) -> list[M]:
+    """ Returns an instance of `cls` for each row of `columns` (see `to_columns`),
+        leaving out the values that are not present (they are `Missing`).
+
+        The values are trusted to be valid (ie: they came from `to_columns`), and are not validated again
+        (see `model_construct_many`); unless `validate` is `True`, when each instance is made via `model_validate`.
+    """
+    counts = {len(column.values) for column in columns.values()}
+    if len(counts) > 1:
+        raise ValueError(f'All columns need the same number of values, got ({", ".join(map(str, sorted(counts)))}).')
+
+    count = counts.pop() if counts else 0
+    rows: list[dict[str, Any]] = [{} for _ in range(count)]
+    for name, column in columns.items():
+        if column.present is None:
+            for row, value in zip(rows, column.values):
+                row[name] = value
+        else:
+            presence = column.presence()
+            for row, value in zip(compress(rows, presence), compress(column.values, presence)):
+                row[name] = value
+
+    if validate:
+        return [cls.model_validate(row) for row in rows]
+    construct_many = getattr(cls, 'model_construct_many', None)
+    if construct_many is not None:
+        return construct_many(rows)
+    return [cls.model_construct(**row) for row in rows]
+
+
+# Turns the bytes of `bytes(flags)` (0 or 1) into the ASCII digits of a binary number.
+_BINARY_DIGITS = bytes.maketrans(b'\x00\x01', b'01')
+
+
+def _pack_bits(flags: bytes) -> bytes:
+    """ Packs `flags` (a byte of 0 or 1 for each value) into a little-endian bitmap, one bit per value. """
+    if not flags:
+        return b''
+    number = int(flags.translate(_BINARY_DIGITS)[::-1], 2)
+    return number.to_bytes((len(flags) + 7) // 8, 'little')
@@ -39,3 +39,59 @@ class PartialConfigDict(ConfigDict, total=False):
         
         You can also use `pydantic_partials.partial.AutoPartialExclude` to more easily mark fields as excluded.
     """
+
+    missing_omission: typing.Literal['exclude_if', 'native']
+    """
+    Defaults to `'exclude_if'`.
+
+    How fields with a `Missing` value are left out when serializing the model (ie: `model_dump`/`model_dump_json`).
+
+    - If `'exclude_if'` (default): Each partial field gets an `exclude_if` check for `Missing` that
+        pydantic-core calls (in Python) for every partial field, each time a model is serialized.
+
+    - If `'native'`: Fields with a `Missing` value are not stored in the instance `__dict__` at all,
+        which pydantic-core skips on its own when serializing; there are no per-field Python calls.
+        Accessing one of these fields still returns `Missing`, and assigning `Missing` to a field removes it again.
+
+        `Missing` values are removed right after validation (via `model_post_init`),
+        so this moves a small amount of work from serialization to validation;
+        it's well worth it for models that are serialized more than they are validated, or have a lot of fields.
+
+        The visible difference is that `vars(obj)`/`obj.__dict__` won't contain the `Missing` fields
+        (the others are kept in the order of the fields, also when a `Missing` field is set later on).
+
+        Limit: when one of these models is the value of a field typed as a union (ie: `Address | None`),
+        pydantic-core checks that its `__dict__` has all of the model's fields to pick the member of the union;
+        so it's serialized the same, but with a `PydanticSerializationUnexpectedValue` warning.
+
+        As only the present fields are stored, this also uses a lot less memory per instance for wide models
+        with few fields set (ie: PATCH payloads).
+    """
+
+    track_dirty: bool
+    """
+    Defaults to `False`.
+
+    If `True`, assignments to fields (ie: `obj.name = 'new'`, or via `apply_to`) that actually change the value
+    are recorded in `model_dirty_fields`; so only the fields changed since the model was created (or since
+    `model_reset_dirty`) need to be written back to a store (see `model_dump_dirty`).
+    Values are compared the same way as `from_diff` does.
+
+    If `False`, nothing is recorded; assigning a field only costs an extra check of this option.
+    """
+
+    deep_partials: bool
+    """
+    Defaults to `False`.
+
+    If `True`, any Pydantic models used by the fields of the model are also made into partials, recursively;
+    including models inside of `list`, `dict`, unions and other generic types (ie: `list[Address] | None`).
+    This is handy for nested PATCH payloads, where only part of a nested model is provided.
+
+    This applies to partial fields, and to any other fields that are not excluded from `auto_partials`.
+    The nested partial classes are made via `pydantic_partials.factory.partial_of`, so they are cached
+    and shared by every model that uses them; self-referencing models will use the partial class itself.
+
+    Keep in mind that unions of several models become ambiguous when they are all partials
+    (as an empty object is valid for each of them), consider using a discriminated union for those.
+    """
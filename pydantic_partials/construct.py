@@ -0,0 +1,120 @@
+from typing import Any, Callable, Iterable, Mapping, NamedTuple, TypeVar
+
+from pydantic import BaseModel
+from pydantic.fields import FieldInfo
+
+from .sentinels import Missing
+
+M = TypeVar('M', bound=BaseModel)
+
+_NOT_SET: Any = object()
+_object_setattr = object.__setattr__
+
+
+class ConstructPlan(NamedTuple):
+    """ What is needed to construct instances of a model class from trusted values, worked out once per class. """
+
+    template: dict[str, Any]
+    """ Every field (in order), with `Missing` for fields that default to it (unless they are omitted natively)
+        and `_NOT_SET` for fields that need their default looked up (or are required).
+    """
+
+    others: tuple[tuple[str, FieldInfo], ...]
+    """ Fields set to `_NOT_SET` in the `template`. """
+
+    field_names: frozenset[str]
+    extra_allowed: bool
+
+    omit_missing: bool
+    """ If `Missing` values are left out of the `__dict__` (ie: `missing_omission='native'`). """
+
+    post_init: Callable[[Any, Any], None] | None
+    """ The `model_post_init` to call after constructing, if any; with native omission, this is the one wrapped
+        by `pydantic_partials.meta._omit_missing_post_init`, as `Missing` values are left out here instead.
+    """
+
+
+def construct_plan(cls: type[BaseModel]) -> ConstructPlan:
+    """ Returns the `ConstructPlan` of `cls`, cached on the class (subclasses get their own). """
+    plan = cls.__dict__.get('__partial_construct_plan__')
+    if plan is not None:
+        return plan
+
+    omit_missing = getattr(cls, '__partial_omit_natively__', False)
+    template: dict[str, Any] = {}
+    others = []
+    for name, field in cls.model_fields.items():
+        if field.default is Missing and field.default_factory is None:
+            if not omit_missing:
+                template[name] = Missing
+        else:
+            template[name] = _NOT_SET
+            others.append((name, field))
+
+    post_init = cls.model_post_init if cls.__pydantic_post_init__ else None
+    if omit_missing and hasattr(post_init, '__partial_omit_missing__'):
+        post_init = post_init.__wrapped__  # type: ignore[union-attr]
+        if post_init is BaseModel.model_post_init:
+            post_init = None
+
+    plan = ConstructPlan(
+        template=template,
+        others=tuple(others),
+        field_names=frozenset(cls.model_fields),
+        extra_allowed=cls.model_config.get('extra') == 'allow',
+        omit_missing=omit_missing,
+        post_init=post_init,
+    )
+    setattr(cls, '__partial_construct_plan__', plan)
+    return plan
+
+
+def construct_trusted(cls: type[M], values: Mapping[str, Any], fields_set: set[str] | None = None) -> M:
+    """ Like `model_construct`, creates a `cls` from trusted `values` (by field name) without validation;
+        but with the default of each field worked out ahead of time, so fields that default to `Missing`
+        don't each need their default looked up (and deep-copied).
+    """
+    return _construct(cls, construct_plan(cls), values, fields_set)
+
+
+def construct_many_trusted(cls: type[M], items: Iterable[Mapping[str, Any]]) -> list[M]:
+    """ Like `construct_trusted`, for each of the `items`; the plan is only looked up once. """
+    plan = construct_plan(cls)
+    return [_construct(cls, plan, values, None) for values in items]
+
+
+def _construct(cls: type[M], plan: ConstructPlan, values: Mapping[str, Any], fields_set: set[str] | None) -> M:
+    extra = None
+    if values.keys() <= plan.field_names:
+        field_values = values
+    else:
+        field_values = {k: v for k, v in values.items() if k in plan.field_names}
+        if plan.extra_allowed:
+            extra = {k: v for k, v in values.items() if k not in plan.field_names}
+
+    data = plan.template.copy()
+    data.update(field_values)
+    for name, field in plan.others:
+        if data[name] is not _NOT_SET:
+            continue
+        if field.is_required():
+            del data[name]
+        elif field.default_factory_takes_validated_data:
+            validated = {k: v for k, v in data.items() if v is not _NOT_SET}
+            data[name] = field.get_default(call_default_factory=True, validated_data=validated)
+        else:
+            data[name] = field.get_default(call_default_factory=True)
+
+    if plan.omit_missing:
+        omitted = [k for k, v in data.items() if v is Missing]
+        for name in omitted:
+            del data[name]
+
+    obj = cls.__new__(cls)
+    _object_setattr(obj, '__dict__', data)
+    _object_setattr(obj, '__pydantic_fields_set__', set(field_values) if fields_set is None else fields_set)
+    _object_setattr(obj, '__pydantic_extra__', extra)
+    _object_setattr(obj, '__pydantic_private__', None)
+    if plan.post_init is not None:
+        plan.post_init(obj, None)
+    return obj
@@ -0,0 +1,91 @@
+from typing import Iterable, TypeVar, Type, Literal, Any
+
+from pydantic import BaseModel
+from xsentinels import Default
+from xsentinels.default import DefaultType
+
+from .cache import LRUCache
+from .meta import PartialMeta, _deep_partials_building
+from .partial import AutoPartialModel
+
+M = TypeVar('M', bound=BaseModel)
+
+partial_of_cache: LRUCache[type] = LRUCache(maxsize=512)
+""" Cache of the classes made by `partial_of`, see `pydantic_partials.cache.LRUCache.cache_info` for statistics. """
+
+
+def partial_of(
+        model: Type[M],
+        *,
+        auto_partials_exclude: Iterable[str] = (),
+        fields: Iterable[str] | None = None,
+        missing_omission: Literal['exclude_if', 'native'] | DefaultType = Default,
+        deep_partials: bool = False,
+) -> Type[M]:
+    """ Returns an automatic partial subclass of `model`, the same as if you had written:
+
+        ```python
+        class PartialModelName(AutoPartialModel, ModelName):
+            pass
+        ```
+
+        The classes are cached (see `partial_of_cache`) by `model` and the options, so asking
+        for the same partial variant again returns the same class and only costs a dict lookup.
+
+    Args:
+        model: Any Pydantic model class, including partial models (ie: to get a variant with other options).
+        auto_partials_exclude: Field names to keep required (not partial), in addition to any already
+            excluded by the model, see `pydantic_partials.config.PartialConfigDict.auto_partials_exclude`.
+            Like when subclassing it, fields that are already partial on `model` stay partial.
+        fields: If provided, only these fields are made partial, the rest are left as they are on `model`.
+        missing_omission: See `pydantic_partials.config.PartialConfigDict.missing_omission`.
+        deep_partials: If `True`, the models used by the fields are also made into (deep) partials,
+            see `pydantic_partials.config.PartialConfigDict.deep_partials`.
+    """
+    exclude = frozenset(auto_partials_exclude)
+    if fields is not None:
+        fields = frozenset(fields)
+        if unknown := fields.difference(model.model_fields):
+            raise ValueError(f'Fields ({", ".join(sorted(unknown))}) are not on model ({model.__name__}).')
+        exclude = exclude.union(model.model_fields.keys() - fields)
+
+    key = (model, exclude, missing_omission, deep_partials)
+
+    # A deep partial model that refers to itself (directly, or via other models) gets the class that's still
+    # being created; its schema is built once it's finished.
+    if (building := _deep_partials_building().get(key)) is not None:
+        return building
+
+    return partial_of_cache.get_or_create(
+        key, lambda: _make_partial(key, model, exclude, missing_omission, deep_partials)
+    )
+
+
+def _make_partial(key: tuple, model: type, exclude: frozenset[str], missing_omission: Any, deep_partials: bool) -> type:
+    name = f'Partial{model.__name__}'
+    namespace = {
+        '__module__': model.__module__,
+        '__qualname__': name,
+        '__doc__': model.__doc__,
+        # Use the same namespace to resolve forward references as `model` does.
+        '__pydantic_parent_namespace__': model.__dict__.get('__pydantic_parent_namespace__'),
+    }
+    kwargs: dict[str, Any] = {'auto_partials': True, '__pydantic_reset_parent_namespace__': False}
+    if exclude:
+        kwargs['auto_partials_exclude'] = exclude
+    if missing_omission is not Default:
+        kwargs['missing_omission'] = missing_omission
+    # A model that is already an automatic partial can't have `AutoPartialModel` as another base (there would be
+    # no consistent MRO); the options are still applied, as class arguments.
+    bases = (model,) if issubclass(model, AutoPartialModel) else (AutoPartialModel, model)
+    if not deep_partials:
+        return PartialMeta(name, bases, namespace, **kwargs)
+
+    building = _deep_partials_building()
+    kwargs['deep_partials'] = True
+    # This is the name the private `___PartialMeta__on_created` argument ends up with (due to name mangling).
+    kwargs['_PartialMeta___PartialMeta__on_created'] = lambda cls: building.__setitem__(key, cls)
+    try:
+        return PartialMeta(name, bases, namespace, **kwargs)
+    finally:
+        building.pop(key, None)
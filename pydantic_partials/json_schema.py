@@ -0,0 +1,67 @@
+import copy
+from typing import Any, Callable, Hashable
+
+from pydantic import BaseModel
+from pydantic_core import CoreSchema
+
+from .sentinels import Missing
+
+
+def without_missing_defaults(cls: type[BaseModel], schema: CoreSchema) -> CoreSchema:
+    """ Returns a copy of the model core `schema` (as given to `__get_pydantic_json_schema__`) without any
+        `Missing` defaults; cached on the class (subclasses get their own) until it's given a different schema.
+
+        `Missing` is not a value, it means the key is left out; without a default the field is still optional
+        in the JSON schema, but no (invalid) default is shown for it. This also saves Pydantic from trying
+        to serialize `Missing` as the default of each field, which fails and emits a warning every time.
+    """
+    cached = cls.__dict__.get('__partial_json_core_schema__')
+    if cached is not None and cached[0] is schema:
+        return cached[1]
+
+    result = schema
+    # Look for the fields through any model validators, which wrap the fields schema (ie: 'function-before').
+    path: list[dict[str, Any]] = []
+    inner: Any = schema
+    while isinstance(inner, dict) and inner.get('type') != 'model-fields':
+        path.append(inner)
+        inner = inner.get('schema')
+
+    if isinstance(inner, dict):
+        fields = {}
+        for name, field in inner['fields'].items():
+            default_schema = field['schema']
+            if default_schema['type'] == 'default' and default_schema.get('default', None) is Missing:
+                default_schema = {k: v for k, v in default_schema.items() if k != 'default'}
+                field = {**field, 'schema': default_schema}
+            fields[name] = field
+
+        # Copy each of the schemas on the way to the fields, leaving the real schema unchanged.
+        result = {**inner, 'fields': fields}
+        for outer in reversed(path):
+            result = {**outer, 'schema': result}
+
+    setattr(cls, '__partial_json_core_schema__', (schema, result))
+    return result  # type: ignore[return-value]
+
+
+def cached_json_schema(cls: type[BaseModel], key: Hashable, generate: Callable[[], dict[str, Any]]) -> dict[str, Any]:
+    """ Returns a copy of the JSON schema of `cls` for `key` (the arguments of `model_json_schema`), calling
+        `generate` for it only the first time; the cache is kept on the class (subclasses get their own),
+        and is forgotten when the class is rebuilt.
+    """
+    cached: tuple[Any, dict[Hashable, dict[str, Any]]] | None = cls.__dict__.get('__partial_json_schemas__')
+    core_schema = cls.__dict__.get('__pydantic_core_schema__')
+    if cached is None or cached[0] is not core_schema:
+        cached = None
+
+    json_schema = cached[1].get(key) if cached is not None else None
+    if json_schema is None:
+        json_schema = generate()
+        # Generating it may have built the schema (ie: with `defer_build`), so check which one it's for after.
+        core_schema = cls.__dict__.get('__pydantic_core_schema__')
+        if cached is None or cached[0] is not core_schema:
+            cached = (core_schema, {})
+            setattr(cls, '__partial_json_schemas__', cached)
+        cached[1][key] = json_schema
+    return copy.deepcopy(json_schema)
@@ -0,0 +1,161 @@
+""" Field masks (like Google's `FieldMask`): a list of dotted field paths to serialize a model with,
+    ie: `['id', 'address.city']`; or as a comma separated string, ie: `'id,address.city'`.
+
+    Each distinct mask is compiled once into its own serializer (see `compile_mask`), made from a copy of the
+    core schema of the model where the fields that are not in the mask are never serialized;
+    so serializing with it does not need to interpret an `include` for every call.
+"""
+from typing import Any, Iterable
+
+from pydantic import BaseModel
+from pydantic._internal._config import ConfigWrapper
+from pydantic_core import SchemaSerializer
+
+from .cache import LRUCache
+
+FieldMask = str | Iterable[str]
+""" Either a comma separated string of dotted field paths, or an iterable of them. """
+
+MASK_CACHE_SIZE = 128
+""" How many compiled masks are kept for each model class. """
+
+# Schemas that wrap another schema (under `schema`) without changing which fields there are.
+_WRAPPER_TYPES = frozenset({
+    'default', 'nullable', 'function-before', 'function-after', 'function-wrap', 'lax-or-strict', 'json-or-python',
+})
+_ITEMS_TYPES = frozenset({'list', 'set', 'frozenset', 'generator'})
+
+
+def parse_mask(mask: FieldMask) -> dict[str, Any]:
+    """ Returns `mask` as a tree of field names, in the form `model_dump(include=...)` takes;
+        ie: `'id,address.city'` -> `{'id': True, 'address': {'city': True}}`.
+
+        A path that is a prefix of another one includes all of it (ie: `'address,address.city'` is `'address'`).
+    """
+    paths = mask.split(',') if isinstance(mask, str) else mask
+    tree: dict[str, Any] = {}
+    for path in paths:
+        names = path.strip().split('.')
+        if not all(names):
+            raise ValueError(f'Invalid field mask path ({path!r}).')
+
+        node = tree
+        for name in names[:-1]:
+            child = node.setdefault(name, {})
+            if child is True:
+                break
+            node = child
+        else:
+            node[names[-1]] = True
+    return tree
+
+
+def compile_mask(cls: type[BaseModel], mask: FieldMask) -> SchemaSerializer:
+    """ Returns the serializer of `cls` for `mask`, only compiling it the first time it's asked for; the last
+        `MASK_CACHE_SIZE` masks are cached on the class (subclasses get their own), until the class is rebuilt.
+
+        A `ValueError` is raised if a path of the mask is not a field (or goes into a field without sub-fields).
+    """
+    core_schema = cls.__pydantic_core_schema__
+    cached: tuple[Any, LRUCache[SchemaSerializer]] | None = cls.__dict__.get('__partial_mask_serializers__')
+    if cached is None or cached[0] is not core_schema:
+        cached = (core_schema, LRUCache(maxsize=MASK_CACHE_SIZE))
+        setattr(cls, '__partial_mask_serializers__', cached)
+
+    key = mask if isinstance(mask, str) else tuple(mask)
+    return cached[1].get_or_create(key, lambda: _compile(cls, core_schema, parse_mask(key)))
+
+
+def _compile(cls: type[BaseModel], core_schema: Any, tree: dict[str, Any]) -> SchemaSerializer:
+    projection = _Projection(core_schema)
+    if core_schema['type'] == 'definitions':
+        schema = {**core_schema, 'schema': projection.project(core_schema['schema'], tree, '')}
+    else:
+        schema = projection.project(core_schema, tree, '')
+
+    core_config = ConfigWrapper(cls.model_config, check=False).core_config(title=cls.__name__)
+    # Without `_use_prebuilt=False`, pydantic-core would reuse the serializer of each (complete) model class in the
+    # schema, instead of building one from its projected schema.
+    return SchemaSerializer(schema, core_config, _use_prebuilt=False)  # type: ignore[arg-type]
+
+
+class _Projection:
+    """ Makes copies of the core schema of a model that only serialize the fields of a mask; the schemas not on
+        the way to the fields in the mask are shared with the original. The `path` given to each method is the
+        mask path of the schema, with a trailing dot (for errors).
+    """
+
+    def __init__(self, core_schema: Any) -> None:
+        self.definitions: dict[str, Any] = {}
+        if core_schema['type'] == 'definitions':
+            self.definitions = {d['ref']: d for d in core_schema['definitions']}
+
+    def project(self, schema: dict[str, Any], tree: dict[str, Any], path: str) -> dict[str, Any]:
+        schema_type = schema['type']
+        serialization = schema.get('serialization')
+        if serialization is not None and serialization['type'] == 'function-plain':
+            raise ValueError(f'Field mask path ({path.rstrip(".")}) goes into a value with a custom serializer.')
+
+        if schema_type == 'definition-ref':
+            # Inlined, as only this use of the definition is projected; the others still use the definition.
+            definition = self.definitions[schema['schema_ref']]
+            return self.project({k: v for k, v in definition.items() if k != 'ref'}, tree, path)
+        if schema_type == 'model':
+            return {**schema, 'schema': self.project(schema['schema'], tree, path)}
+        if schema_type == 'model-fields':
+            return self.project_fields(schema, tree, path)
+        if schema_type in _WRAPPER_TYPES and 'schema' in schema:
+            return {**schema, 'schema': self.project(schema['schema'], tree, path)}
+        if schema_type in _ITEMS_TYPES and 'items_schema' in schema:
+            return {**schema, 'items_schema': self.project(schema['items_schema'], tree, path)}
+        if schema_type == 'tuple':
+            return {**schema, 'items_schema': [self.project(s, tree, path) for s in schema['items_schema']]}
+        if schema_type == 'dict' and 'values_schema' in schema:
+            return {**schema, 'values_schema': self.project(schema['values_schema'], tree, path)}
+        if schema_type == 'union':
+            return {**schema, 'choices': self.project_choices(schema['choices'], tree, path)}
+        if schema_type == 'tagged-union':
+            choices = dict(zip(schema['choices'], self.project_choices(schema['choices'].values(), tree, path)))
+            return {**schema, 'choices': choices}
+        raise ValueError(f'Field mask path ({path.rstrip(".")}) goes into a value without fields.')
+
+    def project_fields(self, schema: dict[str, Any], tree: dict[str, Any], path: str) -> dict[str, Any]:
+        fields = schema['fields']
+        computed_fields = schema.get('computed_fields', [])
+        computed_names = {f['property_name'] for f in computed_fields}
+        for name, subtree in tree.items():
+            if name in computed_names and subtree is not True:
+                raise ValueError(f'Field mask path ({path}{name}) goes into a computed field.')
+            if name not in fields and name not in computed_names:
+                raise ValueError(f'Field mask path ({path}{name}) is not a field.')
+
+        projected = {}
+        for name, field in fields.items():
+            subtree = tree.get(name)
+            if subtree is None:
+                field = {**field, 'serialization_exclude': True}
+            elif subtree is not True:
+                field = {**field, 'schema': self.project(field['schema'], subtree, f'{path}{name}.')}
+            projected[name] = field
+
+        result = {**schema, 'fields': projected}
+        if computed_fields:
+            result['computed_fields'] = [f for f in computed_fields if f['property_name'] in tree]
+        return result
+
+    def project_choices(self, choices: Iterable[Any], tree: dict[str, Any], path: str) -> list[Any]:
+        """ Projects the choices of a union that have fields, the others (ie: `None`, a `str`) are left as-is. """
+        projected = []
+        any_projected = False
+        for choice in choices:
+            schema, label = choice if isinstance(choice, tuple) else (choice, None)
+            try:
+                schema = self.project(schema, tree, path)
+                any_projected = True
+            except ValueError:
+                pass
+            projected.append(schema if label is None else (schema, label))
+
+        if not any_projected:
+            raise ValueError(f'Field mask path ({path.rstrip(".")}) goes into a value without fields.')
+        return projected
@@ -1,14 +1,20 @@
+import threading
+import time
+import types
 import typing
-from typing import Any, get_args, get_origin, TypeVar, Iterable, TYPE_CHECKING, Type
+from typing import Any, get_args, get_origin, TypeVar, Iterable, TYPE_CHECKING, Type, Callable, Annotated, Union
 
 from pydantic import BaseModel
 
-from pydantic._internal._model_construction import ModelMetaclass
+from pydantic._internal._model_construction import ModelMetaclass, build_lenient_weakvaluedict
+from pydantic._internal._typing_extra import parent_frame_namespace
 from pydantic.fields import FieldInfo
 from pydantic_core import PydanticUndefined
 from xsentinels import Default
 from xsentinels.default import DefaultType
 
+from . import stats
+from .cache import LRUCache
 from .config import PartialConfigDict
 from .sentinels import Missing, MissingType, AutoPartialExcludeMarker
 
@@ -18,10 +24,210 @@ if TYPE_CHECKING:
     from .partial import PartialModel
 
 
+parametrized_cache: LRUCache[type] = LRUCache(maxsize=512)
+""" Keeps the most recently created parametrizations of generic partial models (ie: `Page[int]`) alive, see
+    `pydantic_partials.cache.LRUCache.cache_info` for statistics.
+
+    Pydantic caches the parametrizations itself, but only while something else references them; so one that is
+    only used in passing (ie: `Page[int].model_validate(...)`) would be created (and built) again the next time.
+
+    Looking up a parametrization is answered by Pydantic's cache and never gets here (wrapping `__class_getitem__`
+    would change the frames Pydantic looks up the caller's namespace in), so they are let go first-in first-out:
+    in the order they were created, not by when they were last used. One that is still referenced elsewhere stays
+    alive regardless, and one that was let go is only created again the next time it's used.
+"""
+
+
 def _exclude_if_missing(v):
     return v is Missing
 
 
+_exclude_if_missing.__partial_exclude_if_missing__ = True  # type: ignore
+
+
+def _user_exclude_ifs(exclude_if: Callable[[Any], bool] | None) -> tuple[Callable[[Any], bool], ...]:
+    """ Returns the user's own `exclude_if` checks of a field, without our `Missing` check (see `_combined_exclude_if`).
+    """
+    if exclude_if is None or getattr(exclude_if, '__partial_exclude_if_missing__', False):
+        return ()
+    return getattr(exclude_if, '__partial_user_exclude_ifs__', (exclude_if,))
+
+
+def _combined_exclude_if(
+        user_exclude_ifs: tuple[Callable[[Any], bool], ...],
+        exclude_if_missing: Callable[[Any], bool] | None,
+) -> Callable[[Any], bool]:
+    """ Returns one `exclude_if` check that excludes a value if it's `Missing` (when `exclude_if_missing` is given)
+        or any of the `user_exclude_ifs` do; it keeps them (see `_user_exclude_ifs`) so subclasses can combine them
+        again from scratch, calling it always takes the same number of nested calls.
+    """
+    if len(user_exclude_ifs) == 1:
+        [user_exclude_if] = user_exclude_ifs
+        if exclude_if_missing is _exclude_if_missing:
+            def combined_exclude_if(v):
+                return v is Missing or user_exclude_if(v)
+        else:
+            def combined_exclude_if(v):
+                return exclude_if_missing(v) or user_exclude_if(v)
+    else:
+        def combined_exclude_if(v):
+            if exclude_if_missing is not None and exclude_if_missing(v):
+                return True
+            for user_exclude_if in user_exclude_ifs:
+                if user_exclude_if(v):
+                    return True
+            return False
+
+    combined_exclude_if.__partial_user_exclude_ifs__ = user_exclude_ifs  # type: ignore
+    return combined_exclude_if
+
+
+def _omit_missing_values(obj: BaseModel):
+    """ Removes any `Missing` values from the object's `__dict__`, used with `missing_omission='native'`.
+        Pydantic-core skips fields that are not in the `__dict__` when serializing,
+        and `pydantic_partials.partial.PartialModel.__getattr__` will return `Missing` for them.
+    """
+    values = obj.__dict__
+    if any(v is Missing for v in values.values()):
+        object.__setattr__(obj, '__dict__', {k: v for k, v in values.items() if v is not Missing})
+
+
+def _restore_field_order(obj: BaseModel):
+    """ Puts the `__dict__` of an object using `missing_omission='native'` back in the order of the fields,
+        after fields that were `Missing` (so not in it) were set; so they are serialized in the same order
+        as with `missing_omission='exclude_if'`.
+    """
+    positions = type(obj).__partial_field_positions__  # type: ignore
+    values = obj.__dict__
+    last = -1
+    for k in values:
+        position = positions[k]
+        if position < last:
+            names = sorted(values, key=positions.__getitem__)
+            object.__setattr__(obj, '__dict__', {k: values[k] for k in names})
+            return
+        last = position
+
+
+def _omit_missing_after_validation(obj: BaseModel):
+    """ Like `_omit_missing_values`, but only looks at the fields that can be present; which is a lot less work
+        for wide models with few fields set (ie: PATCH payloads).
+
+        A partial field can only have a value other than `Missing` after validation (or `model_construct`)
+        if it was set, or if it gets a value from its default (see `__partial_default_present__`).
+    """
+    cls = type(obj)
+    values = obj.__dict__
+    bits = cls.__partial_field_bits__  # type: ignore
+    names = [k for k in cls.__partial_kept_fields__ if k in values]  # type: ignore
+    for k in obj.__pydantic_fields_set__ | cls.__partial_default_present__:  # type: ignore
+        if k in bits and values.get(k, Missing) is not Missing:
+            names.append(k)
+
+    if len(names) != len(values):
+        names.sort(key=cls.__partial_field_positions__.__getitem__)  # type: ignore
+        object.__setattr__(obj, '__dict__', {k: values[k] for k in names})
+
+
+def _omit_missing_post_init(original_post_init):
+    """ Wraps the `model_post_init` of a class using `missing_omission='native'`,
+        so `Missing` values are omitted from the `__dict__` right after validation.
+    """
+    call_original = original_post_init is not BaseModel.model_post_init
+
+    def model_post_init(self, context: Any, /) -> None:
+        _omit_missing_after_validation(self)
+        if call_original:
+            original_post_init(self, context)
+
+    model_post_init.__partial_omit_missing__ = True  # type: ignore
+    model_post_init.__wrapped__ = original_post_init  # type: ignore
+    return model_post_init
+
+
+_deep_partials_state = threading.local()
+
+
+def _deep_partials_building() -> dict[Any, type]:
+    """ The deep partial classes currently being created by this thread (used for self-referencing models).
+
+        Keys are the partial classes themselves, along with the `pydantic_partials.factory.partial_of` cache keys
+        of any being created via `partial_of`.
+    """
+    building = getattr(_deep_partials_state, 'building', None)
+    if building is None:
+        building = _deep_partials_state.building = {}
+    return building
+
+
+def _is_deep_partial(model: type) -> bool:
+    if not isinstance(model, PartialMeta):
+        return False
+    config = model.model_config  # type: ignore
+    return config.get('auto_partials') is True and config.get('deep_partials', False)
+
+
+def _deep_partial_type(type_: Any, missing_omission: str) -> Any:
+    """ Returns `type_` with any Pydantic models in it replaced with their deep partial version
+        (from `pydantic_partials.factory.partial_of`, which also takes partial models that aren't deep partials);
+        looks inside unions, `Annotated` and generic types such as `list[...]` and `dict[...]`.
+    """
+    if isinstance(type_, type):
+        if not issubclass(type_, BaseModel) or _is_deep_partial(type_):
+            return type_
+
+        from .factory import partial_of
+        return partial_of(
+            type_, deep_partials=True, missing_omission='native' if missing_omission == 'native' else Default
+        )
+
+    args = get_args(type_)
+    if not args:
+        return type_
+
+    new_args = tuple(_deep_partial_type(a, missing_omission) for a in args)
+    if all(new is old for new, old in zip(new_args, args)):
+        return type_
+
+    origin = get_origin(type_)
+    if origin is Annotated:
+        return Annotated[(new_args[0], *type_.__metadata__)]  # type: ignore
+    if origin is Union or origin is types.UnionType:
+        return Union[new_args]
+    if isinstance(type_, types.GenericAlias):
+        return types.GenericAlias(origin, new_args)
+    if hasattr(type_, 'copy_with'):
+        # The `typing` module generic aliases (ie: `typing.List[...]`).
+        return type_.copy_with(new_args)
+    return type_
+
+
+def _configured_defer_build(
+        bases: tuple[type, ...], namespaces: dict[str, Any], kwargs: dict[str, Any]
+) -> bool | DefaultType:
+    """ Returns the `defer_build` config value the class would normally end up with,
+        following Pydantic's precedence (class arguments, then `model_config`, then base classes).
+
+        Returns `Default` if it's not configured anywhere.
+    """
+    if 'defer_build' in kwargs:
+        return kwargs['defer_build']
+
+    namespace_config = namespaces.get('model_config')
+    if namespace_config is None and (config_class := namespaces.get('Config')) is not None:
+        namespace_config = {k: v for k, v in vars(config_class).items() if not k.startswith('__')}
+
+    if namespace_config and 'defer_build' in namespace_config:
+        return namespace_config['defer_build']
+
+    for base in reversed(bases):
+        base_config = getattr(base, 'model_config', None)
+        if base_config and 'defer_build' in base_config:
+            return base_config['defer_build']
+
+    return Default
+
+
 # metaclass to make all fields in a model optional, useful for PATCH requests
 class PartialMeta(ModelMetaclass):
     """ Metaclass of `pydantic_partials.partial.PartialModel`, used to support partial fields,
@@ -41,6 +247,12 @@ class PartialMeta(ModelMetaclass):
         be unioned with MissingType.
     """
 
+    model_partial_field_index: typing.ClassVar[tuple[str, ...]]
+    """ The `model_partial_fields`, in the same order as the model fields.
+        The position of a field is its bit in a present fields bitmask
+        (see `pydantic_partials.partial.PartialModel.model_present_mask`).
+    """
+
     config_dict: typing.ClassVar[PartialConfigDict]
     """ Adding some extra/new config options on-top of the already pre-existing Pydantic ones.
         Seemed like a good place to put them, as it deals with configuration of the class model behavior.
@@ -49,18 +261,26 @@ class PartialMeta(ModelMetaclass):
     def __new__(
             cls,
             name: str,
-            bases: tuple[type],
+            bases: tuple[type, ...],
             namespaces: dict[str, Any],
             *,
 
             auto_partials: bool | DefaultType = Default,
             auto_partials_exclude: Iterable[str] | DefaultType = Default,
+            missing_omission: typing.Literal['exclude_if', 'native'] | DefaultType = Default,
+            deep_partials: bool | DefaultType = Default,
+            track_dirty: bool | DefaultType = Default,
 
             # A private/internal detail for generic base subclasses that want to also change the fields,
-            # this prevents having to rebuild the class a second time; if this is True then the subclass
-            # is responsible for calling rebuild when finished.
+            # this prevents having to rebuild the class a second time; if this is True then the class is left
+            # unbuilt and the subclass is responsible for calling `model_rebuild()` when finished
+            # (otherwise Pydantic will build it the first time it's needed).
             ___PartialMeta__delay_rebuild: bool = False,
 
+            # A private/internal detail for `pydantic_partials.factory.partial_of`, called with the class
+            # as soon as it's created (before any of its fields are made into deep partials).
+            ___PartialMeta__on_created: Callable[[type], None] | None = None,
+
             **kwargs
     ):
         """
@@ -88,15 +308,56 @@ class PartialMeta(ModelMetaclass):
                 You can also use `pydantic_partials.partial.AutoPartialExclude` to more easily mark fields as excluded.
                 For more details see `pydantic_partials.config.PartialConfigDict.auto_partials_exclude`.
 
+            missing_omission: How `Missing` values are omitted when serializing,
+                for more details see `pydantic_partials.config.PartialConfigDict.missing_omission`.
+                If `Default`: Inherit behavior from parent/model_config; otherwise defaults to `'exclude_if'`.
+
+            deep_partials: If `True`, any Pydantic models used by partial fields are also made into (deep) partials,
+                for more details see `pydantic_partials.config.PartialConfigDict.deep_partials`.
+                If `Default`: Inherit behavior from parent/model_config; otherwise defaults to `False`.
+
+            track_dirty: If `True`, assignments that change the value of a field are recorded,
+                for more details see `pydantic_partials.config.PartialConfigDict.track_dirty`.
+                If `Default`: Inherit behavior from parent/model_config; otherwise defaults to `False`.
+
             **kwargs: Passed along other class arguments to Pydantic and any __init_subclass__ methods.
         """
+        # If we are created while another deep partial class is still being created (ie: for one of its fields),
+        # our schema build is left for later; as the other class is not finished yet.
+        started = time.perf_counter() if stats.stats_enabled() else None
+
+        building_deep_partials = _deep_partials_building()
+        nested_in_deep_partial = bool(building_deep_partials)
+
+        # Pydantic would normally build the core schema while creating the class, before we get a chance to add
+        # the `MissingType` annotations, `Missing` defaults and `exclude_if` hooks to the fields.
+        # So we have Pydantic defer its build, make our changes and then build the schema only once (at the end).
+        defer_build = _configured_defer_build(bases, namespaces, kwargs)
+        kwargs['defer_build'] = True
+
+        # Pydantic would capture our own frame as the parent namespace (for resolving forward references),
+        # so we capture the frame of whoever is creating the class instead.
+        if kwargs.pop('__pydantic_reset_parent_namespace__', True):
+            namespaces['__pydantic_parent_namespace__'] = build_lenient_weakvaluedict(parent_frame_namespace())
+
         # Create the class first...
-        cls: 'Type[PartialModel]' = super().__new__(cls, name, bases, namespaces, **kwargs)  # type: ignore
+        cls: 'Type[PartialModel]' = super().__new__(  # type: ignore
+            cls, name, bases, namespaces, __pydantic_reset_parent_namespace__=False, **kwargs
+        )
 
         model_config: PartialConfigDict = cls.model_config  # type: ignore
 
+        # Put back the real `defer_build` value, so it's what subclasses will inherit.
+        if defer_build is Default:
+            model_config.pop('defer_build', None)
+        else:
+            model_config['defer_build'] = bool(defer_build)
+
+        if ___PartialMeta__on_created:
+            ___PartialMeta__on_created(cls)
+
         # We now have the fields Pydantic found and can now easily add our MissingType's as needed.
-        # Then a model_rebuild is forced to update the class schema to include the MissingType/LazyType annotations,
+        # Then the class schema is built, which will include the MissingType annotations
         # and any needed changes to the field default value.
 
         if auto_partials is not Default:
@@ -105,11 +366,36 @@ class PartialMeta(ModelMetaclass):
         if auto_partials_exclude:
             model_config['auto_partials_exclude'] = set(auto_partials_exclude)  # type: ignore
 
+        if missing_omission is not Default:
+            model_config['missing_omission'] = missing_omission  # type: ignore
+
+        final_missing_omission = model_config.get('missing_omission', 'exclude_if')
+        if final_missing_omission not in ('exclude_if', 'native'):
+            raise ValueError(
+                f"Invalid/Unknown `missing_omission` config value ({final_missing_omission}), "
+                f"use 'exclude_if' or 'native'."
+            )
+        omit_natively = final_missing_omission == 'native'
+        cls.__partial_omit_natively__ = omit_natively  # type: ignore
+
+        if deep_partials is not Default:
+            model_config['deep_partials'] = bool(deep_partials)
+        final_deep_partials = model_config.get('deep_partials', False)
+
+        if track_dirty is not Default:
+            model_config['track_dirty'] = bool(track_dirty)
+        cls.__partial_track_dirty__ = model_config.get('track_dirty', False)  # type: ignore
+        # Until an object of the class caches its `model_present_mask`, assignments only need Pydantic's own
+        # `__setattr__` (unless tracking dirty fields or omitting natively); see `PartialModel.__setattr__`.
+        cls.__partial_masks_cached__ = False  # type: ignore
+        cls.__partial_plain_setattr__ = not (cls.__partial_track_dirty__ or omit_natively)  # type: ignore
+
         # Inherit any pre-existing `auto_partials_exclude` items.
         # For now if someone wants to override this, they can simply manually do this on subclass:
         #     `field_name: Partial[...]`
         # I might consider a simple way to inform us to not inherit excludes, but for now keeping things simple.
-        final_auto_exclude = model_config.get('auto_partials_exclude', set())
+        # Copy it, the config set is shared with the parent class config it was inherited from.
+        final_auto_exclude = set(model_config.get('auto_partials_exclude', ()))
         for c in cls.__mro__:  # type: ignore
             parent_config: PartialConfigDict | None = getattr(c, 'model_config', None)
             if not parent_config:
@@ -117,8 +403,6 @@ class PartialMeta(ModelMetaclass):
 
             final_auto_exclude.update(parent_config.get('auto_partials_exclude', set()))
 
-        need_rebuild = False
-
         partial_fields = set()
         for k, v in cls.model_fields.items():  # type: ignore
             field_type = v.annotation
@@ -161,28 +445,93 @@ class PartialMeta(ModelMetaclass):
                 if v.default is PydanticUndefined and v.default_factory is None:
                     v.annotation = v.annotation | MissingType
                     partial_fields.add(k)
-                    need_rebuild = True
 
         fields: dict[str, FieldInfo] = cls.model_fields  # type: ignore
+        if final_deep_partials:
+            # Fields with a default are not made partial, but the models they use still become partials
+            # (unless excluded from auto partials).
+            deep_fields = set(partial_fields)
+            if final_partial_auto:
+                deep_fields.update(k for k in fields if k not in final_auto_exclude)
+
+            building_deep_partials[cls] = cls
+            try:
+                for k in deep_fields:
+                    fields[k].annotation = _deep_partial_type(fields[k].annotation, final_missing_omission)
+            finally:
+                del building_deep_partials[cls]
+
+        # While stats are enabled, use a check that also counts how often it's called for this class.
+        exclude_if_missing = _exclude_if_missing if started is None else stats._counting_exclude_if_missing(cls)
+        # Fields with the same `exclude_if` checks of their own share one combined check.
+        combined_exclude_ifs: dict[tuple[int, ...], Callable[[Any], bool]] = {}
         for k in partial_fields:
             v = fields[k]
             if v.default is PydanticUndefined and v.default_factory is None:
                 v.default = Missing
-                need_rebuild = True
 
-            if existing_exclude_if := v.exclude_if:
-                # Execute ours and their exclude if, if either returns `True`, then exclude it.
-                def combine_ignore_missing_check_with_existing_exclude_if(x, existing_exclude_if=existing_exclude_if):
-                    return _exclude_if_missing(x) or existing_exclude_if(x)
-                v.exclude_if = combine_ignore_missing_check_with_existing_exclude_if
+            # Inherited fields come with the check we gave them in the parent class, so only the user's own
+            # checks are kept from it (flattened); otherwise it would nest one more call deep for each subclass.
+            # Native omission leaves Missing values out of the `__dict__` instead, so it needs no check of ours.
+            user_exclude_ifs = _user_exclude_ifs(v.exclude_if)
+            missing_check = None if omit_natively else exclude_if_missing
+            if not user_exclude_ifs:
+                v.exclude_if = missing_check
+            elif missing_check is None and len(user_exclude_ifs) == 1:
+                v.exclude_if = user_exclude_ifs[0]
             else:
-                # Otherwise, we only have our method so directly set it.
-                v.exclude_if = _exclude_if_missing
-                need_rebuild = True
+                checks_key = tuple(map(id, user_exclude_ifs))
+                combined = combined_exclude_ifs.get(checks_key)
+                if combined is None:
+                    combined = combined_exclude_ifs[checks_key] = _combined_exclude_if(user_exclude_ifs, missing_check)
+                v.exclude_if = combined
 
         cls.model_partial_fields = partial_fields
-
-        if need_rebuild and not ___PartialMeta__delay_rebuild:
-            cls.model_rebuild(force=True)  # type: ignore
+        cls.model_partial_field_index = tuple(k for k in cls.model_fields if k in partial_fields)  # type: ignore
+        cls.__partial_field_bits__ = {k: 1 << i for i, k in enumerate(cls.model_partial_field_index)}  # type: ignore
+        cls.__partial_mask_fields__ = {}  # type: ignore
+        # Partial fields that can be present without being explicitly set (they have a default that is not `Missing`,
+        # or a validator that may replace the `Missing` default).
+        validate_defaults = model_config.get('validate_default', False)
+        cls.__partial_default_present__ = frozenset(  # type: ignore
+            k for k in partial_fields
+            if fields[k].default is not Missing or fields[k].default_factory is not None
+            or validate_defaults or fields[k].validate_default
+        )
+        cls.__partial_kept_fields__ = tuple(k for k in fields if k not in partial_fields)  # type: ignore
+        cls.__partial_field_positions__ = {k: i for i, k in enumerate(fields)}  # type: ignore
+
+        # Pydantic calls `model_post_init` after validating, which is where `Missing` values get omitted
+        # when using native omission; only wrap it once per class, and unwrap it if a subclass turns it off.
+        post_init = cls.model_post_init  # type: ignore
+        omitting_in_post_init = getattr(post_init, '__partial_omit_missing__', False)
+        if omit_natively and not omitting_in_post_init:
+            cls.model_post_init = _omit_missing_post_init(post_init)  # type: ignore
+            cls.__pydantic_post_init__ = 'model_post_init'
+        elif not omit_natively and omitting_in_post_init:
+            cls.model_post_init = post_init.__wrapped__  # type: ignore
+            if cls.model_post_init is BaseModel.model_post_init:  # type: ignore
+                cls.__pydantic_post_init__ = None  # type: ignore
+
+        # This is the one and only schema build for the class (unless building was deferred, in which case
+        # Pydantic will build it the first time the schema/validator/serializer is needed).
+        # If something already built it while Pydantic was creating the class (ie: a `__pydantic_init_subclass__`
+        # getting the JSON schema), that schema doesn't have the partial fields, so it's built again.
+        delay_rebuild = ___PartialMeta__delay_rebuild or (final_deep_partials and nested_in_deep_partial)
+        built_early = cls.__pydantic_complete__  # type: ignore
+        if built_early or (not delay_rebuild and not model_config.get('defer_build')):
+            cls.model_rebuild(force=built_early, raise_errors=False, _parent_namespace_depth=0)  # type: ignore
+
+        generic_origin = cls.__pydantic_generic_metadata__['origin']  # type: ignore
+        if generic_origin is not None:
+            try:
+                key = (generic_origin, cls.__pydantic_generic_metadata__['args'])  # type: ignore
+                parametrized_cache.get_or_create(key, lambda: cls)
+            except TypeError:
+                # Parametrized with unhashable values, Pydantic doesn't cache these either.
+                pass
+
+        if started is not None:
+            stats._record_class_creation(cls, started, len(partial_fields))
         return cls
 
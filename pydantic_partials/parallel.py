@@ -0,0 +1,160 @@
+""" Validating very large batches of partial model payloads across a pool of processes
+    (see `pydantic_partials.partial.PartialModel.model_validate_sharded`).
+
+    Validation is CPU bound, so within one process it's limited to one core by the GIL. Here the payloads are split
+    into shards, each shard is validated in one of the worker processes (its Python payloads in one pydantic-core
+    call, like `model_validate_many`; each JSON payload on its own), and the results are sent back and put together
+    in the same order as the payloads.
+
+    Everything sent to/from the workers is pickled: the model class (by reference, so it needs to be importable
+    by name from its module, unlike the ones made by `partial_of`), the payloads, the `context` and the results.
+"""
+import gc
+import pickle
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Iterator, NamedTuple, Sequence, get_args
+
+from pydantic import BaseModel, ValidationError
+from pydantic_core import PydanticCustomError
+from pydantic_core.core_schema import ErrorType
+
+DEFAULT_SHARD_SIZE = 2_000
+""" Default number of payloads validated by each task sent to a worker process. """
+
+_ERROR_TYPES = frozenset(get_args(ErrorType))
+
+
+class _ItemError(NamedTuple):
+    """ Why a payload failed validation, sent back by a worker instead of the `ValidationError` itself
+        (which can't always be pickled, ie: errors raised by validators as a `PydanticCustomError`).
+    """
+    details: list[dict[str, Any]]
+    input_type: str
+
+
+def validate_sharded(
+        cls: type[BaseModel],
+        payloads: Sequence[Any],
+        *,
+        strict: bool | None,
+        context: Any | None,
+        collect_errors: bool,
+        dump: bool,
+        executor: Executor | None,
+        max_workers: int | None,
+        shard_size: int,
+) -> list[Any]:
+    """ Validates `payloads` with `cls` in the worker processes of `executor` (or of a new `ProcessPoolExecutor`
+        with `max_workers`, that is shut down when done), `shard_size` payloads at a time.
+        See `pydantic_partials.partial.PartialModel.model_validate_sharded`.
+    """
+    if shard_size < 1:
+        raise ValueError(f'The `shard_size` must be at least 1, got ({shard_size}).')
+
+    shards = [payloads[start:start + shard_size] for start in range(0, len(payloads), shard_size)]
+    if executor is not None:
+        results = _run_shards(executor, cls, shards, strict, context, dump)
+    elif len(shards) <= 1:
+        # Not worth starting worker processes for.
+        results = [_validate_shard(cls, shard, strict, context, dump) for shard in shards]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            results = _run_shards(pool, cls, shards, strict, context, dump)
+
+    items = [item for shard_results in results for item in shard_results]
+    errors = [(i, item) for i, item in enumerate(items) if isinstance(item, _ItemError)]
+    if not errors:
+        return items
+
+    if collect_errors:
+        for i, error in errors:
+            items[i] = ValidationError.from_exception_data(
+                cls.__name__, error.details, input_type=error.input_type  # type: ignore[arg-type]
+            )
+        return items
+
+    # A single error for the whole batch, like `model_validate_many`.
+    details = [{**detail, 'loc': (i, *detail['loc'])} for i, error in errors for detail in error.details]
+    raise ValidationError.from_exception_data(f'list[{cls.__name__}]', details)  # type: ignore[arg-type]
+
+
+def _run_shards(
+        executor: Executor, cls: type[BaseModel], shards: list[Sequence[Any]], strict: bool | None,
+        context: Any | None, dump: bool,
+) -> list[list[Any]]:
+    futures = [executor.submit(_validate_shard_pickled, cls, shard, strict, context, dump) for shard in shards]
+    try:
+        return [_unpickle_results(future.result()) for future in futures]
+    finally:
+        for future in futures:
+            future.cancel()
+
+
+def _validate_shard_pickled(
+        cls: Any, payloads: Sequence[Any], strict: bool | None, context: Any | None, dump: bool
+) -> bytes:
+    # Pickled here so they can be unpickled by `_unpickle_results` (instead of by the executor).
+    return pickle.dumps(_validate_shard(cls, payloads, strict, context, dump), protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _unpickle_results(data: bytes) -> list[Any]:
+    # Unpickling creates a lot of objects at once, which would trigger the garbage collector over and over again
+    # (more than doubling the time it takes); none of them can be garbage yet, so it's paused meanwhile.
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return pickle.loads(data)
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+
+def _validate_shard(
+        cls: Any, payloads: Sequence[Any], strict: bool | None, context: Any | None, dump: bool
+) -> list[Any]:
+    """ Runs in a worker process, returns the instances (or their `model_dump`) for each of the `payloads`,
+        or an `_ItemError` for the ones that are not valid.
+    """
+    is_json = [isinstance(payload, (str, bytes, bytearray)) for payload in payloads]
+    # Python payloads are validated together (one at a time only if one of them is not valid); JSON payloads are
+    # always validated on their own, joining them into one JSON array would let a payload run into the next ones
+    # (ie: `{"name": "x` and `y"}`).
+    python_payloads = [payload for payload, payload_is_json in zip(payloads, is_json) if not payload_is_json]
+    python_results: Iterator[Any] = iter(())
+    if python_payloads:
+        try:
+            validated = cls.model_validate_many(python_payloads, strict=strict, context=context)
+        except ValidationError:
+            validated = cls.model_validate_many(python_payloads, strict=strict, context=context, collect_errors=True)
+        python_results = iter(validated)
+
+    results: list[Any] = []
+    for payload, payload_is_json in zip(payloads, is_json):
+        if payload_is_json:
+            try:
+                result = cls.model_validate_json(payload, strict=strict, context=context)
+            except ValidationError as e:
+                result = e
+        else:
+            result = next(python_results)
+
+        if isinstance(result, ValidationError):
+            result = _ItemError(_error_details(result), 'json' if payload_is_json else 'python')
+        elif dump:
+            result = result.model_dump()
+        results.append(result)
+    return results
+
+
+def _error_details(error: ValidationError) -> list[dict[str, Any]]:
+    """ Returns the errors of `error`, in the form `ValidationError.from_exception_data` takes. """
+    details = []
+    for e in error.errors(include_url=False):
+        detail = {'type': e['type'], 'loc': e['loc'], 'input': e['input']}
+        if e['type'] not in _ERROR_TYPES:
+            # Raised by a validator, its message is already formatted.
+            detail['type'] = PydanticCustomError(e['type'], e['msg'])
+        elif 'ctx' in e:
+            detail['ctx'] = e['ctx']
+        details.append(detail)
+    return details
@@ -1,11 +1,33 @@
+import asyncio
+import collections
+import functools
+import time
 import typing
-from typing import Any, TypeVar, Annotated, TypeAlias
+from concurrent.futures import Executor
+from itertools import repeat
+from operator import countOf
+from typing import (
+    Any, TypeVar, Annotated, TypeAlias, TYPE_CHECKING, Mapping, Iterable, Iterator, Literal, Union, BinaryIO, overload,
+    AsyncIterable, AsyncIterator, Sequence,
+)
 
-from pydantic import BaseModel
+from typing_extensions import Self
 
+from pydantic import BaseModel, ConfigDict, Field, GetJsonSchemaHandler, TypeAdapter, ValidationError
+from pydantic.json_schema import DEFAULT_REF_TEMPLATE, GenerateJsonSchema, JsonSchemaMode, JsonSchemaValue
+from pydantic_core import CoreSchema, to_json
+from pydantic._internal._namespace_utils import MappingNamespace
+
+from . import schema_cache, stats
 from .config import PartialConfigDict
-from .meta import PartialMeta
+from .meta import PartialMeta, _omit_missing_values, _restore_field_order
 from .sentinels import Missing, MissingType, AutoPartialExcludeMarker
+from .stream import DEFAULT_CHUNK_SIZE, DEFAULT_OFFLOAD_SIZE, aiter_json_items, iter_ndjson_lines, batched
+from .construct import construct_many_trusted, construct_trusted
+from .json_schema import cached_json_schema, without_missing_defaults
+from .mask import FieldMask, compile_mask
+from .parallel import DEFAULT_SHARD_SIZE, validate_sharded
+from .patch import apply_patch, apply_patches, diff_models, diff_many_models, values_differ
 
 from logging import getLogger
 
@@ -18,10 +40,57 @@ Partial: TypeAlias = PM | MissingType
     assigned to it. 
 """
 
+M = TypeVar('M', bound=BaseModel)
+
 PME = TypeVar('PME')
 AutoPartialExclude = Annotated[PME, AutoPartialExcludeMarker]
 
 
+def _list_adapter(cls: type[BaseModel], *, collect_errors: bool = False) -> TypeAdapter[list]:
+    """ Returns a `TypeAdapter` for a list of `cls`, created once per class (subclasses get their own).
+
+        With `collect_errors`, each item that fails validation is returned as-is instead of raising an error.
+    """
+    adapters = cls.__dict__.get('__partial_list_adapters__')
+    if adapters is None:
+        adapters = {}
+        setattr(cls, '__partial_list_adapters__', adapters)
+
+    adapter = adapters.get(collect_errors)
+    if adapter is None:
+        if collect_errors:
+            # Same title as the plain adapter, for any error not about a specific item (ie: invalid JSON).
+            item_type: Any = Annotated[Union[cls, Any], Field(union_mode='left_to_right')]
+            adapter = TypeAdapter(list[item_type], config=ConfigDict(title=f'list[{cls.__name__}]'))
+        else:
+            adapter = TypeAdapter(list[cls])  # type: ignore[valid-type]
+        adapters[collect_errors] = adapter
+    return adapter
+
+
+def _validate_json_lines(
+        cls: type[BaseModel], lines: Iterable[bytes], *, strict: bool | None, context: Any | None, collect_errors: bool
+) -> Iterator[Any]:
+    for line in lines:
+        try:
+            yield cls.model_validate_json(line, strict=strict, context=context)
+        except ValidationError as e:
+            if not collect_errors:
+                raise
+            yield e
+
+
+def _validate_json_item(
+        cls: type[BaseModel], item: bytes, *, strict: bool | None, context: Any | None, collect_errors: bool
+) -> Any:
+    try:
+        return cls.model_validate_json(item, strict=strict, context=context)
+    except ValidationError as e:
+        if not collect_errors:
+            raise
+        return e
+
+
 class PartialModel(
     BaseModel,
 
@@ -38,12 +107,822 @@ class PartialModel(
         - If `False`: User needs to mark individual fields as `Partial` where they want.
     """
 
+    # The present fields bitmask (see `model_present_mask`), only set once it's first asked for;
+    # and the dirty fields (see `model_dirty_fields`), only set once a field is changed.
+    __slots__ = ('__partial_present_mask__', '__partial_dirty__')
+    if TYPE_CHECKING:
+        __partial_present_mask__: int
+        __partial_dirty__: set[str]
+
     config_dict: typing.ClassVar[PartialConfigDict]
 
     def __init__(self, *args, **kwargs):
         """ Pydantic partial model class, with ability to easily dynamically omit fields when serializing a model.
         """
         super().__init__(*args, **kwargs)
+        if type(self).__partial_masks_cached__:  # type: ignore[attr-defined]
+            # `__init__` can be called again on an existing object, which replaces all of its values.
+            self._model_reset_present_fields()
+
+    if not TYPE_CHECKING:
+        # In an `if not TYPE_CHECKING` block (like Pydantic), so type checkers still report unknown attributes.
+
+        def __getattr__(self, item: str) -> Any:
+            # With `missing_omission='native'`, fields with a `Missing` value are left out of the `__dict__`.
+            if item in type(self).model_partial_fields:
+                return Missing
+            return super().__getattr__(item)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        # The class flags (see `PartialMeta`) are read through `self`, which is quicker than through the class.
+        if self.__partial_plain_setattr__:  # type: ignore[attr-defined]
+            # Nothing else to keep up to date (the usual case).
+            super().__setattr__(name, value)
+            return
+
+        tracking_dirty = self.__partial_track_dirty__  # type: ignore[attr-defined]
+        if tracking_dirty:
+            old_value = self.__dict__.get(name, Missing)
+
+        omit_natively = self.__partial_omit_natively__  # type: ignore[attr-defined]
+        was_stored = omit_natively and name in self.__dict__
+        super().__setattr__(name, value)
+        if omit_natively:
+            if value is Missing:
+                self.__dict__.pop(name, None)
+            elif not was_stored and name in self.__dict__:
+                # Set for the first time, so it went at the end of the `__dict__`.
+                _restore_field_order(self)
+
+        bit = self.__partial_field_bits__.get(name) if self.__partial_masks_cached__ else None  # type: ignore
+        if bit is not None and (mask := _get_present_mask(self)) is not None:
+            # The value may have been changed by validation, so check the value that was actually stored.
+            mask = mask & ~bit if self.__dict__.get(name, Missing) is Missing else mask | bit
+            object.__setattr__(self, '__partial_present_mask__', mask)
+
+        if tracking_dirty and name in type(self).__pydantic_fields__:
+            if values_differ(old_value, self.__dict__.get(name, Missing)):
+                dirty = _get_dirty(self)
+                if dirty is None:
+                    object.__setattr__(self, '__partial_dirty__', {name})
+                else:
+                    dirty.add(name)
+
+    def __delattr__(self, item: str) -> None:
+        super().__delattr__(item)
+        if item in type(self).__partial_field_bits__:  # type: ignore[attr-defined]
+            self._model_reset_present_fields()
+
+    def _model_reset_present_fields(self) -> None:
+        """ Forgets the cached `model_present_mask`, for when the `__dict__` is changed directly. """
+        if type(self).__partial_masks_cached__ and _get_present_mask(self) is not None:  # type: ignore[attr-defined]
+            object.__delattr__(self, '__partial_present_mask__')
+
+    @property
+    def model_present_mask(self) -> int:
+        """ Bitmask of the partial fields that are not `Missing`, the bit of each field is its position in
+            `model_partial_field_index`.
+
+            It's worked out the first time it's asked for, and then kept up to date as attributes are set;
+            so it's cheap to get it again (for instance, to check which fields a patch carries).
+        """
+        try:
+            return _present_mask_slot.__get__(self)
+        except AttributeError:
+            pass
+
+        cls = type(self)
+        bits: dict[str, int] = cls.__partial_field_bits__  # type: ignore[attr-defined]
+        values = self.__dict__
+        if cls.__partial_omit_natively__:  # type: ignore[attr-defined]
+            # `Missing` values are not stored, so every field in the `__dict__` is present.
+            mask = sum(bits[k] for k in bits.keys() & values.keys())
+        else:
+            # Usually only fields that were set (or have a default that is not `Missing`) can be present.
+            candidates = bits.keys() & (self.__pydantic_fields_set__ | cls.__partial_default_present__)  # type: ignore
+            mask = sum(bits[k] for k in candidates if values.get(k, Missing) is not Missing)
+
+            # But the fields set can leave out fields that have a value (ie: `model_construct` with `_fields_set`);
+            # if the number of partial fields that are not `Missing` doesn't match, every field is checked.
+            kept: tuple[str, ...] = cls.__partial_kept_fields__  # type: ignore[attr-defined]
+            kept_present = len(kept) - countOf(map(values.get, kept, repeat(Missing)), Missing)
+            if mask.bit_count() != len(values) - countOf(values.values(), Missing) - kept_present:
+                mask = sum(bit for k, bit in bits.items() if values.get(k, Missing) is not Missing)
+        object.__setattr__(self, '__partial_present_mask__', mask)
+        if not cls.__partial_masks_cached__:  # type: ignore[attr-defined]
+            # From now on assignments keep the cached masks of the objects of this class up to date.
+            cls.__partial_masks_cached__ = True  # type: ignore[attr-defined]
+            cls.__partial_plain_setattr__ = False  # type: ignore[attr-defined]
+        return mask
+
+    @property
+    def model_present_fields(self) -> frozenset[str]:
+        """ The partial fields that are not `Missing`; from `model_present_mask`, so it's cheap to get. """
+        return type(self).model_fields_for_mask(self.model_present_mask)
+
+    @property
+    def model_dirty_fields(self) -> frozenset[str]:
+        """ The fields changed since the model was created (or since `model_reset_dirty`), by assignments that
+            actually changed their value; only recorded with `track_dirty` (always empty otherwise),
+            for more details see `pydantic_partials.config.PartialConfigDict.track_dirty`.
+        """
+        dirty = _get_dirty(self)
+        return frozenset(dirty) if dirty else frozenset()
+
+    def model_reset_dirty(self, fields: Iterable[str] | None = None) -> None:
+        """ Forgets the changes to `fields` (all fields if `None`), ie: once they have been written back. """
+        dirty = _get_dirty(self)
+        if dirty is None:
+            return
+        if fields is None:
+            dirty.clear()
+        else:
+            dirty.difference_update(fields)
+
+    def model_dump_dirty(
+            self,
+            *,
+            mode: Literal['json', 'python'] | str = 'python',
+            by_alias: bool | None = None,
+            exclude_none: bool = False,
+            round_trip: bool = False,
+            warnings: bool | Literal['none', 'warn', 'error'] = True,
+    ) -> dict[str, Any]:
+        """ Like `model_dump`, but only with the `model_dirty_fields`; ie: to write back only what changed.
+            Fields that were changed to `Missing` are left out, like any other `Missing` value.
+        """
+        dirty = _get_dirty(self)
+        if not dirty:
+            return {}
+        return self.model_dump(
+            mode=mode, include=dirty, by_alias=by_alias, exclude_none=exclude_none, round_trip=round_trip,
+            warnings=warnings,
+        )
+
+    def _model_record_dirty(self, old_values: Mapping[str, Any]) -> None:
+        """ Records the fields whose value is no longer the same as their value in `old_values`. """
+        values = self.__dict__
+        changed = [name for name, old in old_values.items() if values_differ(old, values.get(name, Missing))]
+        if not changed:
+            return
+        dirty = _get_dirty(self)
+        if dirty is None:
+            object.__setattr__(self, '__partial_dirty__', set(changed))
+        else:
+            dirty.update(changed)
+
+    @classmethod
+    def model_fields_for_mask(cls, mask: int) -> frozenset[str]:
+        """ Returns the partial field names for the bits of `mask` (see `model_present_mask`),
+            recently used masks are cached.
+        """
+        cache: dict[int, frozenset[str]] = cls.__partial_mask_fields__  # type: ignore[attr-defined]
+        fields = cache.get(mask)
+        if fields is None:
+            if len(cache) >= _MASK_FIELDS_CACHE_SIZE:
+                cache.clear()
+            index = cls.model_partial_field_index
+            fields = cache[mask] = frozenset(index[i] for i in range(mask.bit_length()) if mask >> i & 1)
+        return fields
+
+    @overload
+    @classmethod
+    def model_validate_many(
+            cls,
+            objs: Iterable[Any],
+            *,
+            strict: bool | None = None,
+            from_attributes: bool | None = None,
+            context: Any | None = None,
+            collect_errors: Literal[False] = False,
+    ) -> list[Self]: ...
+
+    @overload
+    @classmethod
+    def model_validate_many(
+            cls,
+            objs: Iterable[Any],
+            *,
+            strict: bool | None = None,
+            from_attributes: bool | None = None,
+            context: Any | None = None,
+            collect_errors: Literal[True],
+    ) -> list[Self | ValidationError]: ...
+
+    @classmethod
+    def model_validate_many(
+            cls,
+            objs: Iterable[Any],
+            *,
+            strict: bool | None = None,
+            from_attributes: bool | None = None,
+            context: Any | None = None,
+            collect_errors: bool = False,
+    ) -> list[Self] | list[Self | ValidationError]:
+        """ Validates each object in `objs` like `model_validate` would, returning a list of model instances.
+
+            The whole list is validated by pydantic-core in one call (via a `TypeAdapter(list[cls])` that is
+            created once per class), instead of calling `model_validate` in a Python loop.
+
+            If `collect_errors` is `False` (default), a single `ValidationError` is raised for the whole batch,
+            with the index of each failed item at the start of the error locations.
+
+            If `collect_errors` is `True`, no error is raised for invalid items; instead the `ValidationError`
+            for each invalid item is put in the returned list, at the same position as the item.
+        """
+        if not collect_errors:
+            return _list_adapter(cls).validate_python(
+                objs, strict=strict, from_attributes=from_attributes, context=context
+            )
+
+        objs = list(objs)
+        results: list[Self | ValidationError] = _list_adapter(cls, collect_errors=True).validate_python(
+            objs, strict=strict, from_attributes=from_attributes, context=context
+        )
+        for i, (obj, result) in enumerate(zip(objs, results)):
+            # Items that failed validation are returned as-is (as are valid model instances, that are not
+            # revalidated), so validate those again on their own to get their `ValidationError`.
+            if result is obj or not isinstance(result, cls):
+                try:
+                    results[i] = cls.model_validate(
+                        obj, strict=strict, from_attributes=from_attributes, context=context
+                    )
+                except ValidationError as e:
+                    results[i] = e
+        return results
+
+    @overload
+    @classmethod
+    def model_validate_json_many(
+            cls,
+            json_data: str | bytes | bytearray,
+            *,
+            strict: bool | None = None,
+            context: Any | None = None,
+            collect_errors: Literal[False] = False,
+    ) -> list[Self]: ...
+
+    @overload
+    @classmethod
+    def model_validate_json_many(
+            cls,
+            json_data: str | bytes | bytearray,
+            *,
+            strict: bool | None = None,
+            context: Any | None = None,
+            collect_errors: Literal[True],
+    ) -> list[Self | ValidationError]: ...
+
+    @classmethod
+    def model_validate_json_many(
+            cls,
+            json_data: str | bytes | bytearray,
+            *,
+            strict: bool | None = None,
+            context: Any | None = None,
+            collect_errors: bool = False,
+    ) -> list[Self] | list[Self | ValidationError]:
+        """ Validates a JSON array of objects, like `model_validate_many` but for JSON input.
+
+            Invalid JSON (or JSON that is not an array) always raises a `ValidationError`,
+            even when `collect_errors` is `True`.
+        """
+        if not collect_errors:
+            return _list_adapter(cls).validate_json(json_data, strict=strict, context=context)
+
+        results: list[Self | ValidationError] = _list_adapter(cls, collect_errors=True).validate_json(
+            json_data, strict=strict, context=context
+        )
+        for i, result in enumerate(results):
+            if not isinstance(result, cls):
+                # Failed items are returned as parsed JSON, turn them back into JSON to get their error in JSON mode.
+                try:
+                    results[i] = cls.model_validate_json(to_json(result), strict=strict, context=context)
+                except ValidationError as e:
+                    results[i] = e
+        return results
+
+    @overload
+    @classmethod
+    def model_validate_ndjson(
+            cls,
+            source: BinaryIO | Iterable[bytes],
+            *,
+            strict: bool | None = None,
+            context: Any | None = None,
+            collect_errors: Literal[False] = False,
+            batch_size: None = None,
+            chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[Self]: ...
+
+    @overload
+    @classmethod
+    def model_validate_ndjson(
+            cls,
+            source: BinaryIO | Iterable[bytes],
+            *,
+            strict: bool | None = None,
+            context: Any | None = None,
+            collect_errors: Literal[True],
+            batch_size: None = None,
+            chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[Self | ValidationError]: ...
+
+    @overload
+    @classmethod
+    def model_validate_ndjson(
+            cls,
+            source: BinaryIO | Iterable[bytes],
+            *,
+            strict: bool | None = None,
+            context: Any | None = None,
+            collect_errors: Literal[False] = False,
+            batch_size: int,
+            chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[list[Self]]: ...
+
+    @overload
+    @classmethod
+    def model_validate_ndjson(
+            cls,
+            source: BinaryIO | Iterable[bytes],
+            *,
+            strict: bool | None = None,
+            context: Any | None = None,
+            collect_errors: Literal[True],
+            batch_size: int,
+            chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[list[Self | ValidationError]]: ...
+
+    @classmethod
+    def model_validate_ndjson(
+            cls,
+            source: BinaryIO | Iterable[bytes],
+            *,
+            strict: bool | None = None,
+            context: Any | None = None,
+            collect_errors: bool = False,
+            batch_size: int | None = None,
+            chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[Any]:
+        """ Lazily validates newline delimited JSON (NDJSON), yielding a model instance for each line.
+
+            `source` is a binary file (read `chunk_size` bytes at a time) or an iterable of `bytes` chunks.
+            Each line is validated via `model_validate_json` as soon as it's read, so memory use stays flat
+            no matter how large the input is. Blank lines are skipped.
+
+            If `collect_errors` is `False` (default), the `ValidationError` of an invalid line is raised.
+            If `collect_errors` is `True`, the `ValidationError` is yielded instead, in place of the instance.
+
+            If a `batch_size` is given, lists of up to `batch_size` results are yielded instead of single ones;
+            handy for bulk writes downstream.
+        """
+        results = _validate_json_lines(
+            cls, iter_ndjson_lines(source, chunk_size=chunk_size), strict=strict, context=context,
+            collect_errors=collect_errors,
+        )
+        if batch_size is None:
+            return results
+        return batched(results, batch_size)
+
+    @overload
+    @classmethod
+    def model_validate_json_stream(
+            cls,
+            source: AsyncIterable[bytes],
+            *,
+            format: Literal['auto', 'ndjson', 'array'] = 'auto',
+            strict: bool | None = None,
+            context: Any | None = None,
+            collect_errors: Literal[False] = False,
+            max_concurrency: int = 4,
+            offload_size: int = DEFAULT_OFFLOAD_SIZE,
+            executor: Executor | None = None,
+    ) -> AsyncIterator[Self]: ...
+
+    @overload
+    @classmethod
+    def model_validate_json_stream(
+            cls,
+            source: AsyncIterable[bytes],
+            *,
+            format: Literal['auto', 'ndjson', 'array'] = 'auto',
+            strict: bool | None = None,
+            context: Any | None = None,
+            collect_errors: Literal[True],
+            max_concurrency: int = 4,
+            offload_size: int = DEFAULT_OFFLOAD_SIZE,
+            executor: Executor | None = None,
+    ) -> AsyncIterator[Self | ValidationError]: ...
+
+    @classmethod
+    def model_validate_json_stream(
+            cls,
+            source: AsyncIterable[bytes],
+            *,
+            format: Literal['auto', 'ndjson', 'array'] = 'auto',
+            strict: bool | None = None,
+            context: Any | None = None,
+            collect_errors: bool = False,
+            max_concurrency: int = 4,
+            offload_size: int = DEFAULT_OFFLOAD_SIZE,
+            executor: Executor | None = None,
+    ) -> AsyncIterator[Any]:
+        """ Asynchronously validates a JSON array or NDJSON body, read from `source` (an async iterable of `bytes`
+            chunks, ie: an ASGI request body), yielding a model instance for each item, in order.
+
+            Each item is validated via `model_validate_json` as soon as it has been read, so only the current
+            chunk and the items being validated are kept in memory. With `format='auto'` (default), a body
+            starting with `[` is a JSON array, otherwise it's NDJSON. A `ValueError` is raised for a JSON array
+            that is not well-formed.
+
+            Items of `offload_size` bytes or more are validated in `executor` (the default executor of the event
+            loop if `None`); at most `max_concurrency` items are in flight at once, and no more of `source`
+            is read until the oldest of them is done (backpressure). Smaller items are validated right away.
+            The event loop is given a turn after each chunk.
+
+            Pydantic holds the GIL while validating, so the executor mostly helps with free-threaded Python;
+            otherwise, the event loop is kept responsive by validating one item at a time, not the whole body.
+
+            If `collect_errors` is `False` (default), the `ValidationError` of an invalid item is raised.
+            If `collect_errors` is `True`, the `ValidationError` is yielded instead, in place of the instance.
+        """
+        if max_concurrency < 1:
+            raise ValueError(f'The `max_concurrency` must be at least 1, got ({max_concurrency}).')
+        return cls._validate_json_stream(
+            source, format=format, strict=strict, context=context, collect_errors=collect_errors,
+            max_concurrency=max_concurrency, offload_size=offload_size, executor=executor,
+        )
+
+    @classmethod
+    async def _validate_json_stream(
+            cls,
+            source: AsyncIterable[bytes],
+            *,
+            format: Literal['auto', 'ndjson', 'array'],
+            strict: bool | None,
+            context: Any | None,
+            collect_errors: bool,
+            max_concurrency: int,
+            offload_size: int,
+            executor: Executor | None,
+    ) -> AsyncIterator[Any]:
+        loop = asyncio.get_running_loop()
+        validate = functools.partial(
+            _validate_json_item, cls, strict=strict, context=context, collect_errors=collect_errors
+        )
+        # Results not yielded yet, in order; items validated right away wait behind any offloaded ones.
+        pending: collections.deque[asyncio.Future[Any]] = collections.deque()
+        try:
+            async for item in aiter_json_items(source, format=format):
+                if len(item) >= offload_size:
+                    pending.append(loop.run_in_executor(executor, validate, item))
+                elif not pending:
+                    yield validate(item)
+                    continue
+                else:
+                    future = loop.create_future()
+                    try:
+                        future.set_result(validate(item))
+                    except ValidationError as e:
+                        future.set_exception(e)
+                    pending.append(future)
+
+                while pending and (len(pending) >= max_concurrency or pending[0].done()):
+                    yield await pending.popleft()
+
+            while pending:
+                yield await pending.popleft()
+        finally:
+            # When stopped early, don't wait for (or report errors of) results that are no longer wanted.
+            for future in pending:
+                if not future.cancel() and not future.cancelled():
+                    future.exception()
+
+    @overload
+    @classmethod
+    def model_validate_sharded(
+            cls,
+            payloads: Sequence[Any],
+            *,
+            strict: bool | None = None,
+            context: Any | None = None,
+            collect_errors: Literal[False] = False,
+            dump: Literal[False] = False,
+            executor: Executor | None = None,
+            max_workers: int | None = None,
+            shard_size: int = DEFAULT_SHARD_SIZE,
+    ) -> list[Self]: ...
+
+    @overload
+    @classmethod
+    def model_validate_sharded(
+            cls,
+            payloads: Sequence[Any],
+            *,
+            strict: bool | None = None,
+            context: Any | None = None,
+            collect_errors: Literal[True],
+            dump: Literal[False] = False,
+            executor: Executor | None = None,
+            max_workers: int | None = None,
+            shard_size: int = DEFAULT_SHARD_SIZE,
+    ) -> list[Self | ValidationError]: ...
+
+    @overload
+    @classmethod
+    def model_validate_sharded(
+            cls,
+            payloads: Sequence[Any],
+            *,
+            strict: bool | None = None,
+            context: Any | None = None,
+            collect_errors: bool = False,
+            dump: Literal[True],
+            executor: Executor | None = None,
+            max_workers: int | None = None,
+            shard_size: int = DEFAULT_SHARD_SIZE,
+    ) -> list[Any]: ...
+
+    @classmethod
+    def model_validate_sharded(
+            cls,
+            payloads: Sequence[Any],
+            *,
+            strict: bool | None = None,
+            context: Any | None = None,
+            collect_errors: bool = False,
+            dump: bool = False,
+            executor: Executor | None = None,
+            max_workers: int | None = None,
+            shard_size: int = DEFAULT_SHARD_SIZE,
+    ) -> list[Any]:
+        """ Validates a very large batch of `payloads` in a pool of processes, returning the results in order;
+            see `pydantic_partials.parallel` for details.
+
+            Each payload is either raw JSON (`str`/`bytes`, validated like `model_validate_json`) or a Python
+            object such as a dict (validated like `model_validate`). The payloads are split into shards of
+            `shard_size`, each one validated in a worker process of `executor` (ie: a `ProcessPoolExecutor`, to reuse
+            between calls); the Python payloads of a shard in one pydantic-core call, each JSON payload on its own.
+            If `executor` is `None`, a `ProcessPoolExecutor` with `max_workers` is started for this call; unless
+            there is only one shard, which is then validated in this process instead.
+
+            If `dump` is `True`, the workers return each instance as a dict (`model_dump()`) instead;
+            which is cheaper to send back than the instance.
+
+            If `collect_errors` is `False` (default), a single `ValidationError` is raised for the whole batch,
+            with the index of each failed payload at the start of the error locations (like `model_validate_many`).
+            If `collect_errors` is `True`, the `ValidationError` of each invalid payload is put in the returned
+            list instead, at the same position as the payload.
+        """
+        return validate_sharded(
+            cls, payloads, strict=strict, context=context, collect_errors=collect_errors, dump=dump,
+            executor=executor, max_workers=max_workers, shard_size=shard_size,
+        )
+
+    def apply_to(self, target: M, *, copy: bool = False, validate: bool = False) -> M:
+        """ Applies this partial (ie: a PATCH) onto `target`, which can be any Pydantic model;
+            such as the full model this partial was made from.
+
+            Only fields that were set on this partial, are not `Missing` and are also fields on the target
+            are applied; the same as `target.model_copy(update=patch.model_dump(exclude_unset=True))`,
+            but without serializing this partial first.
+            Which fields can be applied from one class onto another is only worked out once.
+
+            Args:
+                target: Model to apply the changes onto.
+                copy: If `False` (default), `target` is changed in-place (frozen fields of the target can't
+                    be changed). If `True`, a shallow copy of `target` is changed and returned instead.
+                validate: If `True`, each changed field is validated for the target, like with
+                    `validate_assignment`. If any of them fail, a `ValidationError` is raised and `target`
+                    is left unchanged. Defaults to `False`, like `model_copy`.
+
+            Returns:
+                `target`, or the copy of it if `copy` is `True`.
+        """
+        return apply_patch(self, target, copy=copy, validate=validate)
+
+    @classmethod
+    def apply_many(
+            cls, patches: Iterable['PartialModel'], targets: Iterable[M], *, copy: bool = False, validate: bool = False
+    ) -> list[M]:
+        """ Applies each patch in `patches` onto the target at the same position in `targets`,
+            see `apply_to` for details. Returns a list of the targets (or the copies, if `copy` is `True`).
+        """
+        return apply_patches(patches, targets, copy=copy, validate=validate)
+
+    @classmethod
+    def from_diff(cls, old: BaseModel, new: BaseModel) -> Self:
+        """ Returns a partial with only the fields that are different between `old` and `new`,
+            set to the value from `new`; any other fields are left `Missing` (ie: for audit logs).
+
+            Values are compared directly on the models, without serializing them. Nested models are compared
+            field by field, and values that are the same object (ie: after `model_copy`) are skipped right away.
+            If a field of this class is itself a partial model, the changes in the nested model are diffed into
+            that partial too (ie: with `deep_partials`).
+
+            Fields that can't be `Missing` (ie: excluded via `auto_partials_exclude`, such as an `id`) always
+            have the value from `new`. Only the changed fields are in the `model_fields_set`.
+
+            The values are not validated, they are expected to come from valid models.
+        """
+        return diff_models(cls, old, new)
+
+    @classmethod
+    def from_diff_many(cls, olds: Iterable[BaseModel], news: Iterable[BaseModel]) -> list[Self]:
+        """ Returns a `from_diff` partial for each pair of models at the same position in `olds` and `news`. """
+        return diff_many_models(cls, olds, news)
+
+    @classmethod
+    def model_construct_trusted(cls, values: Mapping[str, Any], *, fields_set: set[str] | None = None) -> Self:
+        """ Creates an instance from trusted `values` without validating them, like `model_construct`;
+            ie: for rehydrating patches that were already validated.
+
+            Partial fields that are not in `values` are `Missing`, from a table of defaults worked out once
+            per class; so unlike `model_construct`, their defaults are not looked up (and deep-copied) each time.
+            Other fields not in `values` get their default, as usual.
+
+            Args:
+                values: Field values by field name (not alias). Extra values are kept if the model allows extra
+                    fields, and are ignored otherwise.
+                fields_set: The `model_fields_set` of the instance, defaults to the fields in `values`.
+        """
+        return construct_trusted(cls, values, fields_set)
+
+    @classmethod
+    def model_construct_many(cls, items: Iterable[Mapping[str, Any]]) -> list[Self]:
+        """ Returns a `model_construct_trusted` instance for each of the `items`, without validating them. """
+        return construct_many_trusted(cls, items)
+
+    @classmethod
+    def __get_pydantic_json_schema__(cls, core_schema: CoreSchema, handler: GetJsonSchemaHandler) -> JsonSchemaValue:
+        # Called for this model's schema by any JSON schema generator, including when this model is used by
+        # another model (ie: by FastAPI for OpenAPI docs); so this is where `Missing` defaults are left out.
+        return super().__get_pydantic_json_schema__(without_missing_defaults(cls, core_schema), handler)
+
+    @classmethod
+    def model_json_schema(
+            cls,
+            by_alias: bool = True,
+            ref_template: str = DEFAULT_REF_TEMPLATE,
+            schema_generator: type[GenerateJsonSchema] = GenerateJsonSchema,
+            mode: JsonSchemaMode = 'validation',
+            *,
+            union_format: Literal['any_of', 'primitive_type_array'] = 'any_of',
+    ) -> dict[str, Any]:
+        """ Same as Pydantic's `model_json_schema`, but the schema is generated once per class and set of
+            arguments (ie: `mode`), and kept until the class is rebuilt; a copy of it is returned each time.
+
+            Partial fields are optional in the schema, without a default (`Missing` means the key is left out);
+            `Partial[str]` is a string, not a union with `MissingType`.
+        """
+        def generate() -> dict[str, Any]:
+            return super(PartialModel, cls).model_json_schema(
+                by_alias=by_alias, ref_template=ref_template, schema_generator=schema_generator, mode=mode,
+                union_format=union_format,
+            )
+
+        return cached_json_schema(cls, (by_alias, ref_template, schema_generator, mode, union_format), generate)
+
+    def model_dump_masked(
+            self,
+            field_mask: FieldMask,
+            *,
+            mode: Literal['json', 'python'] | str = 'python',
+            by_alias: bool | None = None,
+            exclude_none: bool = False,
+            round_trip: bool = False,
+            warnings: bool | Literal['none', 'warn', 'error'] = True,
+    ) -> dict[str, Any]:
+        """ Like `model_dump`, but only with the fields in `field_mask`: dotted field paths
+            (ie: `['id', 'address.city']`), or a comma separated string of them (ie: `'id,address.city'`).
+            A path into a list (or dict) of models applies to each of them. `Missing` values are still left out.
+
+            Each distinct mask is compiled once per class into its own serializer, so it's cheaper than passing
+            the same `include` to `model_dump` each time. A `ValueError` is raised if a path is not a field.
+        """
+        return compile_mask(type(self), field_mask).to_python(
+            self, mode=mode, by_alias=by_alias, exclude_none=exclude_none, round_trip=round_trip, warnings=warnings,
+        )
+
+    def model_dump_json_masked(
+            self,
+            field_mask: FieldMask,
+            *,
+            indent: int | None = None,
+            by_alias: bool | None = None,
+            exclude_none: bool = False,
+            round_trip: bool = False,
+            warnings: bool | Literal['none', 'warn', 'error'] = True,
+    ) -> str:
+        """ Like `model_dump_masked`, but to a JSON string (like `model_dump_json`). """
+        return compile_mask(type(self), field_mask).to_json(
+            self, indent=indent, by_alias=by_alias, exclude_none=exclude_none, round_trip=round_trip,
+            warnings=warnings,
+        ).decode()
+
+    @classmethod
+    def model_rebuild(
+            cls,
+            *,
+            force: bool = False,
+            raise_errors: bool = True,
+            _parent_namespace_depth: int = 2,
+            _types_namespace: MappingNamespace | None = None,
+    ) -> bool | None:
+        # Overridden to use the schema cache and record stats (when enabled), so account for this extra frame
+        # when Pydantic looks up the namespace of the caller.
+        if _parent_namespace_depth > 0:
+            _parent_namespace_depth += 1
+        started = time.perf_counter() if stats.stats_enabled() else None
+        cache_path = None
+        if schema_cache.schema_cache_directory() is not None and not cls.__pydantic_complete__:
+            cache_path = schema_cache.schema_path(cls)
+
+        result: bool | None
+        if cache_path is not None and schema_cache.load_schema(cls, cache_path):
+            result = True
+        else:
+            result = super().model_rebuild(
+                force=force, raise_errors=raise_errors, _parent_namespace_depth=_parent_namespace_depth,
+                _types_namespace=_types_namespace,
+            )
+            if cache_path is not None and result:
+                schema_cache.save_schema(cls, cache_path)
+
+        if started is not None:
+            stats._record_rebuild(cls, started, result, force)
+        return result
+
+    @classmethod
+    def model_construct(cls, _fields_set: set[str] | None = None, **values: Any) -> Self:
+        if _fields_set is None or not cls.__partial_omit_natively__:  # type: ignore[attr-defined]
+            return super().model_construct(_fields_set, **values)
+
+        # Native omission uses the fields set to find the present fields, so they all need to be in it;
+        # the requested fields set is swapped in afterward.
+        obj = super().model_construct(None, **values)
+        object.__setattr__(obj, '__pydantic_fields_set__', _fields_set)
+        return obj
+
+    def model_copy(self, *, update: Mapping[str, Any] | None = None, deep: bool = False) -> Self:
+        copied = super().model_copy(update=update, deep=deep)
+        if update and type(self).__partial_omit_natively__:  # type: ignore[attr-defined]
+            _omit_missing_values(copied)
+            _restore_field_order(copied)
+
+        if type(self).__partial_track_dirty__:  # type: ignore[attr-defined]
+            # The copy carries the changes of the original, and the ones made by `update`.
+            dirty = _get_dirty(self)
+            if dirty:
+                object.__setattr__(copied, '__partial_dirty__', set(dirty))
+            if update:
+                values = self.__dict__
+                fields = type(self).__pydantic_fields__
+                copied._model_record_dirty({k: values.get(k, Missing) for k in update if k in fields})
+        return copied
+
+    def __getstate__(self) -> dict[Any, Any]:
+        # The dirty fields are kept when pickled (ie: sent to another process), the present fields mask is not
+        # (it's worked out again when needed).
+        state = super().__getstate__()
+        dirty = _get_dirty(self)
+        if dirty:
+            state['__partial_dirty__'] = dirty
+        return state
+
+    def __setstate__(self, state: dict[Any, Any]) -> None:
+        dirty = None
+        if '__partial_dirty__' in state:
+            state = dict(state)
+            dirty = state.pop('__partial_dirty__')
+        super().__setstate__(state)
+        if dirty:
+            object.__setattr__(self, '__partial_dirty__', set(dirty))
+
+
+# Reads the `__partial_present_mask__` slot directly, so an unset slot doesn't go through `__getattr__`.
+_present_mask_slot = PartialModel.__dict__['__partial_present_mask__']
+
+# Number of masks `PartialModel.model_fields_for_mask` remembers per class, before starting over.
+_MASK_FIELDS_CACHE_SIZE = 1024
+
+
+def _get_present_mask(obj: PartialModel) -> int | None:
+    try:
+        return _present_mask_slot.__get__(obj)
+    except AttributeError:
+        return None
+
+
+_dirty_slot = PartialModel.__dict__['__partial_dirty__']
+
+
+def _get_dirty(obj: PartialModel) -> set[str] | None:
+    try:
+        return _dirty_slot.__get__(obj)
+    except AttributeError:
+        return None
 
 
 class AutoPartialModel(PartialModel, auto_partials=True):
@@ -0,0 +1,202 @@
+import types
+from typing import Any, Iterable, NamedTuple, TypeVar, Union, get_args, get_origin
+
+from pydantic import BaseModel, ValidationError
+
+from .construct import construct_trusted
+from .meta import _restore_field_order
+from .sentinels import Missing, MissingType
+
+M = TypeVar('M', bound=BaseModel)
+
+
+class ApplyPlan(NamedTuple):
+    """ What is needed to apply a patch of one class onto a target of another class, worked out once per pair. """
+
+    fields: frozenset[str]
+    """ Names of the fields on the patch that are also fields on the target. """
+
+    frozen_fields: frozenset[str]
+    """ Fields of `fields` that are frozen on the target (all of them, if the target model is frozen). """
+
+
+def apply_plan(patch_cls: type[BaseModel], target_cls: type[BaseModel]) -> ApplyPlan:
+    """ Returns the `ApplyPlan` for applying `patch_cls` patches onto `target_cls` instances,
+        cached on the patch class (subclasses get their own).
+    """
+    plans = patch_cls.__dict__.get('__partial_apply_plans__')
+    if plans is None:
+        plans = {}
+        setattr(patch_cls, '__partial_apply_plans__', plans)
+
+    plan = plans.get(target_cls)
+    if plan is None:
+        target_fields = target_cls.model_fields
+        fields = frozenset(name for name in patch_cls.model_fields if name in target_fields)
+        if target_cls.model_config.get('frozen'):
+            frozen_fields = fields
+        else:
+            frozen_fields = frozenset(name for name in fields if target_fields[name].frozen)
+        plan = plans[target_cls] = ApplyPlan(fields=fields, frozen_fields=frozen_fields)
+    return plan
+
+
+def _reset_present_fields(obj: BaseModel) -> None:
+    """ Partial models cache which fields are present, forget it after changing their `__dict__` directly;
+        and with native omission, fields that were `Missing` may have been added at the end of it.
+    """
+    reset = getattr(obj, '_model_reset_present_fields', None)
+    if reset is not None:
+        reset()
+    if getattr(type(obj), '__partial_omit_natively__', False):
+        _restore_field_order(obj)
+
+
+def _old_values(obj: BaseModel, names: Iterable[str]) -> dict[str, Any] | None:
+    """ The current values of `names`, if `obj` is a partial model that tracks dirty fields (else `None`). """
+    if not getattr(type(obj), '__partial_track_dirty__', False):
+        return None
+    values = obj.__dict__
+    return {name: values.get(name, Missing) for name in names}
+
+
+def _record_dirty(obj: BaseModel, old_values: dict[str, Any] | None) -> None:
+    """ Records the fields that changed from `old_values` (see `_old_values`), after changing the `__dict__`. """
+    if old_values is not None:
+        obj._model_record_dirty(old_values)  # type: ignore[attr-defined]
+
+
+def apply_patch(patch: BaseModel, target: M, *, copy: bool = False, validate: bool = False) -> M:
+    """ Applies `patch` onto `target`, see `pydantic_partials.partial.PartialModel.apply_to` for details. """
+    plan = apply_plan(type(patch), type(target))
+    values = patch.__dict__
+    changed = {}
+    for name in plan.fields & patch.__pydantic_fields_set__:
+        value = values.get(name, Missing)
+        if value is not Missing:
+            changed[name] = value
+
+    if not copy:
+        frozen = plan.frozen_fields.intersection(changed)
+        if frozen:
+            name = min(frozen)
+            error_type = 'frozen_instance' if target.model_config.get('frozen') else 'frozen_field'
+            raise ValidationError.from_exception_data(
+                type(target).__name__, [{'type': error_type, 'loc': (name,), 'input': changed[name]}]
+            )
+
+    if not changed:
+        return target.model_copy() if copy else target
+
+    if validate:
+        # Validated on a copy; so the target is left unchanged if any of the fields fail validation.
+        result = target.model_copy()
+        validator = type(target).__pydantic_validator__
+        for name, value in changed.items():
+            validator.validate_assignment(result, name, value)
+        if copy:
+            _record_dirty(result, _old_values(target, changed))
+            return result
+        old_values = _old_values(target, changed)
+        target.__dict__.update(result.__dict__)
+        target.__pydantic_fields_set__.update(result.__pydantic_fields_set__)
+        _reset_present_fields(target)
+        _record_dirty(target, old_values)
+        return target
+
+    result = target.model_copy() if copy else target
+    old_values = _old_values(result, changed)
+    result.__dict__.update(changed)
+    result.__pydantic_fields_set__.update(changed)
+    _reset_present_fields(result)
+    _record_dirty(result, old_values)
+    return result
+
+
+def apply_patches(
+        patches: Iterable[BaseModel], targets: Iterable[M], *, copy: bool = False, validate: bool = False
+) -> list[M]:
+    """ Applies each patch onto the target at the same position, returning the (possibly copied) targets. """
+    patches = list(patches)
+    targets = list(targets)
+    if len(patches) != len(targets):
+        raise ValueError(
+            f'Need the same number of patches and targets, got ({len(patches)}) patches '
+            f'and ({len(targets)}) targets.'
+        )
+    return [apply_patch(p, t, copy=copy, validate=validate) for p, t in zip(patches, targets)]
+
+
+class DiffField(NamedTuple):
+    name: str
+
+    partial: bool
+    """ If the field can be `Missing`; the value from the new model is always used for fields that can't be. """
+
+    nested: type[BaseModel] | None
+    """ Partial model class of the field, if it's a (single) partial model that nested changes are diffed into. """
+
+
+def diff_plan(partial_cls: type[BaseModel]) -> tuple[DiffField, ...]:
+    """ Returns a `DiffField` for each field of `partial_cls`, cached on the class (subclasses get their own). """
+    plan = partial_cls.__dict__.get('__partial_diff_plan__')
+    if plan is None:
+        partial_fields: set[str] = getattr(partial_cls, 'model_partial_fields', set())
+        fields = []
+        for name, field in partial_cls.model_fields.items():
+            # Partial fields are a union with `MissingType`, ie: `PartialAddress | MissingType`.
+            annotation: Any = field.annotation
+            if get_origin(annotation) in (Union, types.UnionType):
+                args = [arg for arg in get_args(annotation) if arg is not MissingType]
+                annotation = args[0] if len(args) == 1 else None
+            is_partial_model = isinstance(annotation, type) and hasattr(annotation, 'model_partial_fields')
+            fields.append(DiffField(name, name in partial_fields, annotation if is_partial_model else None))
+        plan = tuple(fields)
+        setattr(partial_cls, '__partial_diff_plan__', plan)
+    return plan
+
+
+def values_differ(old: Any, new: Any) -> bool:
+    """ Compares two field values; models of the same class are compared field by field (recursively),
+        and values that are the same object are never compared.
+    """
+    if old is new:
+        return False
+    if isinstance(old, BaseModel) and type(old) is type(new):
+        old_values, new_values = old.__dict__, new.__dict__
+        if old_values.keys() != new_values.keys() or old.__pydantic_extra__ != new.__pydantic_extra__:
+            return True
+        return any(values_differ(v, new_values[k]) for k, v in old_values.items())
+    return bool(old != new)
+
+
+def diff_models(partial_cls: type[M], old: BaseModel, new: BaseModel) -> M:
+    """ Returns a `partial_cls` with the fields that differ between `old` and `new`,
+        see `pydantic_partials.partial.PartialModel.from_diff` for details.
+    """
+    old_values, new_values = old.__dict__, new.__dict__
+    values = {}
+    changed = set()
+    for name, partial, nested_cls in diff_plan(partial_cls):
+        new_value = new_values.get(name, Missing)
+        if new_value is Missing:
+            continue
+        old_value = old_values.get(name, Missing)
+        if old_value is new_value or not values_differ(old_value, new_value):
+            if not partial:
+                values[name] = new_value
+            continue
+        if nested_cls is not None and isinstance(old_value, BaseModel) and isinstance(new_value, BaseModel):
+            new_value = diff_models(nested_cls, old_value, new_value)
+        values[name] = new_value
+        changed.add(name)
+    return construct_trusted(partial_cls, values, changed)
+
+
+def diff_many_models(partial_cls: type[M], olds: Iterable[BaseModel], news: Iterable[BaseModel]) -> list[M]:
+    """ Returns a `partial_cls` diff for each pair of models at the same position in `olds` and `news`. """
+    olds = list(olds)
+    news = list(news)
+    if len(olds) != len(news):
+        raise ValueError(f'Need the same number of old and new models, got ({len(olds)}) and ({len(news)}).')
+    return [diff_models(partial_cls, old, new) for old, new in zip(olds, news)]
@@ -0,0 +1,341 @@
+""" Opt-in on-disk cache of the core schemas of partial models, to speed up cold starts (ie: of worker processes).
+
+    Building the core schema of a model (in Python) is most of the cost of creating a model class; with the cache
+    enabled, the built core schema of each partial model is saved to a file in the cache directory, and later
+    processes load it from there instead of building it again (the validator and serializer are still made from it,
+    which pydantic-core does quickly):
+
+    ```python
+    from pydantic_partials import schema_cache
+    schema_cache.enable_schema_cache('/var/cache/my-app/schemas')
+
+    from my_app import models  # Partial models are created after enabling the cache.
+    ```
+
+    Or set the `PYDANTIC_PARTIALS_SCHEMA_CACHE` environment variable to the cache directory.
+
+    Each file is named after a hash of the model definition (its fields, config, validators, base classes,
+    and the definition of any models used by its fields), the versions of Python/Pydantic/pydantic-core/
+    pydantic-partials, and the size and modification time of the source file of every module involved.
+    So a changed model (or library) never loads a stale schema, it just won't find one and builds it as usual.
+    Anything going wrong while loading a schema also falls back to building it.
+
+    Models that can't be cached are built as usual, ie: models that are not importable by name
+    (such as the ones made by `partial_of`), or that use values which can't be pickled (ie: lambdas).
+
+    The cached files are pickles, so only use a directory that is not writable by anyone untrusted.
+"""
+import dataclasses
+import hashlib
+import io
+import os
+import pickle
+import re
+import sys
+import tempfile
+import types
+from operator import attrgetter
+from functools import partial
+from pathlib import Path
+from typing import Any, Iterable, get_args
+
+import pydantic
+import pydantic_core
+from pydantic import BaseModel
+from pydantic._internal._config import ConfigWrapper
+from pydantic._internal._model_construction import set_deprecated_descriptors
+from pydantic._internal._signature import generate_pydantic_signature
+from pydantic._internal._utils import LazyClassAttribute
+from pydantic.fields import FieldInfo
+from pydantic.plugin._schema_validator import create_schema_validator
+from pydantic_core import SchemaSerializer
+
+from logging import getLogger
+
+log = getLogger(__name__)
+
+_FORMAT = 1
+""" Changed whenever what is saved in the cache files changes. """
+
+_directory: Path | None = None
+_environment: str | None = None
+_ADDRESS_RE = re.compile(r' at 0x[0-9a-fA-F]+')
+_field_attributes = attrgetter(*(
+    name for name in FieldInfo.__slots__
+    if name not in ('default', '_qualifiers', '_original_assignment', '_complete', '_attributes_set')
+))
+
+
+def enable_schema_cache(directory: str | os.PathLike[str]) -> None:
+    """ Starts loading/saving core schemas of partial models from/to `directory` (it's created if needed);
+        only models created (or first built, with `defer_build`) after this use the cache.
+    """
+    global _directory
+    path = Path(directory)
+    path.mkdir(parents=True, exist_ok=True)
+    _directory = path
+
+
+def disable_schema_cache() -> None:
+    """ Stops using the cache, the cached files are left as they are (see `clear_schema_cache`). """
+    global _directory
+    _directory = None
+
+
+def schema_cache_directory() -> Path | None:
+    """ The directory used by the cache, or `None` if it's disabled. """
+    return _directory
+
+
+def clear_schema_cache() -> None:
+    """ Removes all cached core schemas from the cache directory (ie: to free up space taken by old entries). """
+    if _directory is not None:
+        for path in _directory.glob('*.schema'):
+            path.unlink(missing_ok=True)
+
+
+def schema_path(cls: type[BaseModel]) -> Path | None:
+    """ Returns the path of the cached core schema of `cls` (which may not exist yet), or `None` if the cache
+        is disabled or `cls` can't be cached. Needs to be called before building the schema, as building it
+        fills in more details of the fields.
+    """
+    if _directory is None or not _is_cacheable(cls):
+        return None
+    try:
+        key = _definition_hash(cls)
+    except Exception as e:
+        log.debug(f'Core schema of ({cls.__qualname__}) can not be cached: {e!r}')
+        return None
+    return _directory / f'{key}.schema'
+
+
+def load_schema(cls: type[BaseModel], path: Path) -> bool:
+    """ Completes `cls` (like `model_rebuild`) with the cached core schema at `path` (see `schema_path`),
+        if there is one; returns `False` if there isn't (or it couldn't be used), and `cls` is left unchanged.
+    """
+    if not path.exists():
+        return False
+
+    try:
+        with path.open('rb') as file:
+            fmt, key, schema = _Unpickler(file, cls).load()
+        if fmt != _FORMAT or key != path.stem:
+            return False
+        _complete_model_class(cls, schema)
+    except Exception as e:
+        log.debug(f'Not using cached core schema of ({cls.__qualname__}), from ({path}): {e!r}')
+        return False
+    return True
+
+
+def save_schema(cls: type[BaseModel], path: Path) -> bool:
+    """ Saves the core schema of `cls` (which needs to be complete) to `path` (see `schema_path`),
+        returns `False` if it can't be cached.
+    """
+    if not cls.__pydantic_complete__:
+        return False
+
+    buffer = io.BytesIO()
+    try:
+        _Pickler(buffer, cls).dump((_FORMAT, path.stem, cls.__pydantic_core_schema__))
+    except Exception as e:
+        log.debug(f'Core schema of ({cls.__qualname__}) can not be cached: {e!r}')
+        return False
+
+    # Written to a temporary file first, so other processes never see a partially written file.
+    fd, temp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as file:
+            file.write(buffer.getvalue())
+        os.replace(temp_path, path)
+    except OSError as e:
+        log.debug(f'Could not write cached core schema of ({cls.__qualname__}) to ({path}): {e!r}')
+        Path(temp_path).unlink(missing_ok=True)
+        return False
+    return True
+
+
+_DECORATOR_KINDS = (
+    'validators', 'field_validators', 'root_validators', 'field_serializers', 'model_serializers', 'model_validators'
+)
+
+
+class _Pickler(pickle.Pickler):
+    """ Pickles the model class being cached (and the functions of its validators/serializers) as references to the
+        class, as the class is not yet importable by name when its schema is loaded (it's still being created).
+    """
+
+    def __init__(self, file: io.BytesIO, cls: type[BaseModel]) -> None:
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._cls = cls
+        decorators = cls.__pydantic_decorators__
+        self._functions = {
+            id(decorator.func): (decorator.func, kind, name)
+            for kind in _DECORATOR_KINDS for name, decorator in getattr(decorators, kind).items()
+        }
+
+    def persistent_id(self, obj: Any) -> Any:
+        if obj is self._cls:
+            return 'cls'
+        function = self._functions.get(id(obj))
+        if function is not None and function[0] is obj:
+            return function[1:]
+        return None
+
+
+class _Unpickler(pickle.Unpickler):
+    def __init__(self, file: Any, cls: type[BaseModel]) -> None:
+        super().__init__(file)
+        self._cls = cls
+
+    def persistent_load(self, pid: Any) -> Any:
+        if pid == 'cls':
+            return self._cls
+        kind, name = pid
+        if kind not in _DECORATOR_KINDS:
+            raise pickle.UnpicklingError(f'Unknown persistent id ({pid!r}).')
+        return getattr(self._cls.__pydantic_decorators__, kind)[name].func
+
+
+def _is_cacheable(cls: type[BaseModel]) -> bool:
+    # Computed fields get their return type worked out while building the schema, so they need a real build.
+    return (
+        cls.__pydantic_fields_complete__
+        and not cls.__pydantic_decorators__.computed_fields
+        and '<locals>' not in cls.__qualname__
+        and cls.__module__ in sys.modules
+    )
+
+
+def _definition_hash(cls: type[BaseModel]) -> str:
+    parts: list[str] = [_environment_key()]
+    modules: set[str] = set()
+    _describe_model(cls, parts, modules, set())
+    for name in sorted(modules):
+        parts.append(f'module {name} {_source_stamp(name)}')
+    return hashlib.sha256('\n'.join(parts).encode()).hexdigest()
+
+
+def _environment_key() -> str:
+    global _environment
+    if _environment is None:
+        from . import __file__ as package_file
+        package_stamps = sorted(
+            f'{path.name}:{path.stat().st_size}:{path.stat().st_mtime_ns}'
+            for path in Path(package_file).parent.glob('*.py')
+        )
+        _environment = ' '.join([
+            f'format={_FORMAT}', sys.version, pydantic.VERSION, pydantic_core.__version__, *package_stamps
+        ])
+    return _environment
+
+
+def _source_stamp(module_name: str) -> str:
+    file = getattr(sys.modules.get(module_name), '__file__', None)
+    if not file:
+        return 'no-file'
+    stat = os.stat(file)
+    return f'{stat.st_size}:{stat.st_mtime_ns}'
+
+
+def _describe(values: Iterable[Any]) -> str:
+    """ Describes `values` the same way in every process; ie: sets are sorted (their order changes with the hash
+        seed of each process) and memory addresses (ie: in the `repr` of functions) are left out.
+    """
+    text = repr([sorted(map(repr, v)) if isinstance(v, (set, frozenset)) else v for v in values])
+    return _ADDRESS_RE.sub('', text) if ' at 0x' in text else text
+
+
+def _describe_field(field: FieldInfo) -> str:
+    # Cheaper than the `repr` of the field, and includes everything about it. Only the attributes that can be sets
+    # are sorted, the others are described in one go (most attributes are `None`).
+    text = repr(_field_attributes(field))
+    if ' at 0x' in text:
+        text = _ADDRESS_RE.sub('', text)
+    return f'{text} {_describe([field.default, field._qualifiers])}'
+
+
+def _describe_model(model: type[BaseModel], parts: list[str], modules: set[str], seen: set[type]) -> None:
+    """ Adds a description of everything about `model` that its core schema is built from to `parts`,
+        including the models used by its fields (recursively); and the modules they come from to `modules`.
+    """
+    if model in seen:
+        parts.append(f'seen {model.__module__}.{model.__qualname__}')
+        return
+    seen.add(model)
+
+    parts.append(f'model {model.__module__}.{model.__qualname__}')
+    parts.extend(f'base {base.__module__}.{base.__qualname__}' for base in model.__mro__)
+    modules.update(base.__module__ for base in model.__mro__)
+    parts.append(f'config {_describe(v for item in sorted(model.model_config.items()) for v in item)}')
+
+    for name, field in model.__pydantic_fields__.items():
+        parts.append(f'field {name} {_describe_field(field)}')
+        _describe_types(field.annotation, parts, modules, seen)
+        for item in field.metadata:
+            _describe_metadata(item, parts, modules, seen)
+
+    decorators = model.__pydantic_decorators__
+    for kind in _DECORATOR_KINDS:
+        for name, decorator in getattr(decorators, kind).items():
+            parts.append(f'{kind} {name} {decorator.cls_var_name} {_describe([decorator.info])}')
+
+
+def _describe_types(annotation: Any, parts: list[str], modules: set[str], seen: set[type]) -> None:
+    """ Adds the models (and modules of the other types) used by `annotation` (recursively). """
+    if isinstance(annotation, type):
+        modules.add(annotation.__module__)
+        if issubclass(annotation, BaseModel) and annotation is not BaseModel:
+            _describe_model(annotation, parts, modules, seen)
+    elif isinstance(annotation, (types.FunctionType, partial)):
+        modules.add(getattr(annotation, '__module__', None) or '')
+    for arg in get_args(annotation):
+        _describe_types(arg, parts, modules, seen)
+
+
+def _describe_metadata(item: Any, parts: list[str], modules: set[str], seen: set[type]) -> None:
+    """ Adds the modules of a field's metadata `item` (ie: a marker with `__get_pydantic_core_schema__`) and of the
+        functions it holds (ie: the function of an `AfterValidator`), which its schema can be built from; and the
+        types it uses (recursively).
+    """
+    modules.add(type(item).__module__)
+    if dataclasses.is_dataclass(item):
+        values = [getattr(item, f.name, None) for f in dataclasses.fields(item)]
+    else:
+        values = list(getattr(item, '__dict__', {}).values())
+    for value in values:
+        if callable(value) and not isinstance(value, type):
+            modules.add(getattr(value, '__module__', None) or '')
+    _describe_types(item, parts, modules, seen)
+
+
+def _complete_model_class(cls: type[BaseModel], schema: Any) -> None:
+    """ Does what `pydantic._internal._model_construction.complete_model_class` does after building the schema. """
+    config_wrapper = ConfigWrapper(cls.model_config, check=False)
+    core_config = config_wrapper.core_config(title=cls.__name__)
+    validator = create_schema_validator(
+        schema, cls, cls.__module__, cls.__qualname__, 'BaseModel', core_config, config_wrapper.plugin_settings
+    )
+    serializer = SchemaSerializer(schema, core_config)
+
+    cls.__pydantic_computed_fields__ = {}
+    set_deprecated_descriptors(cls)
+    cls.__pydantic_core_schema__ = schema
+    cls.__pydantic_validator__ = validator
+    cls.__pydantic_serializer__ = serializer
+    cls.__signature__ = LazyClassAttribute(  # type: ignore[assignment]
+        '__signature__',
+        partial(
+            generate_pydantic_signature,
+            init=cls.__init__,
+            fields=cls.__pydantic_fields__,
+            validate_by_alias=config_wrapper.validate_by_alias,
+            extra=config_wrapper.extra,
+        ),
+    )
+    cls.__pydantic_complete__ = True
+    cls.__pydantic_on_complete__()
+
+
+if os.environ.get('PYDANTIC_PARTIALS_SCHEMA_CACHE'):
+    enable_schema_cache(os.environ['PYDANTIC_PARTIALS_SCHEMA_CACHE'])
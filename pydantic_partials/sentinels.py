@@ -1,6 +1,7 @@
 from typing import Any, Type
 from xsentinels.sentinel import Sentinel
-from pydantic import GetCoreSchemaHandler
+from pydantic import GetCoreSchemaHandler, GetJsonSchemaHandler
+from pydantic.json_schema import JsonSchemaValue
 from pydantic_core import core_schema, PydanticOmit
 
 
@@ -15,20 +16,23 @@ class MissingType(Sentinel):
         cls, source_type: Type[Any], handler: GetCoreSchemaHandler
     ) -> core_schema.CoreSchema:
         assert source_type is MissingType
-        # We never want to serialize any Missing values.
-        return core_schema.with_info_after_validator_function(
-            cls._validate,
-            core_schema.is_instance_schema(cls=MissingType),  # core_schema.any_schema(),
-            # serialization=core_schema.plain_serializer_function_ser_schema(
-            #     cls._serialize,
-            #     # return_schema=core_schema.AnySchema
-            # )
-        )
+        # A plain `isinstance` check is done natively by pydantic-core, without calling back into Python;
+        # and since `Missing` is a singleton, anything that passes it is the `Missing` value itself.
+        # We never want to serialize any Missing values, see `exclude_if` usage in `pydantic_partials.meta`.
+        return core_schema.is_instance_schema(cls=MissingType)
 
-    @staticmethod
-    def _validate(value: Any, info: core_schema.ValidationInfo) -> 'MissingType':
-        # If we somehow get a non-Missing value (should not happen), return it unchanged.
-        return Missing
+    @classmethod
+    def __get_pydantic_json_schema__(
+        cls, schema: core_schema.CoreSchema, handler: GetJsonSchemaHandler
+    ) -> JsonSchemaValue:
+        # `Missing` is not a type in the JSON schema, it means the key is left out (the field is optional).
+        # Omitting it leaves only the other types in a `Partial` union (ie: `str | MissingType` is a string).
+        raise PydanticOmit
+
+    def __reduce__(self) -> str:
+        # Pickled as a reference to the `Missing` singleton (ie: for partial models sent to other processes),
+        # so it stays the one and only `Missing` when unpickled; and takes fewer bytes than a new instance.
+        return 'Missing'
 
     @staticmethod
     def _serialize(value: Any) -> str:
@@ -0,0 +1,221 @@
+""" Bulk SQL `UPDATE`s from partial models (ie: PATCH payloads), for DB-API drivers (`cursor.executemany`).
+
+    Each patch sets a different mix of fields, so the patches are grouped by which of their fields are present
+    (not `Missing`); each group becomes one parameterized statement, with a parameter row for each patch:
+
+    ```python
+    for update in bulk_update_statements('users', patches):
+        cursor.executemany(update.sql, update.params)
+    ```
+"""
+from operator import itemgetter
+from typing import Any, Callable, Iterable, Literal, Mapping, NamedTuple, Sequence
+
+ParamStyle = Literal['qmark', 'numeric', 'named', 'format', 'pyformat']
+""" The DB-API `paramstyle` of the driver (ie: `sqlite3.paramstyle` is `'qmark'`, psycopg's is `'pyformat'`). """
+
+
+def quote_ansi(identifier: str) -> str:
+    """ Quotes a column name with double quotes, the SQL standard (ie: SQLite, PostgreSQL); the default. """
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+def quote_mysql(identifier: str) -> str:
+    """ Quotes a column name with backticks, for MySQL/MariaDB (which read double quotes as a string,
+        unless the `ANSI_QUOTES` SQL mode is on).
+    """
+    return '`' + identifier.replace('`', '``') + '`'
+
+
+class BulkUpdate(NamedTuple):
+    """ One `UPDATE` statement, and its parameters for each of the patches it applies. """
+
+    sql: str
+
+    fields: tuple[str, ...]
+    """ The fields set by the statement, in the order of their parameters (before the key fields). """
+
+    params: list[Any]
+    """ A parameter row for each patch; a tuple, or a dict for the `'named'`/`'pyformat'` param styles. """
+
+
+class _Statement(NamedTuple):
+    sql: str
+    fields: tuple[str, ...]
+    make_row: Callable[[dict[str, Any]], Any]
+
+
+class UpdatePlan:
+    """ How to make `UPDATE` statements for a model class into a table, worked out once per class, table, key,
+        param style and quoting (see `update_plan`); the statement for each mix of present fields is only made once.
+    """
+
+    def __init__(
+            self,
+            model_cls: type,
+            table: str,
+            key: tuple[str, ...],
+            paramstyle: ParamStyle,
+            columns: Mapping[str, str],
+            quote: Callable[[str], str] = quote_ansi,
+    ) -> None:
+        fields = model_cls.model_fields  # type: ignore[attr-defined]
+        for name in (*key, *columns):
+            if name not in fields:
+                raise ValueError(f'({name}) is not a field of ({model_cls.__name__}).')
+        if paramstyle not in ('qmark', 'numeric', 'named', 'format', 'pyformat'):
+            raise ValueError(f'Unknown `paramstyle` ({paramstyle}).')
+
+        self.model_cls = model_cls
+        self.table = table
+        self.key = key
+        self.paramstyle = paramstyle
+        self.bits: dict[str, int] = getattr(model_cls, '__partial_field_bits__', {})
+        # The fields that can be set, in the order of the model fields.
+        self.value_fields = tuple(name for name in fields if name not in key)
+        self.columns = {name: quote(columns.get(name, name)) for name in fields}
+        self.key_mask = sum(self.bits.get(name, 0) for name in key)
+        # Gets the value(s) of the key fields from the `__dict__` of a patch, to tell which row it updates.
+        self.get_key = itemgetter(*key)
+        self._statements: dict[int, _Statement | None] = {}
+
+    def statement(self, mask: int) -> _Statement | None:
+        """ Returns the statement for patches with the present fields mask `mask` (see `model_present_mask`),
+            or `None` if they don't set anything.
+        """
+        statement = self._statements.get(mask, _NOT_FOUND)
+        if statement is _NOT_FOUND:
+            if mask & self.key_mask != self.key_mask:
+                missing = [name for name in self.key if not mask & self.bits.get(name, 0)]
+                raise ValueError(
+                    f'Can not update ({self.model_cls.__name__}) without its key fields ({", ".join(missing)}).'
+                )
+
+            bits = self.bits
+            # Fields that are not partial are always present.
+            fields = tuple(name for name in self.value_fields if name not in bits or mask & bits[name])
+            statement = self._statements[mask] = self._make_statement(fields) if fields else None
+        return statement  # type: ignore[return-value]
+
+    def _make_statement(self, fields: tuple[str, ...]) -> _Statement:
+        names = (*fields, *self.key)
+        if self.paramstyle == 'qmark':
+            placeholders = ['?'] * len(names)
+        elif self.paramstyle == 'format':
+            placeholders = ['%s'] * len(names)
+        elif self.paramstyle == 'numeric':
+            placeholders = [f':{i}' for i in range(1, len(names) + 1)]
+        elif self.paramstyle == 'named':
+            placeholders = [f':{name}' for name in names]
+        else:
+            placeholders = [f'%({name})s' for name in names]
+
+        columns = self.columns
+        assignments = ', '.join(f'{columns[n]} = {p}' for n, p in zip(fields, placeholders))
+        conditions = ' AND '.join(f'{columns[n]} = {p}' for n, p in zip(self.key, placeholders[len(fields):]))
+        sql = f'UPDATE {self.table} SET {assignments} WHERE {conditions}'
+
+        get_values = itemgetter(*names)
+        make_row: Callable[[dict[str, Any]], Any]
+        if self.paramstyle in ('named', 'pyformat'):
+            make_row = lambda values: {name: values[name] for name in names}  # noqa: E731
+        elif len(names) == 1:
+            make_row = lambda values: (get_values(values),)  # noqa: E731
+        else:
+            make_row = get_values
+        return _Statement(sql, fields, make_row)
+
+
+def update_plan(
+        model_cls: type,
+        table: str,
+        *,
+        key: str | Sequence[str] = 'id',
+        paramstyle: ParamStyle = 'qmark',
+        columns: Mapping[str, str] | None = None,
+        quote: Callable[[str], str] = quote_ansi,
+) -> UpdatePlan:
+    """ Returns the `UpdatePlan` of `model_cls` (a partial model) for `table`, cached on the class
+        (subclasses get their own).
+    """
+    key = (key,) if isinstance(key, str) else tuple(key)
+    columns = columns or {}
+    cache_key = (table, key, paramstyle, tuple(sorted(columns.items())), quote)
+    plans = model_cls.__dict__.get('__partial_update_plans__')
+    if plans is None:
+        plans = {}
+        setattr(model_cls, '__partial_update_plans__', plans)
+
+    plan = plans.get(cache_key)
+    if plan is None:
+        plan = plans[cache_key] = UpdatePlan(model_cls, table, key, paramstyle, columns, quote)
+    return plan
+
+
+def bulk_update_statements(
+        table: str,
+        items: Iterable[Any],
+        *,
+        key: str | Sequence[str] = 'id',
+        paramstyle: ParamStyle = 'qmark',
+        columns: Mapping[str, str] | None = None,
+        quote: Callable[[str], str] = quote_ansi,
+) -> list[BulkUpdate]:
+    """ Returns the `UPDATE` statements (with the parameter rows for `executemany`) that apply each of the partial
+        model `items` to the row of `table` with the same `key` field(s).
+
+        Items are grouped by their class and which of their fields are present (not `Missing`), one statement per
+        group; in the order each group was first seen, and the items keep their order within each group.
+        The `key` fields are used in the `WHERE` clause (a `ValueError` is raised if one is `Missing`);
+        items without any other present field are skipped.
+
+        Items that update the same row are applied in their order: if a row was already updated by a statement that
+        comes after the one of an item's group, the item starts another statement for its group (after that one).
+
+        Args:
+            table: The table to update, used in the SQL as-is (so it can include a schema, or be quoted).
+            items: The partial model instances, ie: validated PATCH payloads.
+            key: The field(s) that identify the row to update.
+            paramstyle: The DB-API `paramstyle` of the driver, defaults to `'qmark'` (ie: `sqlite3`).
+            columns: Column names of the fields that are not named the same as their column.
+            quote: Quotes the column names (including the `columns` ones); defaults to `quote_ansi` (double quotes),
+                use `quote_mysql` (backticks) for MySQL/MariaDB, or ie: `str` to use them as-is (already quoted).
+
+        Values are passed along as they are on the models, so they should be types the driver can handle
+        (and the values of the `key` fields need to be hashable).
+    """
+    updates: list[BulkUpdate] = []
+    groups: dict[tuple[type, int], tuple[_Statement | None, Callable[[dict[str, Any]], Any]]] = {}
+    plans: dict[type, UpdatePlan] = {}
+    # Index in `updates` of the statement currently taking the rows of each group, and of the last one for each row.
+    group_updates: dict[tuple[type, int], int] = {}
+    row_updates: dict[Any, int] = {}
+    for item in items:
+        cls = type(item)
+        mask = item.model_present_mask
+        group_key = (cls, mask)
+        group = groups.get(group_key)
+        if group is None:
+            plan = plans.get(cls)
+            if plan is None:
+                plan = plans[cls] = update_plan(
+                    cls, table, key=key, paramstyle=paramstyle, columns=columns, quote=quote
+                )
+            group = groups[group_key] = (plan.statement(mask), plan.get_key)
+
+        statement, get_key = group
+        if statement is None:
+            continue
+
+        values = item.__dict__
+        row = get_key(values)
+        index = group_updates.get(group_key)
+        if index is None or row_updates.get(row, -1) > index:
+            index = group_updates[group_key] = len(updates)
+            updates.append(BulkUpdate(statement.sql, statement.fields, []))
+        updates[index].params.append(statement.make_row(values))
+        row_updates[row] = index
+    return updates
+
+
+_NOT_FOUND = object()
@@ -0,0 +1,130 @@
+""" Opt-in statistics about the build and runtime costs of partial models, per model class.
+
+    Stats are disabled by default, and cost close to nothing while disabled. Enable them with `enable_stats()`
+    (or by setting the `PYDANTIC_PARTIALS_STATS=1` environment variable) before the models are created:
+
+    ```python
+    from pydantic_partials import stats
+    stats.enable_stats()
+
+    class MyModel(AutoPartialModel):
+        ...
+
+    print(stats.model_stats(MyModel))
+    ```
+"""
+import dataclasses
+import os
+import threading
+import time
+import weakref
+from typing import Any, Callable
+
+from .sentinels import Missing
+
+_enabled = os.environ.get('PYDANTIC_PARTIALS_STATS', '') not in ('', '0')
+_lock = threading.Lock()
+_stats: 'weakref.WeakKeyDictionary[type, ModelStats]' = weakref.WeakKeyDictionary()
+
+
+@dataclasses.dataclass
+class ModelStats:
+    """ Statistics of a single partial model class. """
+
+    class_creations: int = 0
+    """ Number of times `PartialMeta.__new__` ran for the class (normally one). """
+
+    class_creation_seconds: float = 0.0
+    """ Time spent in `PartialMeta.__new__`; including the schema build, unless it was deferred. """
+
+    partial_fields: int = 0
+    """ Number of fields that were made partial. """
+
+    rebuilds: int = 0
+    """ Number of `model_rebuild` calls that built the schema (including the one made when the class is created,
+        or the first time it's used if the build was deferred).
+    """
+
+    forced_rebuilds: int = 0
+    """ Number of `model_rebuild(force=True)` calls. """
+
+    rebuild_seconds: float = 0.0
+    """ Time spent in `model_rebuild` calls. """
+
+    exclude_if_calls: int = 0
+    """ Number of times pydantic-core called the `exclude_if` check for `Missing` values while serializing.
+        Only counted while stats are enabled, for classes created while they were enabled
+        (and using `missing_omission='exclude_if'`); these keep a slightly slower check after `disable_stats`.
+    """
+
+
+def enable_stats() -> None:
+    """ Starts collecting stats; `exclude_if` calls are only counted for classes created after this. """
+    global _enabled
+    _enabled = True
+
+
+def disable_stats() -> None:
+    """ Stops collecting stats, the stats collected so far are kept (see `reset_stats`). """
+    global _enabled
+    _enabled = False
+
+
+def stats_enabled() -> bool:
+    return _enabled
+
+
+def reset_stats() -> None:
+    """ Forgets all the stats collected so far. """
+    with _lock:
+        _stats.clear()
+
+
+def model_stats(cls: type) -> ModelStats | None:
+    """ Returns a copy of the stats of model class `cls`, or `None` if there are none. """
+    stats = _stats.get(cls)
+    return dataclasses.replace(stats) if stats is not None else None
+
+
+def all_model_stats() -> dict[type, ModelStats]:
+    """ Returns a copy of the stats of every model class with stats. """
+    with _lock:
+        return {cls: dataclasses.replace(stats) for cls, stats in _stats.items()}
+
+
+def _stats_for(cls: type) -> ModelStats:
+    stats = _stats.get(cls)
+    if stats is None:
+        with _lock:
+            stats = _stats.setdefault(cls, ModelStats())
+    return stats
+
+
+def _record_class_creation(cls: type, started: float, partial_field_count: int) -> None:
+    stats = _stats_for(cls)
+    stats.class_creations += 1
+    stats.class_creation_seconds += time.perf_counter() - started
+    stats.partial_fields = partial_field_count
+
+
+def _record_rebuild(cls: type, started: float, result: bool | None, force: bool) -> None:
+    stats = _stats_for(cls)
+    if result is not None:
+        stats.rebuilds += 1
+    if force:
+        stats.forced_rebuilds += 1
+    stats.rebuild_seconds += time.perf_counter() - started
+
+
+def _counting_exclude_if_missing(cls: type) -> Callable[[Any], bool]:
+    """ Returns an `exclude_if` check for `Missing` values, that counts how often it's called for `cls`. """
+    _stats_for(cls)
+
+    def exclude_if_missing(v):
+        if _enabled:
+            # Looked up each time, as the stats may have been reset since.
+            _stats_for(cls).exclude_if_calls += 1
+        return v is Missing
+
+    exclude_if_missing.__partial_exclude_if_missing__ = True  # type: ignore
+    return exclude_if_missing
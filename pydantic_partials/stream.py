@@ -0,0 +1,212 @@
+import asyncio
+import functools
+import re
+from typing import AsyncIterable, AsyncIterator, BinaryIO, Iterable, Iterator, Literal, TypeVar
+
+T = TypeVar('T')
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+DEFAULT_OFFLOAD_SIZE = 256 * 1024
+
+
+def iter_ndjson_lines(source: BinaryIO | Iterable[bytes], *, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+    """ Yields each non-blank line of newline delimited JSON (NDJSON), without the line ending.
+
+        `source` is either a binary file (read `chunk_size` bytes at a time) or an iterable of `bytes` chunks,
+        where a line can be split across several chunks. Only the current chunk and line are kept in memory.
+    """
+    chunks: Iterable[bytes]
+    if hasattr(source, 'read'):
+        chunks = iter(functools.partial(source.read, chunk_size), b'')
+    else:
+        chunks = source
+
+    splitter = NdjsonSplitter()
+    for chunk in chunks:
+        yield from splitter.feed(chunk)
+    yield from splitter.close()
+
+
+async def aiter_json_items(
+        source: AsyncIterable[bytes], *, format: Literal['auto', 'ndjson', 'array'] = 'auto'
+) -> AsyncIterator[bytes]:
+    """ Yields the raw JSON of each item of a JSON array, or each line of NDJSON, from the `bytes` chunks of
+        an async `source` (ie: an ASGI request body); an item can be split across several chunks.
+
+        With `format='auto'` (default), the body is a JSON array if its first non-whitespace byte is `[`,
+        otherwise it's NDJSON. A `ValueError` is raised if a JSON array is not well-formed.
+
+        Control is given back to the event loop after each chunk, even if `source` never waits.
+    """
+    splitter: NdjsonSplitter | JsonArraySplitter | None = None
+    leading: list[bytes] = []
+    async for chunk in source:
+        if splitter is None:
+            # Work out the format from the first non-whitespace byte, which may not be in the first chunk.
+            if format == 'auto' and not chunk.strip():
+                leading.append(chunk)
+                continue
+            is_array = format == 'array' or (format == 'auto' and chunk.lstrip()[:1] == b'[')
+            splitter = JsonArraySplitter() if is_array else NdjsonSplitter()
+            chunk = b''.join(leading) + chunk if leading else chunk
+
+        for item in splitter.feed(chunk):
+            yield item
+        await asyncio.sleep(0)
+
+    if splitter is None:
+        splitter = JsonArraySplitter() if format == 'array' else NdjsonSplitter()
+    for item in splitter.close():
+        yield item
+
+
+class NdjsonSplitter:
+    """ Splits newline delimited JSON (NDJSON) that is given in chunks into its non-blank lines. """
+
+    def __init__(self) -> None:
+        # Parts of a line that is not finished yet, joined once the end of the line is found.
+        self._pending: list[bytes] = []
+
+    def feed(self, chunk: bytes) -> list[bytes]:
+        """ Returns the lines that were completed by `chunk`. """
+        if b'\n' not in chunk:
+            if chunk:
+                self._pending.append(chunk)
+            return []
+
+        lines = chunk.split(b'\n')
+        if self._pending:
+            self._pending.append(lines[0])
+            lines[0] = b''.join(self._pending)
+        self._pending = [lines.pop()]
+        return [line for line in lines if line.strip()]
+
+    def close(self) -> list[bytes]:
+        """ Returns the last line, if it did not end with a line ending. """
+        line = b''.join(self._pending)
+        self._pending = []
+        return [line] if line.strip() else []
+
+
+# Skip over everything but the brackets/braces (and commas, at the top level) of a JSON array, whole strings included;
+# stopping at the quote of a string that does not end in the data.
+_JSON_STRING = rb'"[^"\\]*(?:\\.[^"\\]*)*"'
+_JSON_SKIP_NESTED = re.compile(rb'(?:[^"\[\]{}]+|' + _JSON_STRING + rb')*', re.DOTALL)
+_JSON_SKIP_TOP = re.compile(rb'(?:[^"\[\]{},]+|' + _JSON_STRING + rb')*', re.DOTALL)
+# The rest of a string after its opening quote, up to (not including) its closing quote or the end of the data.
+_JSON_STRING_BODY = re.compile(rb'[^"\\]*(?:\\.[^"\\]*)*', re.DOTALL)
+
+
+class JsonArraySplitter:
+    """ Splits a JSON array that is given in chunks into the raw JSON of each of its items,
+        without parsing the items (they are validated with `model_validate_json`).
+    """
+
+    def __init__(self) -> None:
+        self._depth = 0
+        self._in_string = False
+        # The last chunk ended in a string, right after a backslash.
+        self._escaped = False
+        self._started = False
+        self._finished = False
+        self._has_items = False
+        # Parts of the item that is not finished yet.
+        self._pending: list[bytes] = []
+
+    def feed(self, chunk: bytes) -> list[bytes]:
+        """ Returns the items that were completed by `chunk`. """
+        items: list[bytes] = []
+        start = 0
+        position = 0
+        size = len(chunk)
+        if self._escaped and size:
+            # Skip the character escaped by the backslash the last (non empty) chunk ended with.
+            position = 1
+            self._escaped = False
+
+        while position < size:
+            if self._in_string:
+                # Skip the whole string at once.
+                position = _JSON_STRING_BODY.match(chunk, position).end()  # type: ignore[union-attr]
+                if position == size:
+                    break
+                if chunk[position] == 0x5C:  # A backslash at the end of the chunk.
+                    self._escaped = True
+                    break
+                self._in_string = False
+                position += 1
+                continue
+
+            skip = _JSON_SKIP_NESTED if self._depth > 1 else _JSON_SKIP_TOP
+            index = skip.match(chunk, position).end()  # type: ignore[union-attr]
+            if index == size:
+                break
+            char = chunk[index]
+            position = index + 1
+
+            if self._finished:
+                raise ValueError('Invalid JSON array, found more data after the end of the array.')
+            if not self._started:
+                if char != 0x5B or chunk[:index].strip():
+                    raise ValueError('Invalid JSON array, the body does not start with `[`.')
+                self._started = True
+                self._depth = 1
+                start = position
+            elif char == 0x22:  # Quote.
+                self._in_string = True
+            elif char in (0x5B, 0x7B):  # `[` or `{`.
+                self._depth += 1
+            elif char in (0x5D, 0x7D):  # `]` or `}`.
+                self._depth -= 1
+                if self._depth == 0:
+                    self._finish_item(items, chunk[start:index], last=True)
+                    self._finished = True
+                    start = position
+            elif self._depth == 1:  # A comma between items.
+                self._finish_item(items, chunk[start:index], last=False)
+                start = position
+
+        rest = chunk[start:]
+        if self._finished:
+            if rest.strip():
+                raise ValueError('Invalid JSON array, found more data after the end of the array.')
+        elif self._started and rest:
+            self._pending.append(rest)
+        elif not self._started and rest.strip():
+            raise ValueError('Invalid JSON array, the body does not start with `[`.')
+        return items
+
+    def close(self) -> list[bytes]:
+        if not self._finished:
+            raise ValueError('Invalid JSON array, the body ended before the end of the array.')
+        return []
+
+    def _finish_item(self, items: list[bytes], end: bytes, *, last: bool) -> None:
+        if self._pending:
+            self._pending.append(end)
+            end = b''.join(self._pending)
+            self._pending = []
+        if end.strip():
+            items.append(end)
+        elif not last or items or self._has_items:
+            # An empty item is only fine for an empty array (`[]`).
+            raise ValueError('Invalid JSON array, found an empty item.')
+        self._has_items = True
+
+
+def batched(items: Iterable[T], batch_size: int) -> Iterator[list[T]]:
+    """ Returns an iterator of lists of `batch_size` items from `items` (the last list can be shorter). """
+    if batch_size < 1:
+        raise ValueError(f'The `batch_size` must be at least 1, got ({batch_size}).')
+    return _batched(items, batch_size)
+
+
+def _batched(items: Iterable[T], batch_size: int) -> Iterator[list[T]]:
+    batch: list[T] = []
+    for item in items:
+        batch.append(item)
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
@@ -1,6 +1,7 @@
 from decimal import Decimal
 from typing import Annotated
 import json
+import sys
 
 import pytest
 from pydantic import ValidationError, computed_field, Field, BaseModel
@@ -10,6 +11,7 @@ from pydantic_partials.partial import PartialModel, Partial, AutoPartialModel
 
 from pydantic_partials import PartialConfigDict
 from pydantic_partials.sentinels import Missing, MissingType
+from pydantic_partials.meta import _exclude_if_missing
 
 
 # from pydantic_lazy.remote import RemoteModel
@@ -128,6 +130,68 @@ def test_pre_existing_exclude_if_still_consulted():
     out = obj.model_dump_json()
 
 
+def test_exclude_if_call_depth_constant_with_inheritance():
+    depths = []
+
+    def exclude_zero(v):
+        frame, depth = sys._getframe(), 0
+        while frame is not None:
+            frame, depth = frame.f_back, depth + 1
+        depths.append(depth)
+        return v == 0
+
+    class BaseModel(AutoPartialModel):
+        a: Annotated[int, Field(exclude_if=exclude_zero)]
+        b: Annotated[int, Field(exclude_if=exclude_zero)]
+        c: int
+
+    models = [BaseModel]
+    for i in range(10):
+        class SubModel(models[-1]):  # type: ignore
+            pass
+        models.append(SubModel)
+
+    for model in models:
+        assert model(a=0, b=1).model_dump() == {'b': 1}
+    assert len(depths) == 2 * len(models)
+    assert len(set(depths)) == 1
+
+    # The user's check is kept as-is (not nested), and fields share one combined check per class.
+    a_field, b_field, c_field = models[-1].model_fields.values()
+    assert a_field.exclude_if.__partial_user_exclude_ifs__ == (exclude_zero,)  # type: ignore
+    assert a_field.exclude_if is b_field.exclude_if
+    assert c_field.exclude_if is _exclude_if_missing
+
+    class NativeModel(models[-1], missing_omission='native'):  # type: ignore
+        pass
+
+    class ExcludeIfModel(NativeModel, missing_omission='exclude_if'):
+        pass
+
+    assert NativeModel.model_fields['a'].exclude_if is exclude_zero
+    assert ExcludeIfModel.model_fields['a'].exclude_if.__partial_user_exclude_ifs__ == (exclude_zero,)  # type: ignore
+    assert ExcludeIfModel(a=0).model_dump() == {}
+
+
+def test_missing_validated_natively():
+    class TestModel(AutoPartialModel, validate_assignment=True):
+        a: int
+
+    # Validating `Missing` should not need a Python validator function in the core schema.
+    assert "'function-" not in repr(TestModel.__pydantic_core_schema__)
+
+    obj = TestModel.model_validate({'a': Missing})
+    assert obj.a is Missing
+    assert obj.model_fields_set == {'a'}
+
+    obj.a = 1
+    obj.a = Missing
+    assert obj.a is Missing
+
+    with pytest.raises(ValidationError):
+        TestModel(a=MissingType)
+
+
 # TODO: Below are some exploration + tests for computed fields and the Missing feature.
 #   See this Pydantic issue (https://github.com/pydantic/pydantic/issues/12690).
 #
@@ -0,0 +1,180 @@
+import gc
+import weakref
+from typing import Generic, TypeVar
+from unittest import mock
+
+import pytest
+from pydantic import BaseModel
+from pydantic._internal import _model_construction
+
+from pydantic_partials import AutoPartialModel, PartialModel, Partial, Missing, partial_of
+from pydantic_partials import meta
+from pydantic_partials.cache import LRUCache
+from pydantic_partials.meta import parametrized_cache
+
+T = TypeVar('T')
+
+
+def count_schema_builds():
+    """ Patches Pydantic to record the name of each model class that gets its schema built. """
+    built: list[str] = []
+    original = _model_construction.complete_model_class
+
+    def complete_model_class(cls, *args, **kwargs):
+        built.append(cls.__name__)
+        return original(cls, *args, **kwargs)
+
+    return built, mock.patch.object(_model_construction, 'complete_model_class', complete_model_class)
+
+
+def test_schema_built_once():
+    built, patcher = count_schema_builds()
+    with patcher:
+        class TestModel(BaseModel):
+            a: int
+            b: str = 'b-value'
+
+        class PartialTestModel(AutoPartialModel, TestModel):
+            c: Partial[int]
+
+        class ExplicitModel(PartialModel):
+            d: Partial[int]
+
+    assert built == ['TestModel', 'PartialTestModel', 'ExplicitModel']
+
+    obj = PartialTestModel()
+    assert obj.a is Missing
+    assert obj.c is Missing
+    assert obj.model_dump() == {'b': 'b-value'}
+    assert ExplicitModel(d=1).model_dump() == {'d': 1}
+
+
+def test_defer_build_config_not_changed():
+    class TestModel(AutoPartialModel):
+        a: int
+
+    class DeferredModel(AutoPartialModel, defer_build=True):
+        a: int
+
+    class DeferredSubModel(DeferredModel):
+        b: int
+
+    assert 'defer_build' not in TestModel.model_config
+    assert DeferredModel.model_config['defer_build'] is True
+    assert DeferredSubModel.model_config['defer_build'] is True
+
+    assert DeferredSubModel(b=2).model_dump() == {'b': 2}
+
+
+def test_local_forward_reference():
+    def make_model():
+        LocalInt = int
+
+        class TestModel(AutoPartialModel):
+            a: 'LocalInt'
+
+        return TestModel
+
+    TestModel = make_model()
+    assert TestModel().a is Missing
+    assert TestModel(a='1').a == 1
+
+
+@pytest.mark.parametrize('defer_build', [False, True])
+def test_schema_built_during_class_creation(defer_build):
+    class Base(AutoPartialModel, defer_build=defer_build):
+        @classmethod
+        def __pydantic_init_subclass__(cls, **kwargs):
+            super().__pydantic_init_subclass__(**kwargs)
+            # Builds the schema while Pydantic is still creating the class, before the fields are partial.
+            cls.model_json_schema()
+
+    class TestModel(Base):
+        a: int
+        b: str
+
+    obj = TestModel(a=1)
+    assert obj.b is Missing
+    assert obj.model_dump() == {'a': 1}
+    assert TestModel.model_json_schema().get('required') is None
+
+
+@pytest.mark.parametrize('first_use', ['validate', 'serialize', 'json_schema'])
+def test_deferred_build_on_first_use(first_use):
+    class Address(BaseModel, defer_build=True):
+        street: str
+
+    class User(BaseModel, defer_build=True):
+        name: str
+        address: Address
+
+    built, patcher = count_schema_builds()
+    with patcher:
+        class DeferredUser(AutoPartialModel, User):
+            pass
+
+        PartialUser = partial_of(User, deep_partials=True)
+
+        # Nothing is built until first used.
+        assert built == []
+        assert not PartialUser.__pydantic_complete__
+        assert PartialUser.model_partial_fields == {'name', 'address'}
+
+        if first_use == 'validate':
+            assert PartialUser(address={}).model_dump() == {'address': {}}
+        elif first_use == 'serialize':
+            assert PartialUser.model_construct(name='a-name').model_dump_json() == '{"name":"a-name"}'
+        else:
+            assert set(PartialUser.model_json_schema()['properties']) == {'name', 'address'}
+
+    # Only the model that was used (and possibly the nested partial model it uses) was built.
+    assert built[0] == 'PartialUser'
+    assert set(built) <= {'PartialUser', 'PartialAddress'}
+    assert DeferredUser(name='a-name').model_dump() == {'name': 'a-name'}
+
+
+def test_generic_parametrizations_built_once():
+    class Item(BaseModel):
+        name: str
+
+    class Page(AutoPartialModel, Generic[T]):
+        items: list[T]
+        total: int
+
+    built, patcher = count_schema_builds()
+    with patcher:
+        page_ref = weakref.ref(Page[Item])
+        # Only kept alive by the cache, Pydantic's own cache of parametrizations is weak.
+        gc.collect()
+        assert Page[Item] is page_ref()
+        assert Page[int] is Page[int]
+
+    assert built == ['Page[test_generic_parametrizations_built_once.<locals>.Item]', 'Page[int]']
+    assert (Page, (int,)) in parametrized_cache
+
+    page = Page[Item](items=[{'name': 'a'}])
+    assert page.total is Missing
+    assert Page[Item].model_partial_fields == {'items', 'total'}
+    assert page.model_dump() == {'items': [{'name': 'a'}]}
+
+
+def test_generic_parametrizations_let_go_in_creation_order(monkeypatch):
+    cache: LRUCache[type] = LRUCache(maxsize=2)
+    monkeypatch.setattr(meta, 'parametrized_cache', cache)
+
+    class Page(AutoPartialModel, Generic[T]):
+        items: list[T]
+
+    int_page_ref = weakref.ref(Page[int])
+    str_page_ref = weakref.ref(Page[str])
+    # Looked up in Pydantic's cache, so this doesn't make it the most recently used.
+    assert Page[int] is int_page_ref()
+
+    # Lets go of the first one created, even though it was used last.
+    Page[bytes]
+    gc.collect()
+    assert (Page, (int,)) not in cache
+    assert int_page_ref() is None
+    assert Page[str] is str_page_ref()
+    info = cache.cache_info()
+    assert (info.misses, info.evictions, info.currsize) == (3, 1, 2)
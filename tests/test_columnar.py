@@ -0,0 +1,82 @@
+import pytest
+from pydantic import ValidationError
+
+from pydantic_partials import AutoPartialExclude, AutoPartialModel, Missing
+from pydantic_partials.columnar import Column, from_columns, to_columns
+
+
+class Reading(AutoPartialModel):
+    id: AutoPartialExclude[int]
+    sensor: str
+    value: float
+
+
+def test_to_columns_presence_bitmaps():
+    readings = [Reading(id=i, sensor=f's{i}', value=i / 2) if i % 3 else Reading(id=i) for i in range(10)]
+    columns = to_columns(Reading, readings)
+    assert list(columns) == ['id', 'sensor', 'value']
+
+    assert columns['id'] == Column(list(range(10)), None)
+    assert columns['sensor'].values == [None if i % 3 == 0 else f's{i}' for i in range(10)]
+    # Bits 0, 3, 6 and 9 are cleared, in little-endian bit order.
+    assert columns['sensor'].present == bytes([0b10110110, 0b01])
+    assert columns['value'].presence() == [i % 3 != 0 for i in range(10)]
+
+    assert to_columns(Reading, readings[1:3])['sensor'].present is None
+    assert to_columns(Reading, []) == {'id': Column([], None), 'sensor': Column([], None), 'value': Column([], None)}
+
+
+def test_to_columns_fields_and_fill():
+    readings = [Reading(id=1, value=1.0), Reading(id=2)]
+    columns = to_columns(Reading, readings, fields=['value'], fill=0.0)
+    assert columns == {'value': Column([1.0, 0.0], bytes([0b01]))}
+    assert columns['value'].to_array('d').tolist() == [1.0, 0.0]
+
+    with pytest.raises(ValueError, match=r'\(other\) is not a field'):
+        to_columns(Reading, readings, fields=['other'])
+
+
+def test_to_columns_needs_instances_of_the_class():
+    class SubReading(Reading):
+        extra: int
+
+    with pytest.raises(ValueError, match=r'Expected instances of \(Reading\), got a \(SubReading\)'):
+        to_columns(Reading, [Reading(id=1), SubReading(id=2)])
+
+
+def test_from_columns_round_trip():
+    readings = [Reading(id=i, sensor=f's{i}') if i % 2 else Reading(id=i, value=i) for i in range(20)]
+    readings[5].sensor = Missing
+
+    restored = from_columns(Reading, to_columns(Reading, readings))
+    assert [r.model_dump() for r in restored] == [r.model_dump() for r in readings]
+    assert [r.model_present_fields for r in restored] == [r.model_present_fields for r in readings]
+    assert restored[5].sensor is Missing
+
+    restored = from_columns(Reading, to_columns(Reading, readings), validate=True)
+    assert [r.model_dump() for r in restored] == [r.model_dump() for r in readings]
+
+
+def test_from_columns_validation():
+    columns = {'id': Column(['x', 2], None), 'value': Column([1.0, None], bytes([0b01]))}
+    # Not validated by default.
+    assert from_columns(Reading, columns)[0].id == 'x'
+    with pytest.raises(ValidationError):
+        from_columns(Reading, columns, validate=True)
+
+    with pytest.raises(ValueError, match=r'same number of values, got \(1, 2\)'):
+        from_columns(Reading, {'id': Column([1, 2], None), 'value': Column([1.0], None)})
+    assert from_columns(Reading, {}) == []
+
+
+def test_numpy_masked_arrays():
+    numpy = pytest.importorskip('numpy')
+
+    readings = [Reading(id=1, value=1.5), Reading(id=2), Reading(id=3, value=3.0)]
+    column = to_columns(Reading, readings, fill=0.0)['value']
+    array = column.to_numpy(dtype=float)
+    assert array.mask.tolist() == [False, True, False]
+    assert array.compressed().tolist() == [1.5, 3.0]
+    assert Column.from_numpy(array) == column
+
+    assert Column.from_numpy(numpy.array([1, 2])) == Column([1, 2], None)
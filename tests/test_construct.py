@@ -0,0 +1,69 @@
+import pytest
+from pydantic import BaseModel, ConfigDict, Field
+
+from pydantic_partials import AutoPartialModel, Missing, PartialModel, Partial
+
+
+class ItemModel(BaseModel):
+    name: str
+
+
+@pytest.mark.parametrize('missing_omission', ['exclude_if', 'native'])
+def test_model_construct_trusted(missing_omission):
+    class TestModel(AutoPartialModel, missing_omission=missing_omission):
+        a: int
+        b: str
+        c: int = 3
+        tags: list[str] = Field(default_factory=list)
+        item: ItemModel
+
+    obj = TestModel.model_construct_trusted({'a': 1, 'item': ItemModel(name='x')})
+    assert obj == TestModel(a=1, item=ItemModel(name='x'))
+    assert obj.b is Missing
+    assert obj.model_fields_set == {'a', 'item'}
+    assert obj.model_dump() == {'a': 1, 'c': 3, 'tags': [], 'item': {'name': 'x'}}
+    assert obj.model_present_fields == {'a', 'item'}
+
+    # Default factories are called for each instance.
+    assert TestModel.model_construct_trusted({}).tags is not TestModel.model_construct_trusted({}).tags
+
+    obj = TestModel.model_construct_trusted({'a': 1, 'b': Missing}, fields_set={'a'})
+    assert obj.b is Missing
+    assert obj.model_fields_set == {'a'}
+    assert obj.model_dump() == {'a': 1, 'c': 3, 'tags': []}
+    if missing_omission == 'native':
+        assert obj.__dict__ == {'a': 1, 'c': 3, 'tags': []}
+
+
+def test_model_construct_trusted_extra_and_post_init():
+    post_init_calls = []
+
+    class TestModel(PartialModel, missing_omission='native'):
+        model_config = ConfigDict(extra='allow')
+
+        id: int
+        name: Partial[str]
+
+        def model_post_init(self, context, /):
+            post_init_calls.append(dict(self.__dict__))
+
+    obj = TestModel.model_construct_trusted({'id': 1, 'other': 'x'})
+    assert post_init_calls == [{'id': 1}]
+    assert obj.model_extra == {'other': 'x'}
+    assert obj.model_dump() == {'id': 1, 'other': 'x'}
+
+    # Required fields that are not given are left unset, like `model_construct`.
+    assert TestModel.model_construct_trusted({'name': 'a-name'}).__dict__ == {'name': 'a-name'}
+
+
+def test_model_construct_many():
+    class TestModel(AutoPartialModel):
+        a: int
+        b: str
+
+    items = [{'a': 1}, {'b': 'b-value'}, {}]
+    objs = TestModel.model_construct_many(items)
+    assert objs == [TestModel(a=1), TestModel(b='b-value'), TestModel()]
+    assert [obj.model_fields_set for obj in objs] == [{'a'}, {'b'}, set()]
+    assert TestModel.model_construct_many(iter(items)) == objs
+    assert TestModel.model_construct_many([]) == []
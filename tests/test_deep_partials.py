@@ -0,0 +1,138 @@
+from typing import Optional, Union
+from unittest import mock
+
+from pydantic import BaseModel, ValidationError
+from pydantic._internal import _model_construction
+import pytest
+
+from pydantic_partials import AutoPartialModel, PartialModel, Partial, partial_of, Missing
+
+
+class Address(BaseModel):
+    street: str
+    city: str
+
+
+class Pet(BaseModel):
+    name: str
+    kind: str
+
+
+class User(BaseModel):
+    name: str
+    address: Address
+    pets: list[Pet]
+    pets_by_name: dict[str, Pet]
+    previous_address: Optional[Address] = None
+    pet_or_id: Union[Pet, int] = 0
+
+
+def test_deep_partials():
+    PartialUser = partial_of(User, deep_partials=True)
+    obj = PartialUser(
+        address={'city': 'a-city'},
+        pets=[{'name': 'a-name'}],
+        pets_by_name={'a-name': {'kind': 'a-kind'}},
+        previous_address={},
+    )
+
+    assert obj.name is Missing
+    assert obj.address.street is Missing
+    assert obj.model_dump() == {
+        'address': {'city': 'a-city'},
+        'pets': [{'name': 'a-name'}],
+        'pets_by_name': {'a-name': {'kind': 'a-kind'}},
+        'previous_address': {},
+        'pet_or_id': 0,
+    }
+
+    # Nested partial classes are shared.
+    PartialAddress = partial_of(Address, deep_partials=True)
+    assert type(obj.address) is PartialAddress
+    assert type(obj.previous_address) is PartialAddress
+    assert PartialUser.model_fields['pet_or_id'].annotation == Union[partial_of(Pet, deep_partials=True), int]
+
+    # The original models are unchanged.
+    with pytest.raises(ValidationError):
+        Address(city='a-city')
+
+
+def test_deep_partials_class_argument():
+    class PatchUser(AutoPartialModel, User, deep_partials=True, auto_partials_exclude={'address'}):
+        pass
+
+    class ExplicitPatchUser(PartialModel, deep_partials=True):
+        address: Partial[Address]
+        pets: list[Pet]
+
+    obj = PatchUser(address={'street': 'a-street', 'city': 'a-city'}, pets=[{}])
+    assert type(obj.address) is Address
+    assert obj.model_dump() == {
+        'address': {'street': 'a-street', 'city': 'a-city'}, 'pets': [{}], 'previous_address': None, 'pet_or_id': 0
+    }
+
+    obj = ExplicitPatchUser(address={}, pets=[{'name': 'a-name', 'kind': 'a-kind'}])
+    assert obj.address.street is Missing
+    with pytest.raises(ValidationError):
+        ExplicitPatchUser(pets=[{}])
+
+
+def test_deep_partials_of_partial_models():
+    class PartialAddress(AutoPartialModel, Address, auto_partials_exclude={'city'}):
+        pass
+
+    class PatchUser(AutoPartialModel, deep_partials=True):
+        address: PartialAddress
+        previous: list[PartialAddress] | None
+
+    obj = PatchUser(address={'city': 'a-city'}, previous=[{'city': 'b-city'}])
+    assert isinstance(obj.address, PartialAddress)
+    assert obj.address.street is Missing
+    assert obj.model_dump() == {'address': {'city': 'a-city'}, 'previous': [{'city': 'b-city'}]}
+
+    # The fields the nested model keeps required stay required.
+    assert type(obj.address).model_partial_fields == {'street'}
+    with pytest.raises(ValidationError):
+        PatchUser(address={})
+
+
+def test_deep_partials_self_referencing():
+    class Node(BaseModel):
+        value: int
+        children: list['Node'] = []
+
+    class A(BaseModel):
+        a_value: int
+        b: 'B | None' = None
+
+    class B(BaseModel):
+        b_value: int
+        a: A
+
+    A.model_rebuild()
+
+    built = []
+    original = _model_construction.complete_model_class
+
+    def complete_model_class(cls, *args, **kwargs):
+        built.append(cls.__name__)
+        return original(cls, *args, **kwargs)
+
+    with mock.patch.object(_model_construction, 'complete_model_class', complete_model_class):
+        PartialNode = partial_of(Node, deep_partials=True)
+        PartialA = partial_of(A, deep_partials=True)
+        PartialB = partial_of(B, deep_partials=True)
+
+        obj = PartialNode(children=[{'children': [{'value': 1}]}])
+        assert obj.model_dump() == {'children': [{'children': [{'value': 1, 'children': []}]}]}
+        assert type(obj.children[0]) is PartialNode
+
+        obj = PartialA(b={'a': {'b': {}}})
+        assert obj.model_dump() == {'b': {'a': {'b': {}}}}
+        assert type(obj.b) is PartialB
+        assert type(obj.b.a) is PartialA
+
+        assert PartialB(a={}).model_dump() == {'a': {'b': None}}
+
+    # Each class only had its schema built one time.
+    assert sorted(built) == ['PartialA', 'PartialB', 'PartialNode']
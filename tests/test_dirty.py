@@ -0,0 +1,111 @@
+from pydantic import ConfigDict
+
+from pydantic_partials import AutoPartialModel, Missing, PartialConfigDict
+
+
+class AddressModel(AutoPartialModel):
+    street: str
+    city: str
+
+
+class UserModel(AutoPartialModel, track_dirty=True):
+    id: int
+    name: str
+    address: AddressModel
+
+    model_config = ConfigDict(validate_assignment=True)
+
+
+class UserPatchModel(AutoPartialModel):
+    id: int
+    name: str
+
+
+def test_assignments_that_change_values_are_dirty():
+    user = UserModel(id=1, name='a-name', address={'street': 's', 'city': 'c'})
+    assert user.model_dirty_fields == frozenset()
+    assert user.model_dump_dirty() == {}
+
+    # Same values (after validation) are not changes.
+    user.id = '1'
+    user.address = AddressModel(street='s', city='c')
+    assert user.model_dirty_fields == frozenset()
+
+    user.name = 'new-name'
+    user.address = AddressModel(street='s2', city='c')
+    assert user.model_dirty_fields == {'name', 'address'}
+    assert user.model_dump_dirty() == {'name': 'new-name', 'address': {'street': 's2', 'city': 'c'}}
+    assert user.model_dump_dirty(mode='json') == user.model_dump(mode='json', include={'name', 'address'})
+
+    # Changed back, still dirty (it was changed since it was loaded).
+    user.name = 'a-name'
+    assert 'name' in user.model_dirty_fields
+
+    # Changed to `Missing`, dirty but left out of the dump like any other `Missing` value.
+    user.id = Missing
+    assert 'id' in user.model_dirty_fields
+    assert 'id' not in user.model_dump_dirty()
+
+    user.model_reset_dirty(['name'])
+    assert user.model_dirty_fields == {'id', 'address'}
+    user.model_reset_dirty()
+    assert user.model_dirty_fields == frozenset()
+    assert user.model_dump_dirty() == {}
+
+
+def test_dirty_tracking_is_opt_in():
+    address = AddressModel(street='s')
+    address.city = 'c'
+    assert address.model_dirty_fields == frozenset()
+    assert address.model_dump_dirty() == {}
+    address.model_reset_dirty()
+
+    class ConfiguredModel(AutoPartialModel):
+        name: str
+        model_config = PartialConfigDict(track_dirty=True)
+
+    class SubModel(ConfiguredModel):
+        value: int
+
+    class UntrackedModel(SubModel, track_dirty=False):
+        pass
+
+    for model, tracked in ((ConfiguredModel, True), (SubModel, True), (UntrackedModel, False)):
+        obj = model(name='a')
+        obj.name = 'b'
+        assert obj.model_dirty_fields == ({'name'} if tracked else frozenset())
+
+
+def test_native_omission_dirty_tracking():
+    class NativeModel(AutoPartialModel, missing_omission='native', track_dirty=True):
+        name: str
+        value: int
+
+    obj = NativeModel(name='a')
+    obj.value = Missing
+    assert obj.model_dirty_fields == frozenset()
+    obj.name = Missing
+    obj.value = 2
+    assert obj.model_dirty_fields == {'name', 'value'}
+    assert obj.model_dump_dirty() == {'value': 2}
+
+
+def test_apply_to_and_copies_record_changes():
+    user = UserModel(id=1, name='a-name', address={'street': 's', 'city': 'c'})
+    patch = UserPatchModel(id=1, name='new-name')
+
+    copied = patch.apply_to(user, copy=True)
+    assert copied.model_dirty_fields == {'name'}
+    assert user.model_dirty_fields == frozenset()
+
+    validated = patch.apply_to(user.model_copy(), validate=True)
+    assert validated.model_dirty_fields == {'name'}
+
+    patch.apply_to(user)
+    assert user.model_dirty_fields == {'name'}
+
+    # Copies carry the changes of the original, and the ones from `update`.
+    copied = user.model_copy(update={'id': 2, 'name': 'new-name'})
+    assert copied.model_dirty_fields == {'name', 'id'}
+    copied.model_reset_dirty()
+    assert user.model_dirty_fields == {'name'}
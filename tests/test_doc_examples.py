@@ -183,3 +183,346 @@ def test_doc_example__auto_exclude__index__5():
         print(f'Pydantic will state `some_field` is required: {e}')
     else:
         raise Exception('Pydantic should have required `some_field`.')
+
+
+def test_doc_example__native_missing_omission():
+    from pydantic_partials import AutoPartialModel, Missing
+
+    class MyModel(AutoPartialModel, missing_omission='native'):
+        some_attr: str
+        another_field: str
+
+    obj = MyModel(some_attr='hello')
+
+    # Works the same as before:
+    assert obj.another_field is Missing
+    assert obj.model_dump() == {'some_attr': 'hello'}
+
+    # But `Missing` fields are not stored on the object:
+    assert obj.__dict__ == {'some_attr': 'hello'}
+
+
+def test_doc_example__partial_of():
+    from pydantic_partials import partial_of, Missing
+    from pydantic import BaseModel
+
+    class TestModel(BaseModel):
+        id: str
+        name: str
+        value: str
+
+    PartialTestModel = partial_of(TestModel, auto_partials_exclude={'id'})
+    assert partial_of(TestModel, auto_partials_exclude={'id'}) is PartialTestModel
+
+    obj = PartialTestModel(id='an-id')
+    assert obj.name is Missing
+
+    # Or only make some of the fields partial:
+    NamePartialModel = partial_of(TestModel, fields={'name'})
+    assert NamePartialModel.model_partial_fields == {'name'}
+
+
+def test_doc_example__deep_partials():
+    from pydantic_partials import partial_of, Missing
+    from pydantic import BaseModel
+
+    class Address(BaseModel):
+        street: str
+        city: str
+
+    class User(BaseModel):
+        name: str
+        addresses: list[Address]
+
+    PartialUser = partial_of(User, deep_partials=True)
+
+    obj = PartialUser(addresses=[{'city': 'a-city'}])
+    assert obj.name is Missing
+    assert obj.addresses[0].street is Missing
+    assert obj.model_dump() == {'addresses': [{'city': 'a-city'}]}
+
+
+def test_doc_example__generic_partial_models():
+    from typing import Generic, TypeVar
+    from pydantic_partials import AutoPartialModel, Missing
+
+    T = TypeVar('T')
+
+    class Page(AutoPartialModel, Generic[T]):
+        items: list[T]
+        cursor: str
+
+    page = Page[int].model_validate({'items': ['1', 2]})
+    assert page.items == [1, 2]
+    assert page.cursor is Missing
+    assert Page[int] is Page[int]
+
+
+def test_doc_example__batch_validation():
+    from pydantic_partials import AutoPartialModel, Missing
+    from pydantic import ValidationError
+
+    class TestModel(AutoPartialModel):
+        name: str
+        value: int
+
+    objs = TestModel.model_validate_json_many('[{"name": "a-name"}, {"value": 1}]')
+    assert objs[0].value is Missing
+    assert objs[1].value == 1
+
+    objs = TestModel.model_validate_many([{'value': 'bad'}, {'value': 2}], collect_errors=True)
+    assert isinstance(objs[0], ValidationError)
+    assert objs[1].value == 2
+
+
+def test_doc_example__streaming_ndjson():
+    import io
+    from pydantic_partials import AutoPartialModel
+
+    class TestModel(AutoPartialModel):
+        name: str
+        value: int
+
+    file = io.BytesIO(b'{"name": "a-name"}\n{"value": 1}\n{"value": 2}\n')
+    batches = list(TestModel.model_validate_ndjson(file, batch_size=2))
+    assert [len(batch) for batch in batches] == [2, 1]
+    assert batches[1][0].value == 2
+
+
+def test_doc_example__async_streaming():
+    import asyncio
+    from pydantic_partials import AutoPartialModel
+
+    class TestModel(AutoPartialModel):
+        name: str
+        value: int
+
+    async def receive_body():
+        yield b'[{"name": "a-name"}, {"va'
+        yield b'lue": 1}]'
+
+    async def handle_request():
+        return [obj async for obj in TestModel.model_validate_json_stream(receive_body())]
+
+    objs = asyncio.run(handle_request())
+    assert objs[0].name == 'a-name'
+    assert objs[1].value == 1
+
+
+def test_doc_example__sharded_validation_in_processes():
+    from pydantic_partials import AutoPartialModel, Missing
+
+    class TestModel(AutoPartialModel):
+        name: str
+        value: int
+
+    # ie: with ProcessPoolExecutor() as executor:
+    #         objs = TestModel.model_validate_sharded(payloads, executor=executor, shard_size=5_000)
+    # Without an `executor` a pool is started just for this call; unless there is only one shard, like here.
+    objs = TestModel.model_validate_sharded([b'{"name": "a-name"}', {'value': 1}])
+    assert objs[0].value is Missing
+    assert objs[1].value == 1
+    assert TestModel.model_validate_sharded([{'value': 2}], dump=True) == [{'value': 2}]
+
+
+def test_doc_example__apply_to():
+    from pydantic_partials import partial_of
+    from pydantic import BaseModel
+
+    class TestModel(BaseModel):
+        name: str
+        value: int
+
+    PartialTestModel = partial_of(TestModel)
+
+    obj = TestModel(name='a-name', value=1)
+    changed = PartialTestModel(value=2).apply_to(obj, copy=True)
+    assert changed == TestModel(name='a-name', value=2)
+
+    PartialTestModel(name='new-name').apply_to(obj)
+    assert obj == TestModel(name='new-name', value=1)
+
+
+def test_doc_example__from_diff():
+    from pydantic_partials import partial_of, Missing
+    from pydantic import BaseModel
+
+    class TestModel(BaseModel):
+        name: str
+        value: int
+
+    old = TestModel(name='a-name', value=1)
+    new = TestModel(name='a-name', value=2)
+
+    diff = partial_of(TestModel).from_diff(old, new)
+    assert diff.name is Missing
+    assert diff.model_dump() == {'value': 2}
+    assert diff.apply_to(old, copy=True) == new
+
+
+def test_doc_example__present_fields():
+    from pydantic_partials import AutoPartialModel
+
+    class TestModel(AutoPartialModel):
+        name: str
+        value: int
+
+    obj = TestModel(value=1)
+    assert obj.model_present_fields == {'value'}
+    assert obj.model_present_mask == 0b10
+
+    obj.name = 'a-name'
+    assert obj.model_present_fields == {'name', 'value'}
+    assert TestModel.model_fields_for_mask(0b01) == {'name'}
+
+
+def test_doc_example__dirty_tracking():
+    from pydantic_partials import AutoPartialModel
+
+    class TestModel(AutoPartialModel, track_dirty=True):
+        name: str
+        value: int
+
+    obj = TestModel(name='a-name', value=1)
+    obj.value = 1
+    obj.name = 'new-name'
+    assert obj.model_dirty_fields == {'name'}
+    assert obj.model_dump_dirty() == {'name': 'new-name'}
+
+    obj.model_reset_dirty()
+    assert obj.model_dump_dirty() == {}
+
+
+def test_doc_example__bulk_sql_updates():
+    import sqlite3
+    from pydantic_partials import AutoPartialModel, AutoPartialExclude
+    from pydantic_partials.sql import bulk_update_statements
+
+    class UserPatch(AutoPartialModel):
+        id: AutoPartialExclude[int]
+        name: str
+        age: int
+
+    connection = sqlite3.connect(':memory:')
+    connection.execute('CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, age INTEGER)')
+    connection.executemany('INSERT INTO users VALUES (?, ?, ?)', [(1, 'a', 10), (2, 'b', 20), (3, 'c', 30)])
+
+    patches = [UserPatch(id=1, name='new-a'), UserPatch(id=2, age=21), UserPatch(id=3, name='new-c')]
+    updates = bulk_update_statements('users', patches, key='id')
+    assert updates[0].sql == 'UPDATE users SET "name" = ? WHERE "id" = ?'
+    assert updates[0].params == [('new-a', 1), ('new-c', 3)]
+
+    for update in updates:
+        connection.executemany(update.sql, update.params)
+    assert connection.execute('SELECT * FROM users').fetchall() == [(1, 'new-a', 10), (2, 'b', 21), (3, 'new-c', 30)]
+
+
+def test_doc_example__columnar_export():
+    from pydantic_partials import AutoPartialModel, Missing
+    from pydantic_partials.columnar import to_columns, from_columns
+
+    class Reading(AutoPartialModel):
+        sensor: str
+        value: float
+
+    readings = [Reading(sensor='a', value=1.5), Reading(sensor='b'), Reading(sensor='c', value=3.0)]
+    columns = to_columns(Reading, readings, fill=0.0)
+    assert columns['sensor'].values == ['a', 'b', 'c']
+    assert columns['sensor'].present is None
+    assert columns['value'].values == [1.5, 0.0, 3.0]
+    assert columns['value'].present == bytes([0b101])
+    assert columns['value'].presence() == [True, False, True]
+
+    assert columns['value'].to_array('d').tolist() == [1.5, 0.0, 3.0]
+    assert from_columns(Reading, columns)[1].value is Missing
+
+
+def test_doc_example__deferred_schema_build():
+    from pydantic_partials import AutoPartialModel
+    from pydantic import ConfigDict
+
+    class TestModel(AutoPartialModel):
+        model_config = ConfigDict(defer_build=True)
+        name: str
+
+    assert not TestModel.__pydantic_complete__
+    assert TestModel(name='a-name').model_dump() == {'name': 'a-name'}
+    assert TestModel.__pydantic_complete__
+
+
+def test_doc_example__stats():
+    from pydantic_partials import AutoPartialModel, stats
+
+    stats.enable_stats()
+
+    class TestModel(AutoPartialModel):
+        name: str
+        value: int
+
+    TestModel(name='a-name').model_dump()
+
+    model_stats = stats.model_stats(TestModel)
+    assert model_stats.partial_fields == 2
+    assert model_stats.exclude_if_calls == 2
+
+    stats.disable_stats()
+
+
+def test_doc_example__trusted_construction():
+    from pydantic_partials import AutoPartialModel, Missing
+
+    class TestModel(AutoPartialModel):
+        name: str
+        value: int
+
+    obj = TestModel.model_construct_trusted({'value': 1})
+    assert obj.name is Missing
+    assert obj.model_dump() == {'value': 1}
+
+    objs = TestModel.model_construct_many([{'name': 'a-name'}, {'value': 2}])
+    assert [o.model_dump() for o in objs] == [{'name': 'a-name'}, {'value': 2}]
+
+
+def test_doc_example__json_schema():
+    from pydantic_partials import AutoPartialModel
+
+    class TestModel(AutoPartialModel):
+        name: str
+        value: int | None
+
+    assert TestModel.model_json_schema() == {
+        'properties': {
+            'name': {'title': 'Name', 'type': 'string'},
+            'value': {'anyOf': [{'type': 'integer'}, {'type': 'null'}], 'title': 'Value'},
+        },
+        'title': 'TestModel',
+        'type': 'object',
+    }
+
+
+def test_doc_example__field_masks():
+    from pydantic_partials import AutoPartialModel
+
+    class AddressModel(AutoPartialModel):
+        street: str
+        city: str
+
+    class UserModel(AutoPartialModel):
+        id: int
+        name: str
+        addresses: list[AddressModel]
+
+    user = UserModel(id=1, name='a-name', addresses=[{'street': 's', 'city': 'c'}, {'street': 's2'}])
+    assert user.model_dump_masked('id,addresses.city') == {'id': 1, 'addresses': [{'city': 'c'}, {}]}
+    assert user.model_dump_json_masked(['name']) == '{"name":"a-name"}'
+
+
+def test_doc_example__schema_cache():
+    import tempfile
+    from pydantic_partials import schema_cache
+
+    schema_cache.enable_schema_cache(tempfile.mkdtemp())
+
+    # Import (or create) the partial models after enabling it.
+
+    schema_cache.disable_schema_cache()
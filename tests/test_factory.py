@@ -0,0 +1,118 @@
+import threading
+from datetime import datetime
+
+import pytest
+from pydantic import BaseModel, ValidationError
+
+from pydantic_partials import partial_of, AutoPartialModel, Missing
+from pydantic_partials.cache import LRUCache
+from pydantic_partials.factory import partial_of_cache
+
+
+class UserModel(BaseModel):
+    id: int
+    name: str
+    created_at: datetime
+    nickname: str | None = None
+
+
+def test_partial_of():
+    PartialUser = partial_of(UserModel)
+
+    assert issubclass(PartialUser, UserModel)
+    assert issubclass(PartialUser, AutoPartialModel)
+    assert PartialUser.__name__ == 'PartialUserModel'
+    assert PartialUser.model_partial_fields == {'id', 'name', 'created_at'}
+
+    obj = PartialUser(name='a-name')
+    assert obj.id is Missing
+    assert obj.model_dump() == {'name': 'a-name', 'nickname': None}
+
+    # The original model is unchanged.
+    with pytest.raises(ValidationError):
+        UserModel(name='a-name')
+
+
+def test_partial_of_options():
+    PartialUser = partial_of(UserModel, auto_partials_exclude={'id'})
+    assert PartialUser.model_partial_fields == {'name', 'created_at'}
+    with pytest.raises(ValidationError):
+        PartialUser()
+
+    OnlyName = partial_of(UserModel, fields=['name'])
+    assert OnlyName.model_partial_fields == {'name'}
+
+    NativeUser = partial_of(UserModel, missing_omission='native')
+    assert NativeUser(id=1).__dict__ == {'id': 1, 'nickname': None}
+
+    with pytest.raises(ValueError, match='not_a_field'):
+        partial_of(UserModel, fields=['name', 'not_a_field'])
+
+
+def test_partial_of_partial_models():
+    class AutoUser(AutoPartialModel, UserModel, auto_partials_exclude={'id'}):
+        pass
+
+    # Already an automatic partial, so it's the only base; the options still apply.
+    NativeUser = partial_of(AutoUser, missing_omission='native')
+    assert NativeUser.__bases__ == (AutoUser,)
+    assert NativeUser.model_partial_fields == {'name', 'created_at'}
+    assert NativeUser(id=1).__dict__ == {'id': 1, 'nickname': None}
+
+    # Like subclassing it, fields that are already partial stay partial.
+    assert partial_of(AutoUser, auto_partials_exclude={'name'}).model_partial_fields == {'name', 'created_at'}
+    assert partial_of(AutoUser)(id=1).model_dump() == {'id': 1, 'nickname': None}
+
+
+def test_partial_of_cached():
+    partial_of_cache.cache_clear()
+
+    PartialUser = partial_of(UserModel, auto_partials_exclude=['id'])
+    assert partial_of(UserModel, auto_partials_exclude={'id'}) is PartialUser
+    assert partial_of(UserModel, fields={'name', 'created_at', 'nickname'}) is PartialUser
+    assert partial_of(UserModel) is not PartialUser
+
+    info = partial_of_cache.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (2, 2, 2)
+
+
+def test_lru_cache():
+    cache: LRUCache[int] = LRUCache(maxsize=2)
+    assert cache.get_or_create('a', lambda: 1) == 1
+    assert cache.get_or_create('b', lambda: 2) == 2
+    assert cache.get_or_create('a', lambda: -1) == 1
+
+    # `b` is the least recently used, so it gets evicted.
+    assert cache.get_or_create('c', lambda: 3) == 3
+    assert 'b' not in cache
+    assert 'a' in cache
+
+    assert cache.cache_info() == (1, 3, 1, 2, 2)
+
+    cache.cache_clear()
+    assert cache.cache_info() == (0, 0, 0, 2, 0)
+
+    with pytest.raises(ValueError):
+        LRUCache(maxsize=0)
+
+
+def test_lru_cache_threads():
+    cache: LRUCache[object] = LRUCache()
+    created = []
+    results = []
+
+    def create():
+        created.append(1)
+        return object()
+
+    def worker():
+        results.append(cache.get_or_create('key', create))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(created) == 1
+    assert all(r is results[0] for r in results)
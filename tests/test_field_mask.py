@@ -0,0 +1,139 @@
+import pytest
+from pydantic import BaseModel, Field, computed_field
+
+from pydantic_partials import AutoPartialModel, Missing
+from pydantic_partials.mask import compile_mask, parse_mask
+
+
+class AddressModel(AutoPartialModel):
+    street: str
+    city: str
+
+
+class UserModel(AutoPartialModel):
+    id: int
+    name: str = Field(alias='userName')
+    address: AddressModel | None
+    previous: list[AddressModel]
+    tags: dict[str, AddressModel]
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def display(self) -> str:
+        return f'user {self.id}'
+
+
+def make_user(**kwargs) -> UserModel:
+    address = AddressModel(street='s', city='c')
+    values = {
+        'id': 1, 'userName': 'n', 'address': address, 'previous': [address, AddressModel(city='c2')],
+        'tags': {'home': address},
+    }
+    return UserModel(**{**values, **kwargs})
+
+
+def test_parse_mask():
+    assert parse_mask('id, address.city,address.street') == {'id': True, 'address': {'city': True, 'street': True}}
+    assert parse_mask(['address.city', 'address']) == {'address': True}
+    assert parse_mask(['address', 'address.city']) == {'address': True}
+    for invalid in ('id,', 'address..city', '.id'):
+        with pytest.raises(ValueError):
+            parse_mask(invalid)
+
+
+def test_model_dump_masked():
+    user = make_user()
+    assert user.model_dump_masked('id,address.city') == {'id': 1, 'address': {'city': 'c'}}
+    assert user.model_dump_masked(['name', 'address']) == {'name': 'n', 'address': {'street': 's', 'city': 'c'}}
+    assert user.model_dump_masked(['name'], by_alias=True) == {'userName': 'n'}
+    assert user.model_dump_masked('display') == {'display': 'user 1'}
+
+    # Paths into lists/dicts apply to each item.
+    assert user.model_dump_masked('previous.street,tags.city') == {
+        'previous': [{'street': 's'}, {}], 'tags': {'home': {'city': 'c'}},
+    }
+    assert user.model_dump_json_masked('id,previous.city') == '{"id":1,"previous":[{"city":"c"},{"city":"c2"}]}'
+
+    # Same as the `include` it stands for (without lists), and the model's own serialization is unchanged.
+    mask = 'id,address.street,tags'
+    assert user.model_dump_masked(mask) == user.model_dump(include=parse_mask(mask))
+    assert user.model_dump(exclude={'display'}) == user.model_dump(include=set(UserModel.model_fields))
+    assert user.address.model_dump() == {'street': 's', 'city': 'c'}
+
+
+def test_masked_missing_values_omitted():
+    user = make_user(address=AddressModel(street='s'))
+    user.id = Missing
+    assert user.model_dump_masked('id,name,address.city,address.street') == {'name': 'n', 'address': {'street': 's'}}
+    assert UserModel(address=None).model_dump_masked('id,address.city') == {'address': None}
+
+    class NativeModel(AutoPartialModel, missing_omission='native'):
+        id: int
+        address: AddressModel
+
+    obj = NativeModel(address={'city': 'c'})
+    assert obj.model_dump_masked('id,address') == {'address': {'city': 'c'}}
+    assert obj.model_dump_json_masked('id,address.street') == '{"address":{}}'
+
+
+def test_invalid_masks():
+    user = make_user()
+    for mask in ('unknown', 'address.unknown', 'id.value', 'display.value'):
+        with pytest.raises(ValueError, match='Field mask path'):
+            user.model_dump_masked(mask)
+
+
+def test_compiled_masks_cached():
+    class TestModel(AutoPartialModel):
+        id: int
+        address: AddressModel
+
+    serializer = compile_mask(TestModel, 'id,address.city')
+    assert compile_mask(TestModel, 'id,address.city') is serializer
+    assert compile_mask(TestModel, ['id', 'address.city']) is not serializer
+
+    # Subclasses and rebuilt classes get their own.
+    class SubModel(TestModel):
+        name: str
+
+    assert compile_mask(SubModel, 'id,address.city') is not serializer
+    assert SubModel(id=1, name='n').model_dump_masked('id,address.city') == {'id': 1}
+
+    TestModel.model_rebuild(force=True)
+    assert compile_mask(TestModel, 'id,address.city') is not serializer
+    assert TestModel(id=1, address={'city': 'c'}).model_dump_masked('address.city') == {'address': {'city': 'c'}}
+
+
+def test_masks_of_plain_nested_models():
+    class PlainModel(BaseModel):
+        a: int
+        b: int
+
+    class TestModel(AutoPartialModel):
+        plain: PlainModel
+
+    obj = TestModel(plain=PlainModel(a=1, b=2))
+    assert obj.model_dump_masked('plain.b') == {'plain': {'b': 2}}
+    assert PlainModel.__pydantic_complete__
+    assert obj.plain.model_dump() == {'a': 1, 'b': 2}
+
+
+def test_compiling_leaves_model_classes_complete(monkeypatch):
+    from pydantic_partials import mask
+
+    class TestModel(AutoPartialModel):
+        addr: AddressModel
+
+    # Other threads can be using the nested model classes while a mask is compiled.
+    seen_complete = []
+    schema_serializer = mask.SchemaSerializer
+
+    def recording_schema_serializer(*args, **kwargs):
+        seen_complete.append((TestModel.__pydantic_complete__, AddressModel.__pydantic_complete__))
+        return schema_serializer(*args, **kwargs)
+
+    monkeypatch.setattr(mask, 'SchemaSerializer', recording_schema_serializer)
+    obj = TestModel(addr=AddressModel(street='s', city='x'))
+    assert obj.model_dump_masked('addr.city') == {'addr': {'city': 'x'}}
+    assert seen_complete == [(True, True)]
+    assert 'street' in AddressModel.__pydantic_core_schema__['schema']['fields']
@@ -0,0 +1,109 @@
+import warnings
+
+import pytest
+from pydantic import BaseModel, model_validator
+from pydantic.json_schema import GenerateJsonSchema
+
+from pydantic_partials import AutoPartialModel, Missing, MissingType, PartialModel, Partial
+
+
+class AddressModel(AutoPartialModel):
+    street: str
+
+
+class UserModel(AutoPartialModel):
+    name: str
+    age: int | None
+    nickname: str | None = None
+    address: AddressModel
+
+
+USER_SCHEMA = {
+    '$defs': {
+        'AddressModel': {
+            'properties': {'street': {'title': 'Street', 'type': 'string'}},
+            'title': 'AddressModel',
+            'type': 'object',
+        },
+    },
+    'properties': {
+        'name': {'title': 'Name', 'type': 'string'},
+        'age': {'anyOf': [{'type': 'integer'}, {'type': 'null'}], 'title': 'Age'},
+        'nickname': {'anyOf': [{'type': 'string'}, {'type': 'null'}], 'default': None, 'title': 'Nickname'},
+        'address': {'$ref': '#/$defs/AddressModel', 'title': 'Address'},
+    },
+    'title': 'UserModel',
+    'type': 'object',
+}
+
+
+@pytest.mark.parametrize('mode', ['validation', 'serialization'])
+def test_partial_fields_are_optional_without_default(mode):
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        assert UserModel.model_json_schema(mode=mode) == USER_SCHEMA
+
+
+def test_partial_model_used_by_other_models():
+    class OrderModel(BaseModel):
+        user: UserModel
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        schema = OrderModel.model_json_schema()
+
+    assert schema['$defs']['UserModel'] == {k: v for k, v in USER_SCHEMA.items() if k != '$defs'}
+    assert schema['required'] == ['user']
+
+
+def test_missing_only_fields_and_model_validators():
+    class TestModel(PartialModel):
+        name: Partial[str]
+        only_missing: MissingType = Missing
+
+        @model_validator(mode='before')
+        @classmethod
+        def validate(cls, values):
+            return values
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        assert TestModel.model_json_schema() == {
+            'properties': {'name': {'title': 'Name', 'type': 'string'}},
+            'title': 'TestModel',
+            'type': 'object',
+        }
+
+
+def test_json_schema_cached_until_rebuilt():
+    generated = []
+
+    class CountingGenerateJsonSchema(GenerateJsonSchema):
+        def generate(self, schema, mode='validation'):
+            generated.append(mode)
+            return super().generate(schema, mode=mode)
+
+    class TestModel(AutoPartialModel):
+        name: str
+
+    schema = TestModel.model_json_schema(schema_generator=CountingGenerateJsonSchema)
+    assert TestModel.model_json_schema(schema_generator=CountingGenerateJsonSchema) == schema
+    assert generated == ['validation']
+
+    # A copy is returned each time.
+    schema['title'] = 'Changed'
+    assert TestModel.model_json_schema(schema_generator=CountingGenerateJsonSchema)['title'] == 'TestModel'
+
+    TestModel.model_json_schema(schema_generator=CountingGenerateJsonSchema, mode='serialization')
+    assert generated == ['validation', 'serialization']
+
+    TestModel.model_rebuild(force=True)
+    TestModel.model_json_schema(schema_generator=CountingGenerateJsonSchema)
+    assert generated == ['validation', 'serialization', 'validation']
+
+    # Subclasses have their own schema.
+    class SubModel(TestModel):
+        value: int
+
+    assert set(SubModel.model_json_schema()['properties']) == {'name', 'value'}
+    assert set(TestModel.model_json_schema()['properties']) == {'name'}
@@ -0,0 +1,198 @@
+import copy
+import pickle
+from typing import Annotated, Any
+
+import pytest
+from pydantic import BaseModel, Field, ValidationError, create_model, field_validator
+
+from pydantic_partials import AutoPartialModel, PartialModel, Partial, Missing
+from pydantic_partials.meta import _exclude_if_missing
+
+
+class NativeModel(AutoPartialModel, missing_omission='native', validate_assignment=True):
+    a: int
+    b: str
+    c: int | None = None
+
+
+def test_native_omission():
+    obj = NativeModel(a=1)
+
+    # `Missing` fields are not stored, but still read back as `Missing`.
+    assert obj.__dict__ == {'a': 1, 'c': None}
+    assert obj.b is Missing
+    assert obj.model_dump() == {'a': 1, 'c': None}
+    assert obj.model_dump_json() == '{"a":1,"c":null}'
+
+    obj.b = 'b-value'
+    assert obj.model_dump() == {'a': 1, 'b': 'b-value', 'c': None}
+
+    obj.b = Missing
+    assert obj.b is Missing
+    assert obj.__dict__ == {'a': 1, 'c': None}
+    assert obj.model_dump() == {'a': 1, 'c': None}
+
+    assert NativeModel.model_validate({'a': Missing}).model_dump() == {'c': None}
+    assert NativeModel.model_construct(b='b-value').model_dump() == {'b': 'b-value', 'c': None}
+    assert obj.model_copy(update={'a': Missing}).model_dump() == {'c': None}
+
+    with pytest.raises(ValidationError):
+        obj.c = Missing
+
+    with pytest.raises(AttributeError):
+        obj.not_a_field
+
+
+def test_native_omission_no_exclude_if():
+    class TestModel(NativeModel):
+        d: Partial[int]
+
+    for field in TestModel.model_fields.values():
+        assert field.exclude_if is None
+
+
+def test_native_omission_equality_and_copies():
+    obj = NativeModel(a=1)
+    assert obj == NativeModel(a=1, b=Missing)
+    assert obj != NativeModel(a=1, b='b-value')
+    assert pickle.loads(pickle.dumps(obj)) == obj
+    assert copy.deepcopy(obj) == obj
+
+
+def test_native_omission_inheritance():
+    def exclude_zero(v):
+        return v == 0
+
+    class TestModel(BaseModel):
+        a: int
+        b: Annotated[int, Field(exclude_if=exclude_zero)]
+
+    class PartialTestModel(AutoPartialModel, TestModel):
+        pass
+
+    seen_in_post_init = []
+
+    class NativeTestModel(PartialTestModel, missing_omission='native'):
+        def model_post_init(self, context, /):
+            seen_in_post_init.append(dict(self.__dict__))
+
+    class ExcludeIfTestModel(NativeTestModel, missing_omission='exclude_if'):
+        pass
+
+    # Our own `exclude_if` checks are removed, but the user's is kept.
+    assert NativeTestModel.model_fields['a'].exclude_if is None
+    assert NativeTestModel.model_fields['b'].exclude_if is exclude_zero
+
+    obj = NativeTestModel(b=0)
+    assert seen_in_post_init == [{'b': 0}]
+    assert obj.model_dump() == {}
+    assert NativeTestModel(b=1).model_dump() == {'b': 1}
+
+    assert ExcludeIfTestModel.model_fields['a'].exclude_if is _exclude_if_missing
+    obj = ExcludeIfTestModel(b=1)
+    assert obj.__dict__ == {'a': Missing, 'b': 1}
+    assert obj.model_dump() == {'b': 1}
+
+    # Assignments and `model_construct` follow the setting of each subclass.
+    obj.b = Missing
+    assert obj.__dict__ == {'a': Missing, 'b': Missing}
+    native_obj = NativeTestModel.model_construct({'b'}, b=1)
+    native_obj.b = Missing
+    assert native_obj.__dict__ == {}
+    assert native_obj.model_fields_set == {'b'}
+
+
+def test_invalid_missing_omission():
+    with pytest.raises(ValueError, match='missing_omission'):
+        class TestModel(PartialModel, missing_omission='other'):  # type: ignore
+            a: int
+
+
+def test_native_omission_only_stores_present_fields():
+    class TestModel(AutoPartialModel, missing_omission='native'):
+        a: int
+        b: str
+        c: int = 3
+        d: list[int] = Field(default_factory=list)
+        e: Annotated[int, Field(validate_default=True)]
+        z: int
+
+        @field_validator('e', mode='before')
+        @classmethod
+        def default_e(cls, v):
+            return 5 if v is Missing else v
+
+    # Present fields are kept in field order, regardless of the order they were given in.
+    obj = TestModel.model_validate({'z': 9, 'a': 1, 'b': Missing})
+    assert obj.__dict__ == {'a': 1, 'c': 3, 'd': [], 'e': 5, 'z': 9}
+    assert list(obj.__dict__) == ['a', 'c', 'd', 'e', 'z']
+    assert obj.b is Missing
+    assert obj.model_dump() == {'a': 1, 'c': 3, 'd': [], 'e': 5, 'z': 9}
+    assert obj == TestModel(a=1, z=9)
+    assert obj != TestModel(a=1, b='b', z=9)
+
+    # A given fields set doesn't need to include every given field.
+    obj = TestModel.model_construct({'a'}, a=1, b='b')
+    assert obj.__dict__ == {'a': 1, 'b': 'b', 'c': 3, 'd': []}
+    assert obj.model_fields_set == {'a'}
+    assert obj.model_dump(exclude_unset=True) == {'a': 1}
+
+
+def test_native_omission_wide_model():
+    fields: dict[str, Any] = {f'f{i}': (int, ...) for i in range(300)}
+    model = create_model(
+        'WideModel', __base__=AutoPartialModel, __cls_kwargs__={'missing_omission': 'native'}, **fields
+    )
+    obj = model(f7=7, f0=0, f299=299)
+    assert obj.__dict__ == {'f0': 0, 'f7': 7, 'f299': 299}
+    assert obj.f1 is Missing
+    assert obj.model_dump() == {'f0': 0, 'f7': 7, 'f299': 299}
+    assert obj.model_dump_json() == '{"f0":0,"f7":7,"f299":299}'
+    assert obj == model(f0=0, f7=7, f299=299)
+    assert obj != model(f0=0, f7=7)
+
+
+@pytest.mark.parametrize('validate_assignment', [False, True])
+def test_native_omission_keeps_field_order(validate_assignment):
+    class TestModel(AutoPartialModel, missing_omission='native', validate_assignment=validate_assignment):
+        a: int
+        b: int
+        c: int
+
+    obj = TestModel(c=3)
+    obj.a = 1
+    assert list(obj.__dict__) == ['a', 'c']
+    assert obj.model_dump_json() == '{"a":1,"c":3}'
+
+    TestModel(b=2).apply_to(obj)
+    assert list(obj.model_dump()) == ['a', 'b', 'c']
+    obj.b = Missing
+    TestModel(b=2).apply_to(obj, validate=True)
+    assert list(obj.model_dump()) == ['a', 'b', 'c']
+    assert list(TestModel(c=3).model_copy(update={'a': 1}).model_dump()) == ['a', 'c']
+
+
+def test_native_omission_in_union_warns():
+    # A known limit: pydantic-core expects every field in the `__dict__` to tell which member of a union it is.
+    class Inner(AutoPartialModel, missing_omission='native'):
+        a: int
+        b: int
+
+    class Outer(AutoPartialModel, missing_omission='native'):
+        inner: Inner | None
+
+    obj = Outer(inner=Inner(a=1))
+    with pytest.warns(UserWarning, match='Expected 2 fields but got 1'):
+        assert obj.model_dump() == {'inner': {'a': 1}}
+
+    # Not with all of its fields set, or with the default `missing_omission`.
+    Outer(inner=Inner(a=1, b=2)).model_dump()
+
+    class DefaultInner(AutoPartialModel):
+        a: int
+        b: int
+
+    class DefaultOuter(AutoPartialModel):
+        inner: DefaultInner | None
+
+    DefaultOuter(inner=DefaultInner(a=1)).model_dump()
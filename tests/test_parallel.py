@@ -0,0 +1,99 @@
+import json
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+from pydantic import ValidationError, field_validator
+from pydantic_core import PydanticCustomError
+
+from pydantic_partials import AutoPartialModel, Missing
+
+
+# Models are pickled by reference to the worker processes, so they need to be defined at module level.
+class Item(AutoPartialModel, track_dirty=True):
+    id: int
+    name: str
+
+    @field_validator('name')
+    @classmethod
+    def check_name(cls, value: str) -> str:
+        if value == 'invalid':
+            raise PydanticCustomError('invalid_name', 'Name {name} is not allowed', {'name': value})
+        return value
+
+
+class NativeItem(AutoPartialModel, missing_omission='native'):
+    id: int
+    name: str
+
+
+@pytest.fixture(scope='module')
+def executor():
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        yield pool
+
+
+def test_missing_pickled_as_singleton():
+    assert pickle.loads(pickle.dumps(Missing)) is Missing
+    assert b'Missing' in pickle.dumps(Missing)
+
+    item = Item(id=1)
+    item.id = 2
+    restored = pickle.loads(pickle.dumps(item))
+    assert restored.name is Missing
+    assert restored == item
+    assert restored.model_dirty_fields == {'id'}
+    assert restored.model_present_fields == {'id'}
+
+    native = pickle.loads(pickle.dumps(NativeItem(name='a')))
+    assert native.id is Missing
+    assert native.model_dump() == {'name': 'a'}
+
+
+def test_sharded_dicts_and_json(executor):
+    payloads = [{'id': i} if i % 2 else {'id': i, 'name': f'n{i}'} for i in range(25)]
+    items = Item.model_validate_sharded(payloads, executor=executor, shard_size=4)
+    assert [item.model_dump() for item in items] == payloads
+    assert all(type(item) is Item for item in items)
+    assert items[1].name is Missing
+
+    json_payloads = [json.dumps(p) if i % 3 else json.dumps(p).encode() for i, p in enumerate(payloads)]
+    assert Item.model_validate_sharded(json_payloads, executor=executor, shard_size=4) == items
+    assert Item.model_validate_sharded(json_payloads, executor=executor, shard_size=4, dump=True) == payloads
+
+    # Without an executor, a single shard is validated in this process.
+    assert NativeItem.model_validate_sharded(payloads[:3], dump=True) == payloads[:3]
+    assert Item.model_validate_sharded([]) == []
+
+
+def test_sharded_errors(executor):
+    payloads = [
+        {'id': 0}, b'{"id": 1}', {'id': 'x'}, b'{"id": 3', b'{"id": 4}, {"id": 5}', {'name': 'invalid'}, b'{}',
+    ]
+    results = Item.model_validate_sharded(payloads, executor=executor, shard_size=3, collect_errors=True)
+    assert [r.id for r in results if isinstance(r, Item)] == [0, 1, Missing]
+    assert [i for i, r in enumerate(results) if isinstance(r, ValidationError)] == [2, 3, 4, 5]
+    assert results[2].errors()[0]['loc'] == ('id', 'int')
+    assert results[3].errors()[0]['type'] == 'json_invalid'
+    assert results[5].errors(include_url=False) == [
+        {'type': 'invalid_name', 'loc': ('name',), 'msg': 'Name invalid is not allowed', 'input': 'invalid'}
+    ]
+    assert results[5].title == 'Item'
+
+    with pytest.raises(ValidationError) as exc_info:
+        Item.model_validate_sharded(payloads, executor=executor, shard_size=3)
+    assert exc_info.value.title == 'list[Item]'
+    assert sorted({e['loc'][0] for e in exc_info.value.errors()}) == [2, 3, 4, 5]
+
+    # Two JSON payloads in one would add an extra item to the JSON array of the shard.
+    first, second = Item.model_validate_sharded([b'{"id": 1}, {"id": 2}', b'{}'], collect_errors=True)
+    assert isinstance(first, ValidationError)
+    assert second == Item()
+
+    # JSON payloads are validated on their own, a payload can't run into the next one.
+    results = Item.model_validate_sharded([b'{"id":1,"name":"x', b'y"}', b'{"id":2}, {"id":3}'], collect_errors=True)
+    assert all(isinstance(r, ValidationError) for r in results)
+    assert [r.errors()[0]['type'] for r in results] == ['json_invalid'] * 3
+
+    with pytest.raises(ValueError, match='shard_size'):
+        Item.model_validate_sharded(payloads, shard_size=0)
@@ -0,0 +1,138 @@
+import pytest
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
+
+from pydantic_partials import partial_of, Missing, PartialModel, Partial
+
+
+class UserModel(BaseModel):
+    id: int = Field(frozen=True)
+    name: str
+    age: int
+    nickname: str | None = None
+
+
+PartialUser = partial_of(UserModel)
+
+
+def test_apply_to():
+    user = UserModel(id=1, name='a-name', age=3)
+
+    # The `nickname` is not set, so it's not applied (even though it has a default value that is not `Missing`).
+    patch = PartialUser(name='new-name', age=Missing)
+    assert patch.apply_to(user) is user
+    assert user == UserModel(id=1, name='new-name', age=3)
+    assert user.model_fields_set == {'id', 'name', 'age'}
+
+    copied = PartialUser(nickname='a-nickname').apply_to(user, copy=True)
+    assert copied == UserModel(id=1, name='new-name', age=3, nickname='a-nickname')
+    assert user.nickname is None
+
+    # Same result as the `model_dump` idiom.
+    patch = PartialUser(age=4, nickname=None)
+    assert patch.apply_to(user, copy=True) == user.model_copy(update=patch.model_dump(exclude_unset=True))
+
+    # Fields that are not on the target are ignored.
+    class OtherPatch(PartialModel):
+        name: Partial[str]
+        other: Partial[str]
+
+    assert OtherPatch(name='other-name', other='x').apply_to(user, copy=True).name == 'other-name'
+
+
+def test_apply_to_frozen():
+    user = UserModel(id=1, name='a-name', age=3)
+    with pytest.raises(ValidationError) as error_info:
+        PartialUser(id=2).apply_to(user)
+    assert error_info.value.errors()[0]['type'] == 'frozen_field'
+
+    # Like `model_copy`, copies are allowed to change frozen fields.
+    assert PartialUser(id=2).apply_to(user, copy=True).id == 2
+
+    class FrozenUserModel(UserModel):
+        model_config = ConfigDict(frozen=True)
+
+    frozen_user = FrozenUserModel(id=1, name='a-name', age=3)
+    with pytest.raises(ValidationError):
+        PartialUser(name='new-name').apply_to(frozen_user)
+    assert PartialUser(name='new-name').apply_to(frozen_user, copy=True).name == 'new-name'
+
+
+def test_apply_to_validate():
+    user = UserModel(id=1, name='a-name', age=3)
+
+    # Without validation, values are applied as-is (like `model_copy`).
+    assert PartialUser.model_construct(age='4').apply_to(user, copy=True).age == '4'
+    assert PartialUser.model_construct(age='4').apply_to(user, copy=True, validate=True).age == 4
+
+    with pytest.raises(ValidationError):
+        PartialUser.model_construct(name='new-name', age='bad').apply_to(user, validate=True)
+    assert user == UserModel(id=1, name='a-name', age=3)
+
+    assert PartialUser.model_construct(age='4').apply_to(user, validate=True) is user
+    assert user.age == 4
+
+
+def test_apply_many():
+    users = [UserModel(id=i, name=f'name-{i}', age=i) for i in range(3)]
+    patches = [PartialUser(age=10), PartialUser(), PartialUser(name='new-name')]
+
+    results = PartialUser.apply_many(patches, users, copy=True)
+    assert [(u.name, u.age) for u in results] == [('name-0', 10), ('name-1', 1), ('new-name', 2)]
+    assert users[0].age == 0
+
+    with pytest.raises(ValueError):
+        PartialUser.apply_many(patches, users[:2])
+
+
+class AddressModel(BaseModel):
+    street: str
+    city: str
+
+
+class PersonModel(BaseModel):
+    name: str
+    address: AddressModel
+    tags: list[str] = []
+
+
+def test_from_diff():
+    PartialPerson = partial_of(PersonModel)
+    old = PersonModel(name='a-name', address=AddressModel(street='a-street', city='a-city'), tags=['a'])
+
+    diff = PartialPerson.from_diff(old, old.model_copy(update={'tags': ['a', 'b']}))
+    assert diff.model_dump() == {'tags': ['a', 'b']}
+    assert diff.name is Missing
+
+    # Nested models are compared by value, not identity.
+    # Fields that can't be `Missing` always have the new value, but are not part of the `model_fields_set`.
+    new = old.model_copy(update={'address': AddressModel(street='a-street', city='a-city')})
+    assert PartialPerson.from_diff(old, new).model_dump() == {'tags': ['a']}
+    assert PartialPerson.from_diff(old, new).model_fields_set == set()
+
+    # Without deep partials, the whole nested model is included.
+    new = old.model_copy(update={'address': AddressModel(street='a-street', city='new-city')})
+    assert PartialPerson.from_diff(old, new).address == new.address
+
+    # With deep partials, only the changed nested fields are.
+    diff = partial_of(PersonModel, deep_partials=True).from_diff(old, new)
+    assert diff.model_dump(exclude_unset=True) == {'address': {'city': 'new-city'}}
+
+    # Fields that can't be `Missing` always have the new value.
+    diff = partial_of(PersonModel, auto_partials_exclude={'name'}).from_diff(old, new)
+    assert diff.model_dump(exclude_unset=True) == {'address': new.address.model_dump()}
+    assert diff.name == 'a-name'
+
+    # Applying the diff onto the old model gives the new one.
+    assert PartialPerson.from_diff(old, new).apply_to(old, copy=True) == new
+
+
+def test_from_diff_many():
+    PartialPerson = partial_of(PersonModel)
+    olds = [PersonModel(name=f'name-{i}', address={'street': 's', 'city': 'c'}) for i in range(3)]
+    news = [olds[0], olds[1].model_copy(update={'name': 'new-name'}), olds[2]]
+
+    diffs = PartialPerson.from_diff_many(olds, news)
+    assert [d.model_dump(exclude_unset=True) for d in diffs] == [{}, {'name': 'new-name'}, {}]
+
+    with pytest.raises(ValueError):
+        PartialPerson.from_diff_many(olds, news[:2])
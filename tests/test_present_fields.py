@@ -0,0 +1,128 @@
+import copy
+import pickle
+
+from pydantic import BaseModel
+
+from pydantic_partials import AutoPartialModel, PartialModel, Partial, Missing, partial_of
+
+
+class UserModel(BaseModel):
+    id: int
+    name: str
+    age: int
+    nickname: str | None = None
+
+
+def test_present_fields():
+    for missing_omission in ('exclude_if', 'native'):
+        PartialUser = partial_of(UserModel, missing_omission=missing_omission, auto_partials_exclude={'id'})
+        assert PartialUser.model_partial_field_index == ('name', 'age')
+
+        obj = PartialUser(id=1, age=3)
+        assert obj.model_present_fields == {'age'}
+        assert obj.model_present_mask == 0b10
+
+        # Kept up to date as fields are set.
+        obj.name = 'a-name'
+        assert obj.model_present_fields == {'name', 'age'}
+        obj.age = Missing
+        assert obj.model_present_fields == {'name'}
+        assert obj.model_present_mask == 0b01
+        obj.nickname = 'a-nickname'
+        assert obj.model_present_fields == {'name'}
+
+        # Copies work it out again.
+        assert obj.model_copy(update={'age': 4}).model_present_fields == {'name', 'age'}
+
+        # As does applying a patch onto a partial.
+        PartialUser(id=1, age=5).apply_to(obj)
+        assert obj.model_present_fields == {'name', 'age'}
+
+
+class PartialUserModel(AutoPartialModel, UserModel):
+    pass
+
+
+def test_present_fields_pickle():
+    obj = PartialUserModel(name='a-name')
+    assert obj.model_present_fields == {'name'}
+    assert pickle.loads(pickle.dumps(obj)).model_present_fields == {'name'}
+
+
+def test_model_fields_for_mask():
+    class TestModel(AutoPartialModel):
+        a: int
+        b: int
+        c: int
+
+    assert TestModel.model_fields_for_mask(0b101) == {'a', 'c'}
+    assert TestModel.model_fields_for_mask(0) == frozenset()
+    assert TestModel.model_fields_for_mask(TestModel(b=1).model_present_mask) == {'b'}
+
+    # Subclasses have their own index.
+    class SubModel(TestModel):
+        d: int
+
+    assert SubModel.model_partial_field_index == ('a', 'b', 'c', 'd')
+    assert SubModel(d=1).model_present_fields == {'d'}
+
+
+def test_present_fields_with_defaults():
+    class TestModel(PartialModel):
+        a: Partial[int] = 5
+        b: Partial[int]
+        c: int = 1
+
+    assert TestModel().model_present_fields == {'a'}
+    assert TestModel(a=Missing, b=2).model_present_fields == {'b'}
+    assert TestModel.model_construct(b=2).model_present_fields == {'a', 'b'}
+
+
+def test_present_fields_cached_per_class():
+    class TestModel(AutoPartialModel):
+        a: int
+        b: int
+
+    class SubModel(TestModel):
+        pass
+
+    # Assignments only keep the masks up to date once an object of the class has one cached.
+    obj = TestModel(a=1)
+    obj.b = 2
+    assert not TestModel.__partial_masks_cached__  # type: ignore[attr-defined]
+    assert obj.model_present_fields == {'a', 'b'}
+    assert TestModel.__partial_masks_cached__  # type: ignore[attr-defined]
+    assert not SubModel.__partial_masks_cached__  # type: ignore[attr-defined]
+    obj.a = Missing
+    assert obj.model_present_fields == {'b'}
+
+    other = TestModel()
+    other.a = 1
+    assert other.model_present_fields == {'a'}
+
+    # Calling `__init__` again replaces all of the values.
+    obj.__init__(a=3)  # type: ignore[misc]
+    assert obj.b is Missing
+    assert obj.model_present_fields == {'a'}
+    obj.__init__()  # type: ignore[misc]
+    assert obj.model_present_fields == frozenset()
+
+
+def test_present_fields_outside_fields_set():
+    class TestModel(AutoPartialModel, auto_partials_exclude={'id'}):
+        id: int
+        a: int
+        b: str
+
+    # The fields set can leave out fields that have a value, they are still present.
+    for obj in (
+            TestModel.model_construct(_fields_set={'id', 'a'}, id=1, a=1, b='x'),
+            TestModel.model_construct_trusted({'id': 1, 'a': 1, 'b': 'x'}, fields_set={'id', 'a'}),
+    ):
+        assert obj.model_fields_set == {'id', 'a'}
+        assert obj.model_present_fields == {'a', 'b'}
+        assert obj.model_copy().model_present_fields == {'a', 'b'}
+        assert copy.deepcopy(obj).model_present_fields == {'a', 'b'}
+
+    obj = TestModel.model_construct(_fields_set=set(), id=1, b='x')
+    assert obj.model_present_fields == {'b'}
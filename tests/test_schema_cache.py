@@ -0,0 +1,226 @@
+import importlib
+import os
+import sys
+import uuid
+
+import pytest
+
+from pydantic_partials import schema_cache
+
+MODELS_SOURCE = '''
+from typing import Annotated
+
+from pydantic import BaseModel, Field, field_validator, model_validator
+
+from pydantic_partials import AutoPartialModel, PartialModel, Partial, AutoPartialExclude
+
+
+class AddressModel(BaseModel):
+    street: str
+    tags: set[str] = {'a', 'b', 'c'}
+
+
+class UserModel(AutoPartialModel, auto_partials_exclude={'id'}):
+    id: int
+    name: Annotated[str, Field(alias='userName', min_length=2)]
+    address: AddressModel
+    age: {age_type}
+
+    @field_validator('name')
+    @classmethod
+    def strip_name(cls, v):
+        return v.strip()
+
+    @model_validator(mode='after')
+    def check(self):
+        return self
+
+
+class NativeUserModel(UserModel, missing_omission='native'):
+    nickname: Partial[str]
+
+
+class LambdaModel(AutoPartialModel):
+    value: Annotated[int, Field(exclude_if=lambda v: v == 0)]
+'''
+
+
+@pytest.fixture
+def cache_directory(tmp_path):
+    schema_cache.enable_schema_cache(tmp_path / 'cache')
+    try:
+        yield tmp_path / 'cache'
+    finally:
+        schema_cache.disable_schema_cache()
+
+
+@pytest.fixture
+def import_models(tmp_path, monkeypatch):
+    """ Imports the models from a new module each time, recording which classes were loaded from the cache. """
+    module_name = f'schema_cache_models_{uuid.uuid4().hex}'
+    path = tmp_path / f'{module_name}.py'
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    loaded = []
+    load_schema = schema_cache.load_schema
+
+    def recording_load_schema(cls, path):
+        result = load_schema(cls, path)
+        if result:
+            loaded.append(cls.__name__)
+        return result
+
+    monkeypatch.setattr(schema_cache, 'load_schema', recording_load_schema)
+
+    def do_import(age_type='int', mtime_ns=1_000_000_000):
+        path.write_text(MODELS_SOURCE.replace('{age_type}', age_type))
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+        sys.modules.pop(module_name, None)
+        importlib.invalidate_caches()
+        loaded.clear()
+        module = importlib.import_module(module_name)
+        return module, list(loaded)
+
+    yield do_import
+    sys.modules.pop(module_name, None)
+
+
+def check_models(module):
+    user = module.UserModel.model_validate({'id': 1, 'userName': ' a-name ', 'address': {'street': 's'}})
+    assert user.model_dump() == {'id': 1, 'name': 'a-name', 'address': {'street': 's', 'tags': {'a', 'b', 'c'}}}
+    assert module.UserModel(id=2).model_dump_json() == '{"id":2}'
+    with pytest.raises(ValueError):
+        module.UserModel(id=1, userName='a')
+
+    native = module.NativeUserModel(id=1, nickname='nick')
+    assert native.__dict__ == {'id': 1, 'nickname': 'nick'}
+    assert native.model_dump() == {'id': 1, 'nickname': 'nick'}
+    assert module.LambdaModel(value=0).model_dump() == {}
+    return (
+        module.UserModel.model_json_schema(),
+        module.NativeUserModel.model_json_schema(mode='serialization'),
+        str(module.UserModel.__signature__),
+    )
+
+
+def test_models_loaded_from_cache(cache_directory, import_models):
+    module, loaded = import_models()
+    assert loaded == []
+    expected = check_models(module)
+    cached_files = set(cache_directory.glob('*.schema'))
+    assert cached_files
+
+    module, loaded = import_models()
+    assert loaded == ['UserModel', 'NativeUserModel']
+    assert check_models(module) == expected
+    assert set(cache_directory.glob('*.schema')) == cached_files
+
+    # Classes using values that can't be pickled are not cached.
+    assert 'LambdaModel' not in loaded
+
+
+def test_stale_entries_not_used(cache_directory, import_models):
+    import_models()
+    module, loaded = import_models(age_type='str')
+    assert 'UserModel' not in loaded
+    assert module.UserModel(id=1, age='old').age == 'old'
+
+    # Even when only the source file changed (ie: a custom type defined in it).
+    import_models(mtime_ns=2_000_000_000)
+    module, loaded = import_models(mtime_ns=3_000_000_000)
+    assert loaded == []
+
+
+def test_broken_entries_fall_back_to_building(cache_directory, import_models):
+    import_models()
+    for path in cache_directory.glob('*.schema'):
+        path.write_bytes(b'not a pickle')
+
+    module, loaded = import_models()
+    assert loaded == []
+    check_models(module)
+
+    # The broken entries were replaced.
+    module, loaded = import_models()
+    assert 'UserModel' in loaded
+
+    schema_cache.clear_schema_cache()
+    assert list(cache_directory.glob('*.schema')) == []
+
+
+def test_cache_disabled_by_default(tmp_path, import_models):
+    assert schema_cache.schema_cache_directory() is None
+    module, loaded = import_models()
+    assert loaded == []
+    check_models(module)
+
+
+MARKERS_SOURCE = '''
+from pydantic_core import core_schema
+
+
+class Marker:
+    def __get_pydantic_core_schema__(self, source, handler):
+        return core_schema.no_info_after_validator_function({function}, handler(source))
+
+
+def convert(value):
+    return {function}(value)
+'''
+
+MARKED_MODELS_SOURCE = '''
+from typing import Annotated
+
+from pydantic import AfterValidator
+
+from pydantic_partials import AutoPartialModel
+
+from {markers} import Marker, convert
+
+
+class MarkerModel(AutoPartialModel):
+    name: Annotated[str, Marker()]
+
+
+class ValidatorModel(AutoPartialModel):
+    name: Annotated[str, AfterValidator(convert)]
+'''
+
+
+def test_stale_entries_with_external_metadata(cache_directory, tmp_path, monkeypatch):
+    # The models use metadata (a marker with `__get_pydantic_core_schema__`, and a validator function) from another
+    # module, which changes the schema when that module changes.
+    suffix = uuid.uuid4().hex
+    markers_name, models_name = f'schema_cache_markers_{suffix}', f'schema_cache_marked_{suffix}'
+    monkeypatch.syspath_prepend(str(tmp_path))
+    loaded = []
+    load_schema = schema_cache.load_schema
+    monkeypatch.setattr(schema_cache, 'load_schema', lambda cls, path: load_schema(cls, path) and loaded.append(cls))
+
+    def do_import(function, markers_mtime_ns):
+        for name, source, mtime_ns in (
+                (markers_name, MARKERS_SOURCE.replace('{function}', function), markers_mtime_ns),
+                (models_name, MARKED_MODELS_SOURCE.replace('{markers}', markers_name), 1_000_000_000),
+        ):
+            path = tmp_path / f'{name}.py'
+            path.write_text(source)
+            os.utime(path, ns=(mtime_ns, mtime_ns))
+            sys.modules.pop(name, None)
+        importlib.invalidate_caches()
+        loaded.clear()
+        return importlib.import_module(models_name)
+
+    try:
+        do_import('str.upper', 1_000_000_000)
+        module = do_import('str.upper', 1_000_000_000)
+        assert [cls.__name__ for cls in loaded] == ['MarkerModel', 'ValidatorModel']
+        assert module.MarkerModel(name='a').name == 'A'
+
+        # Only the markers module changed.
+        module = do_import('str.lower', 2_000_000_000)
+        assert loaded == []
+        assert module.MarkerModel(name='A').name == 'a'
+        assert module.ValidatorModel(name='A').name == 'a'
+    finally:
+        sys.modules.pop(markers_name, None)
+        sys.modules.pop(models_name, None)
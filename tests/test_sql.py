@@ -0,0 +1,144 @@
+import sqlite3
+
+import pytest
+
+from pydantic_partials import AutoPartialExclude, AutoPartialModel, Missing, PartialModel
+from pydantic_partials.sql import bulk_update_statements, quote_mysql, update_plan
+
+
+class UserPatch(AutoPartialModel):
+    id: AutoPartialExclude[int]
+    name: str
+    email: str
+    age: int
+
+
+def test_bulk_update_statements_grouped_by_present_fields():
+    patches = [
+        UserPatch(id=1, name='a'),
+        UserPatch(id=2, age=30, email='b@example.com'),
+        UserPatch(id=3, name='c'),
+        UserPatch(id=4),
+        UserPatch(id=5, email='e@example.com', age=50),
+    ]
+    updates = bulk_update_statements('users', patches)
+    assert updates[0].sql == 'UPDATE users SET "name" = ? WHERE "id" = ?'
+    assert updates[0].fields == ('name',)
+    assert updates[0].params == [('a', 1), ('c', 3)]
+    assert updates[1].sql == 'UPDATE users SET "email" = ?, "age" = ? WHERE "id" = ?'
+    assert updates[1].params == [('b@example.com', 30, 2), ('e@example.com', 50, 5)]
+    assert len(updates) == 2
+
+    assert bulk_update_statements('users', []) == []
+
+
+def test_bulk_update_of_constructed_patches():
+    # Fields with a value are updated, even when left out of the fields set.
+    patch = UserPatch.model_construct(_fields_set={'id', 'name'}, id=1, name='a', age=3)
+    assert [(u.fields, u.params) for u in bulk_update_statements('users', [patch])] == [
+        (('name', 'age'), [('a', 3, 1)]),
+    ]
+
+
+def test_bulk_updates_applied_with_sqlite():
+    connection = sqlite3.connect(':memory:')
+    connection.execute('CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, email TEXT, age INTEGER)')
+    connection.executemany('INSERT INTO users VALUES (?, ?, ?, ?)', [(i, f'n{i}', f'e{i}', i) for i in range(1, 5)])
+
+    patches = [UserPatch(id=1, name='new'), UserPatch(id=2, age=20), UserPatch(id=4, name='x', email='y', age=0)]
+    patches[2].email = Missing
+    for update in bulk_update_statements('users', patches):
+        connection.executemany(update.sql, update.params)
+
+    assert connection.execute('SELECT * FROM users ORDER BY id').fetchall() == [
+        (1, 'new', 'e1', 1), (2, 'n2', 'e2', 20), (3, 'n3', 'e3', 3), (4, 'x', 'e4', 0),
+    ]
+
+
+def test_updates_of_the_same_row_applied_in_order():
+    connection = sqlite3.connect(':memory:')
+    connection.execute('CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, email TEXT, age INTEGER)')
+    connection.executemany('INSERT INTO users VALUES (?, ?, ?, ?)', [(i, f'n{i}', f'e{i}', i) for i in range(1, 4)])
+
+    patches = [
+        UserPatch(id=1, name='a1'),
+        UserPatch(id=2, name='b1', age=20),
+        UserPatch(id=1, name='a2', age=10),
+        UserPatch(id=1, name='a3'),
+        UserPatch(id=3, name='c1'),
+        UserPatch(id=2, name='b2', age=21),
+    ]
+    updates = bulk_update_statements('users', patches)
+    # The third patch of row 1 comes after the second one (in another group), so it starts another statement.
+    assert [(u.fields, u.params) for u in updates] == [
+        (('name',), [('a1', 1)]),
+        (('name', 'age'), [('b1', 20, 2), ('a2', 10, 1), ('b2', 21, 2)]),
+        (('name',), [('a3', 1), ('c1', 3)]),
+    ]
+
+    for update in updates:
+        connection.executemany(update.sql, update.params)
+    assert connection.execute('SELECT * FROM users ORDER BY id').fetchall() == [
+        (1, 'a3', 'e1', 10), (2, 'b2', 'e2', 21), (3, 'c1', 'e3', 3),
+    ]
+
+
+@pytest.mark.parametrize('paramstyle, sql, row', [
+    ('format', 'UPDATE t SET "user name" = %s WHERE "id" = %s', ('a', 1)),
+    ('numeric', 'UPDATE t SET "user name" = :1 WHERE "id" = :2', ('a', 1)),
+    ('named', 'UPDATE t SET "user name" = :name WHERE "id" = :id', {'name': 'a', 'id': 1}),
+    ('pyformat', 'UPDATE t SET "user name" = %(name)s WHERE "id" = %(id)s', {'name': 'a', 'id': 1}),
+])
+def test_param_styles_and_columns(paramstyle, sql, row):
+    [update] = bulk_update_statements(
+        't', [UserPatch(id=1, name='a')], paramstyle=paramstyle, columns={'name': 'user name'}
+    )
+    assert update.sql == sql
+    assert update.params == [row]
+
+
+def test_composite_and_partial_keys():
+    class MembershipPatch(PartialModel):
+        user_id: int
+        group_id: int | None = None
+        role: str | None = None
+
+    class NativePatch(AutoPartialModel, missing_omission='native'):
+        id: int
+        name: str
+
+    [update] = bulk_update_statements('m', [MembershipPatch(user_id=1, role='admin')], key=('user_id', 'group_id'))
+    assert update.sql == 'UPDATE m SET "role" = ? WHERE "user_id" = ? AND "group_id" = ?'
+    assert update.params == [('admin', 1, None)]
+
+    [update] = bulk_update_statements('n', [NativePatch(id=1, name='a')])
+    assert update.params == [('a', 1)]
+    with pytest.raises(ValueError, match='key fields'):
+        bulk_update_statements('n', [NativePatch(name='a')])
+
+
+def test_identifier_quoting():
+    patches = [UserPatch(id=1, name='a')]
+    updates = bulk_update_statements(
+        'users', patches, paramstyle='format', columns={'name': 'user`name'}, quote=quote_mysql
+    )
+    assert updates[0].sql == 'UPDATE users SET `user``name` = %s WHERE `id` = %s'
+
+    updates = bulk_update_statements('users', patches, columns={'name': '[user name]'}, quote=str)
+    assert updates[0].sql == 'UPDATE users SET [user name] = ? WHERE id = ?'
+
+    assert update_plan(UserPatch, 'users', quote=quote_mysql) is not update_plan(UserPatch, 'users')
+
+
+def test_update_plans_cached_per_class():
+    plan = update_plan(UserPatch, 'users')
+    assert update_plan(UserPatch, 'users') is plan
+    assert update_plan(UserPatch, 'users', paramstyle='format') is not plan
+    assert plan.statement(UserPatch(id=1, age=1).model_present_mask) is plan.statement(
+        UserPatch(id=2, age=2).model_present_mask
+    )
+
+    with pytest.raises(ValueError):
+        update_plan(UserPatch, 'users', key='unknown')
+    with pytest.raises(ValueError):
+        update_plan(UserPatch, 'users', paramstyle='unknown')  # type: ignore[arg-type]
@@ -0,0 +1,111 @@
+import pytest
+from pydantic import BaseModel, Field
+
+from pydantic_partials import AutoPartialModel, Missing, stats
+from pydantic_partials.meta import _exclude_if_missing
+
+
+@pytest.fixture
+def enabled_stats():
+    stats.reset_stats()
+    stats.enable_stats()
+    yield
+    stats.disable_stats()
+    stats.reset_stats()
+
+
+def test_stats(enabled_stats):
+    class TestModel(AutoPartialModel):
+        a: int
+        b: str
+        c: int = 1
+
+    class NativeModel(TestModel, missing_omission='native'):
+        pass
+
+    class ExcludeIfModel(AutoPartialModel):
+        a: int = Field(exclude_if=lambda v: v == 0)
+
+    model_stats = stats.model_stats(TestModel)
+    assert model_stats is not None
+    assert model_stats.class_creations == 1
+    assert model_stats.class_creation_seconds > 0
+    assert model_stats.partial_fields == 2
+    assert model_stats.rebuilds == 1
+    assert model_stats.exclude_if_calls == 0
+
+    assert TestModel(a=1).model_dump() == {'a': 1, 'c': 1}
+    assert stats.model_stats(TestModel).exclude_if_calls == 2
+
+    # Native omission does not need the `exclude_if` check, the user's own `exclude_if` is still used.
+    assert NativeModel(a=1).model_dump() == {'a': 1, 'c': 1}
+    assert stats.model_stats(NativeModel).exclude_if_calls == 0
+    assert ExcludeIfModel(a=0).model_dump() == {}
+    assert ExcludeIfModel().model_dump() == {}
+    assert stats.model_stats(ExcludeIfModel).exclude_if_calls == 2
+
+    TestModel.model_rebuild(force=True)
+    model_stats = stats.model_stats(TestModel)
+    assert (model_stats.rebuilds, model_stats.forced_rebuilds) == (2, 1)
+    assert set(stats.all_model_stats()) >= {TestModel, NativeModel, ExcludeIfModel}
+
+    stats.reset_stats()
+    assert stats.model_stats(TestModel) is None
+
+
+def test_exclude_if_calls_only_counted_while_enabled(enabled_stats):
+    class TestModel(AutoPartialModel):
+        a: int
+
+    TestModel().model_dump()
+    assert stats.model_stats(TestModel).exclude_if_calls == 1
+
+    stats.disable_stats()
+    TestModel().model_dump()
+    assert stats.model_stats(TestModel).exclude_if_calls == 1
+
+    stats.enable_stats()
+    stats.reset_stats()
+    TestModel().model_dump()
+    assert stats.model_stats(TestModel).exclude_if_calls == 1
+
+
+def test_stats_deferred_build(enabled_stats):
+    class TestModel(AutoPartialModel, defer_build=True):
+        a: int
+
+    assert stats.model_stats(TestModel).rebuilds == 0
+    assert TestModel().a is Missing
+    assert stats.model_stats(TestModel).rebuilds == 1
+
+
+def test_stats_disabled():
+    stats.reset_stats()
+
+    class TestModel(AutoPartialModel):
+        a: int
+
+    assert stats.model_stats(TestModel) is None
+    assert TestModel.model_fields['a'].exclude_if is _exclude_if_missing
+
+
+def _rebuild_with_local_name():
+    class TestModel(AutoPartialModel):
+        other: 'OtherModel'
+
+    class OtherModel(BaseModel):
+        a: int
+
+    assert TestModel.model_rebuild() is True
+    assert TestModel(other={'a': 1}).other.a == 1
+
+
+def test_model_rebuild_resolves_local_names():
+    _rebuild_with_local_name()
+
+    stats.enable_stats()
+    try:
+        _rebuild_with_local_name()
+    finally:
+        stats.disable_stats()
+        stats.reset_stats()
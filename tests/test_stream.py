@@ -0,0 +1,138 @@
+import asyncio
+import io
+import json
+
+import pytest
+from pydantic import ValidationError
+
+from pydantic_partials import AutoPartialModel, Missing
+from pydantic_partials.stream import JsonArraySplitter, iter_ndjson_lines, batched
+
+
+class UserModel(AutoPartialModel):
+    id: int
+    name: str
+
+
+def test_iter_ndjson_lines():
+    data = b'{"id": 1}\n\n{"id": 2}\r\n  \n{"id": 3}'
+    expected = [b'{"id": 1}', b'{"id": 2}\r', b'{"id": 3}']
+
+    assert list(iter_ndjson_lines(io.BytesIO(data), chunk_size=4)) == expected
+    assert list(iter_ndjson_lines([data[i:i + 3] for i in range(0, len(data), 3)])) == expected
+    assert list(iter_ndjson_lines([b'{"id"', b'', b': 1}', b'\n'])) == [b'{"id": 1}']
+    assert list(iter_ndjson_lines([])) == []
+
+
+def test_batched():
+    assert list(batched(range(5), 2)) == [[0, 1], [2, 3], [4]]
+    with pytest.raises(ValueError):
+        batched(range(5), 0)
+
+
+def test_model_validate_ndjson():
+    data = b'{"id": 1}\n{"name": "a-name"}\n'
+    objs = list(UserModel.model_validate_ndjson(io.BytesIO(data)))
+    assert objs == [UserModel(id=1), UserModel(name='a-name')]
+    assert objs[0].name is Missing
+
+    # Lazy, the lines after an invalid one are not read until asked for.
+    results = UserModel.model_validate_ndjson(iter([b'{"id": 1}\n{"id": "bad"}\n', b'{"i']))
+    assert next(results) == UserModel(id=1)
+    with pytest.raises(ValidationError):
+        next(results)
+
+
+def test_model_validate_ndjson_options():
+    data = b'{"id": 1}\n{"id": "bad"}\n{"id": 3}\nnot-json\n{"id": 5}\n'
+
+    results = list(UserModel.model_validate_ndjson(io.BytesIO(data), collect_errors=True))
+    assert [r.id for r in results if not isinstance(r, ValidationError)] == [1, 3, 5]
+    assert [isinstance(r, ValidationError) for r in results] == [False, True, False, True, False]
+
+    batches = list(UserModel.model_validate_ndjson(io.BytesIO(data), collect_errors=True, batch_size=2))
+    assert [len(b) for b in batches] == [2, 2, 1]
+    assert batches[2] == [UserModel(id=5)]
+
+
+async def chunked(data: bytes, size: int):
+    for i in range(0, len(data), size):
+        yield data[i:i + size]
+
+
+def validate_stream(data: bytes, *, chunk_size: int = 3, **kwargs) -> list:
+    async def collect():
+        return [r async for r in UserModel.model_validate_json_stream(chunked(data, chunk_size), **kwargs)]
+    return asyncio.run(collect())
+
+
+def test_json_array_splitter():
+    data = b' [{"id": 1, "name": "a\\"],{"}, [2, {"x": []}] ,\n"\\\\", 3] '
+    expected = [b'{"id": 1, "name": "a\\"],{"}', b' [2, {"x": []}] ', b'\n"\\\\"', b' 3']
+    for size in (1, 2, 5, len(data)):
+        splitter = JsonArraySplitter()
+        items = [item for i in range(0, len(data), size) for item in splitter.feed(data[i:i + size])]
+        assert items + splitter.close() == expected
+
+    # Empty chunks, including right after a chunk ending in a backslash (inside a string).
+    splitter = JsonArraySplitter()
+    chunks = [b'[{"a": "x\\', b'', b'"y"}, ', b'', b'{"a": 1}]']
+    items = [item for chunk in chunks for item in splitter.feed(chunk)]
+    assert items + splitter.close() == [b'{"a": "x\\"y"}', b' {"a": 1}']
+
+    for invalid in (b'[1,]', b'[,1]', b'[1', b'[1] 2', b'{"id": 1}', b'1'):
+        splitter = JsonArraySplitter()
+        with pytest.raises(ValueError):
+            splitter.feed(invalid)
+            splitter.close()
+
+
+@pytest.mark.parametrize('offload_size', [1, 1024])
+@pytest.mark.parametrize('chunk_size', [1, 4, 1024])
+def test_model_validate_json_stream(offload_size, chunk_size):
+    values = [{'id': 1}, {'name': 'a-name'}, {'id': 3, 'name': 'x\\"]'}]
+    expected = [UserModel(**v) for v in values]
+    kwargs = {'chunk_size': chunk_size, 'offload_size': offload_size, 'max_concurrency': 2}
+
+    assert validate_stream(json.dumps(values).encode(), **kwargs) == expected
+    assert validate_stream(b'\n'.join(json.dumps(v).encode() for v in values), **kwargs) == expected
+    assert validate_stream(b'  \n [ ]', **kwargs) == []
+    assert validate_stream(b'', **kwargs) == []
+
+    data = b'[{"id": 1}, {"id": "bad"}, {"id": 3}, 4]'
+    results = validate_stream(data, collect_errors=True, **kwargs)
+    assert [isinstance(r, ValidationError) for r in results] == [False, True, False, True]
+    assert results[2] == UserModel(id=3)
+    with pytest.raises(ValidationError):
+        validate_stream(data, **kwargs)
+
+
+def test_model_validate_json_stream_options():
+    # An explicit format is not worked out from the data.
+    with pytest.raises(ValueError):
+        validate_stream(b'[{"id": 1}]', format='ndjson')
+    with pytest.raises(ValueError):
+        validate_stream(b'{"id": 1}', format='array')
+    with pytest.raises(ValueError):
+        validate_stream(b'[{"id": 1}', format='array')
+    with pytest.raises(ValueError):
+        UserModel.model_validate_json_stream(chunked(b'', 1), max_concurrency=0)
+
+
+def test_model_validate_json_stream_backpressure():
+    read = []
+
+    async def source():
+        for i in range(10):
+            read.append(i)
+            yield b'{"id": %d}\n' % i
+
+    async def consume():
+        results = UserModel.model_validate_json_stream(source(), offload_size=1, max_concurrency=3)
+        first = await results.__anext__()
+        # No more than `max_concurrency` items were read ahead of what was yielded.
+        assert len(read) <= 4
+        rest = [r async for r in results]
+        return [first, *rest]
+
+    assert [r.id for r in asyncio.run(consume())] == list(range(10))
@@ -0,0 +1,70 @@
+from datetime import datetime
+
+import pytest
+from pydantic import ValidationError
+
+from pydantic_partials import AutoPartialModel, Missing
+
+
+class UserModel(AutoPartialModel):
+    id: int
+    created_at: datetime
+
+
+def test_model_validate_many():
+    objs = UserModel.model_validate_many([{'id': 1}, {'created_at': '2020-01-02T03:04:05'}, {}])
+    assert objs == [
+        UserModel(id=1),
+        UserModel(created_at=datetime(2020, 1, 2, 3, 4, 5)),
+        UserModel(),
+    ]
+    assert objs[2].id is Missing
+
+    # Works with any iterable.
+    assert UserModel.model_validate_many({'id': i} for i in range(3)) == [UserModel(id=i) for i in range(3)]
+
+    with pytest.raises(ValidationError) as error_info:
+        UserModel.model_validate_many([{'id': 1}, {'id': 'bad'}])
+    assert {e['loc'][:2] for e in error_info.value.errors()} == {(1, 'id')}
+
+
+def test_model_validate_json_many():
+    objs = UserModel.model_validate_json_many(b'[{"id": 1}, {"created_at": "2020-01-02T03:04:05"}]', strict=True)
+    assert objs == [UserModel(id=1), UserModel(created_at=datetime(2020, 1, 2, 3, 4, 5))]
+
+    with pytest.raises(ValidationError):
+        UserModel.model_validate_json_many('[{"id": "bad"}]')
+
+
+def test_validate_many_collect_errors():
+    objs = UserModel.model_validate_many([{'id': 1}, {'id': 'bad'}, {'id': 3}], collect_errors=True)
+    assert objs[0] == UserModel(id=1)
+    assert objs[2] == UserModel(id=3)
+    assert isinstance(objs[1], ValidationError)
+    assert objs[1].title == 'UserModel'
+    assert {e['loc'][0] for e in objs[1].errors()} == {'id'}
+
+    obj = UserModel(id=1)
+    assert UserModel.model_validate_many([obj, {'id': 'bad'}], collect_errors=True)[0] is obj
+
+    # JSON items are still validated in JSON mode (strict mode allows a datetime string in JSON).
+    json_objs = UserModel.model_validate_json_many(
+        '[{"id": "bad"}, {"created_at": "2020-01-02T03:04:05"}]', strict=True, collect_errors=True
+    )
+    assert isinstance(json_objs[0], ValidationError)
+    assert json_objs[1] == UserModel(created_at=datetime(2020, 1, 2, 3, 4, 5))
+
+    # Invalid JSON, or JSON that is not an array, still raises.
+    with pytest.raises(ValidationError):
+        UserModel.model_validate_json_many('[{"id": 1}', collect_errors=True)
+    with pytest.raises(ValidationError):
+        UserModel.model_validate_json_many('{"id": 1}', collect_errors=True)
+
+
+def test_validate_many_subclass():
+    class SubModel(UserModel):
+        name: str
+
+    objs = SubModel.model_validate_many([{'name': 'a-name'}])
+    assert type(objs[0]) is SubModel
+    assert UserModel.model_validate_many([{}]) == [UserModel()]